@@ -1,4 +1,5 @@
 from .interface import (
+    configure_load_cache,
     copy_if_symlink_fails,
     copyfile,
     copyfile_from_local,
@@ -7,12 +8,17 @@ from .interface import (
     copytree_from_local,
     copytree_to_local,
     dump,
+    dump_many,
     exists,
     generate_presigned_url,
     get,
     get_file_backend,
     get_local_path,
+    get_many,
+    get_range,
+    get_ranges,
     get_text,
+    invalidate_load_cache,
     is_filepath,
     isdir,
     isfile,
@@ -20,14 +26,25 @@ from .interface import (
     list_dir,
     list_dir_or_file,
     load,
+    load_cache_stats,
+    load_many,
     put,
+    put_many,
     put_text,
     remove,
+    remove_many,
     rmtree,
     set_s3_backend,
+    single_flight_stats,
 )
 
+# ``easy_io.open`` is left out of ``__all__``, so that ``from easy_io import *`` keeps the builtin ``open``.
+from .interface import open as open  # noqa: A004
+from .prefetcher import Prefetcher
+
 __all__ = [
+    "Prefetcher",
+    "configure_load_cache",
     "copy_if_symlink_fails",
     "copyfile",
     "copyfile_from_local",
@@ -36,12 +53,17 @@ __all__ = [
     "copytree_from_local",
     "copytree_to_local",
     "dump",
+    "dump_many",
     "exists",
     "generate_presigned_url",
     "get",
     "get_file_backend",
     "get_local_path",
+    "get_many",
+    "get_range",
+    "get_ranges",
     "get_text",
+    "invalidate_load_cache",
     "is_filepath",
     "isdir",
     "isfile",
@@ -49,9 +71,14 @@ __all__ = [
     "list_dir",
     "list_dir_or_file",
     "load",
+    "load_cache_stats",
+    "load_many",
     "put",
+    "put_many",
     "put_text",
     "remove",
+    "remove_many",
     "rmtree",
     "set_s3_backend",
+    "single_flight_stats",
 ]
@@ -0,0 +1,524 @@
+"""Asyncio interface of easy_io.
+
+The coroutines mirror :mod:`easy_io.interface` and use the same backends
+and ``backend_args``. S3 is served natively by one aiobotocore client per
+event loop, with a connection pool sized for many concurrent requests; HTTP
+uses aiohttp; all other backends (local files, MSC) run their blocking calls
+in threads.
+
+Examples:
+    >>> from easy_io import aio
+    >>> async def main():
+    ...     data = await aio.aget('s3://bucket/file')
+    ...     objs = await asyncio.gather(*(aio.aload(f's3://bucket/{i}.json') for i in range(1000)))
+    ...     await aio.aclose()
+"""
+
+import asyncio
+import os
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import Executor
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from easy_io.backends import Boto3Backend, HTTPBackend
+from easy_io.backends.boto3_client import MAX_RETRIES
+from easy_io.handlers import file_handlers
+from easy_io.interface import _decode, _encode, _file_format, get_file_backend
+
+try:
+    # pyrefly: ignore  # import-error
+    import aioboto3
+
+    # pyrefly: ignore  # import-error
+    from aiobotocore.config import AioConfig
+    from botocore.exceptions import ClientError
+except ImportError:
+    aioboto3 = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+__all__ = [
+    "AsyncBackend",
+    "AsyncHTTPBackend",
+    "AsyncS3Backend",
+    "aclose",
+    "adump",
+    "aexists",
+    "aget",
+    "aget_text",
+    "alist_dir_or_file",
+    "aload",
+    "aput",
+    "aput_text",
+    "get_async_backend",
+]
+
+S3_MAX_CONNECTIONS = int(os.environ.get("EASY_IO_AIO_MAX_CONNECTIONS", "128"))
+RANGE_SIZE = 16 * 1024 * 1024  # objects above this are read with concurrent ranged GETs
+MULTIPART_SIZE = 64 * 1024 * 1024  # data above this is written with a multipart upload
+PART_CONCURRENCY = 16  # concurrent ranges or parts of one object
+LIST_BATCH = 1000  # entries a thread-offloaded listing fetches per hop
+
+Offload = Union[bool, Executor]
+
+
+class AsyncBackend:
+    """Runs the blocking calls of a backend in threads.
+
+    Args:
+        backend (BaseStorageBackend): The backend to wrap.
+    """
+
+    def __init__(self, backend: Any):
+        self.backend = backend
+
+    async def get(self, filepath: Union[str, Path]) -> bytes:
+        return await asyncio.to_thread(self.backend.get, filepath)
+
+    async def get_text(self, filepath: Union[str, Path], encoding: str = "utf-8") -> str:
+        return await asyncio.to_thread(self.backend.get_text, filepath, encoding)
+
+    async def put(self, obj: bytes, filepath: Union[str, Path]) -> None:
+        await asyncio.to_thread(self.backend.put, obj, filepath)
+
+    async def put_text(self, obj: str, filepath: Union[str, Path], encoding: str = "utf-8") -> None:
+        await asyncio.to_thread(self.backend.put_text, obj, filepath, encoding)
+
+    async def exists(self, filepath: Union[str, Path]) -> bool:
+        return await asyncio.to_thread(self.backend.exists, filepath)
+
+    async def list_dir_or_file(
+        self,
+        dir_path: Union[str, Path],
+        list_dir: bool = True,
+        list_file: bool = True,
+        suffix: Optional[Union[str, tuple[str]]] = None,
+        recursive: bool = False,
+    ) -> AsyncIterator[str]:
+        iterator = self.backend.list_dir_or_file(dir_path, list_dir, list_file, suffix, recursive)
+        while batch := await asyncio.to_thread(_next_batch, iterator, LIST_BATCH):
+            for path in batch:
+                yield path
+
+    async def aclose(self) -> None:
+        """Release the connections of the running event loop."""
+
+
+def _next_batch(iterator: Iterator[str], size: int) -> list[str]:
+    batch = []
+    for item in iterator:
+        batch.append(item)
+        if len(batch) == size:
+            break
+    return batch
+
+
+class AsyncS3Backend(AsyncBackend):
+    """Native asyncio access to S3 through aiobotocore.
+
+    Each event loop gets one client, created on first use, whose connection
+    pool holds ``max_connections`` connections. Objects above
+    ``RANGE_SIZE`` are read with concurrent ranged GETs into one buffer and
+    data above ``MULTIPART_SIZE`` is written with a concurrent multipart
+    upload. Path mapping, credentials and caches come from the wrapped
+    :class:`Boto3Backend`; while it has a disk cache, reads go through the
+    cache in threads instead.
+
+    Args:
+        backend (Boto3Backend): The backend to wrap.
+        max_connections (int): Size of the connection pool. Defaults to
+            ``EASY_IO_AIO_MAX_CONNECTIONS`` or 128.
+    """
+
+    def __init__(self, backend: Boto3Backend, max_connections: int = S3_MAX_CONNECTIONS):
+        super().__init__(backend)
+        self.max_connections = max_connections
+        self._clients: dict[asyncio.AbstractEventLoop, asyncio.Future] = {}
+
+    def _split(self, filepath: Union[str, Path]) -> tuple[str, str]:
+        path = self.backend._replace_prefix(self.backend._format_path(self.backend._map_path(filepath)))
+        bucket, _, key = path[len("s3://") :].partition("/")
+        return bucket, key
+
+    async def _create_client(self) -> Any:
+        config = AioConfig(
+            signature_version="s3v4",
+            s3={"addressing_style": "virtual"},
+            response_checksum_validation="when_required",
+            request_checksum_calculation="when_required",
+            max_pool_connections=self.max_connections,
+            retries={"max_attempts": MAX_RETRIES, "mode": "adaptive"},
+        )
+        session = aioboto3.Session()
+        # Closed by ``aclose``.
+        return await session.client("s3", config=config, **self.backend._client._s3_cred_info).__aenter__()
+
+    async def _client(self) -> Any:
+        loop = asyncio.get_running_loop()
+        if loop not in self._clients:
+            self._clients[loop] = loop.create_task(self._create_client())
+        try:
+            return await asyncio.shield(self._clients[loop])
+        except Exception:
+            self._clients.pop(loop, None)
+            raise
+
+    async def get(self, filepath: Union[str, Path]) -> bytes:
+        if self.backend.disk_cache is not None:
+            return await super().get(filepath)
+        bucket, key = self._split(filepath)
+        client = await self._client()
+        try:
+            response = await client.get_object(Bucket=bucket, Key=key, Range=f"bytes=0-{RANGE_SIZE - 1}")
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code in ("NoSuchKey", "404"):
+                raise FileNotFoundError(f"s3://{bucket}/{key}") from e
+            if code != "InvalidRange":
+                raise
+            # Empty objects reject any range.
+            response = await client.get_object(Bucket=bucket, Key=key)
+            async with response["Body"] as body:
+                return await body.read()
+        async with response["Body"] as body:
+            head = await body.read()
+        size = int(response["ContentRange"].rsplit("/", 1)[1])
+        if size <= len(head):
+            return head
+
+        buffer = bytearray(size)
+        buffer[: len(head)] = head
+        semaphore = asyncio.Semaphore(PART_CONCURRENCY)
+
+        async def read_range(start: int) -> None:
+            end = min(start + RANGE_SIZE, size)
+            async with semaphore:
+                part = await client.get_object(
+                    Bucket=bucket, Key=key, Range=f"bytes={start}-{end - 1}", IfMatch=response["ETag"]
+                )
+                async with part["Body"] as body:
+                    buffer[start:end] = await body.read()
+
+        await asyncio.gather(*(read_range(start) for start in range(len(head), size, RANGE_SIZE)))
+        return bytes(buffer)
+
+    async def get_text(self, filepath: Union[str, Path], encoding: str = "utf-8") -> str:
+        return (await self.get(filepath)).decode(encoding)
+
+    async def put(self, obj: Union[bytes, BytesIO], filepath: Union[str, Path]) -> None:
+        data = obj.getvalue() if isinstance(obj, BytesIO) else obj
+        bucket, key = self._split(filepath)
+        client = await self._client()
+        if len(data) <= MULTIPART_SIZE:
+            await client.put_object(Bucket=bucket, Key=key, Body=data)
+        else:
+            await self._put_multipart(client, bucket, key, memoryview(data))
+        self.backend._invalidate(f"s3://{bucket}/{key}")
+
+    async def _put_multipart(self, client: Any, bucket: str, key: str, data: memoryview) -> None:
+        upload_id = (await client.create_multipart_upload(Bucket=bucket, Key=key))["UploadId"]
+        semaphore = asyncio.Semaphore(PART_CONCURRENCY)
+
+        async def upload(number: int, start: int) -> dict:
+            async with semaphore:
+                part = data[start : start + MULTIPART_SIZE].tobytes()
+                response = await client.upload_part(
+                    Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=part
+                )
+            return {"PartNumber": number, "ETag": response["ETag"]}
+
+        try:
+            parts = await asyncio.gather(
+                *(upload(i + 1, start) for i, start in enumerate(range(0, len(data), MULTIPART_SIZE)))
+            )
+            await client.complete_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": list(parts)}
+            )
+        except BaseException:
+            await client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            raise
+
+    async def put_text(self, obj: str, filepath: Union[str, Path], encoding: str = "utf-8") -> None:
+        await self.put(obj.encode(encoding), filepath)
+
+    async def exists(self, filepath: Union[str, Path]) -> bool:
+        if self.backend.metadata_cache is not None:
+            return await super().exists(filepath)
+        bucket, key = self._split(filepath)
+        client = await self._client()
+        try:
+            await client.head_object(Bucket=bucket, Key=key)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey"):
+                raise
+        # A directory exists if any key is under it.
+        response = await client.list_objects_v2(Bucket=bucket, Prefix=key.rstrip("/") + "/", MaxKeys=1)
+        return response.get("KeyCount", 0) > 0
+
+    async def list_dir_or_file(  # noqa: C901
+        self,
+        dir_path: Union[str, Path],
+        list_dir: bool = True,
+        list_file: bool = True,
+        suffix: Optional[Union[str, tuple[str]]] = None,
+        recursive: bool = False,
+    ) -> AsyncIterator[str]:
+        if list_dir and suffix is not None:
+            raise TypeError("`list_dir` should be False when `suffix` is not None")
+        if (suffix is not None) and not isinstance(suffix, (str, tuple)):
+            raise TypeError("`suffix` must be a string or tuple of strings")
+        bucket, prefix = self._split(dir_path)
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        client = await self._client()
+        paginator = client.get_paginator("list_objects_v2")
+        kwargs = {"Bucket": bucket, "Prefix": prefix}
+        if not recursive:
+            kwargs["Delimiter"] = "/"
+
+        yielded_dirs = set()
+        async for page in paginator.paginate(**kwargs):
+            if list_dir:
+                for common in page.get("CommonPrefixes", []):
+                    yield common["Prefix"][len(prefix) :].rstrip("/")
+            for item in page.get("Contents", []):
+                rel_path = item["Key"][len(prefix) :]
+                if list_dir and recursive:
+                    parts = rel_path.split("/")[:-1]
+                    for i in range(1, len(parts) + 1):
+                        directory = "/".join(parts[:i])
+                        if directory not in yielded_dirs:
+                            yielded_dirs.add(directory)
+                            yield directory
+                if rel_path and list_file and (suffix is None or rel_path.endswith(suffix)):
+                    yield rel_path
+
+    async def aclose(self) -> None:
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await (await client).__aexit__(None, None, None)
+
+
+class AsyncHTTPBackend(AsyncBackend):
+    """Native asyncio access to HTTP(S) files through aiohttp.
+
+    Each event loop gets one ``aiohttp.ClientSession``. While the wrapped
+    :class:`HTTPBackend` has a disk cache, reads go through it in threads.
+
+    Args:
+        backend (HTTPBackend): The backend to wrap.
+    """
+
+    def __init__(self, backend: HTTPBackend):
+        super().__init__(backend)
+        self._sessions: dict[asyncio.AbstractEventLoop, Any] = {}
+
+    def _session(self) -> Any:
+        loop = asyncio.get_running_loop()
+        if loop not in self._sessions:
+            self._sessions[loop] = aiohttp.ClientSession()
+        return self._sessions[loop]
+
+    async def get(self, filepath: Union[str, Path]) -> bytes:
+        if self.backend.disk_cache is not None:
+            return await super().get(filepath)
+        self.backend._validate_url(str(filepath))
+        async with self._session().get(str(filepath)) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def get_text(self, filepath: Union[str, Path], encoding: str = "utf-8") -> str:
+        return (await self.get(filepath)).decode(encoding)
+
+    async def aclose(self) -> None:
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+
+_async_backends: dict[int, AsyncBackend] = {}
+
+
+def get_async_backend(
+    filepath: Union[str, Path, None] = None,
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+) -> AsyncBackend:
+    """Return the async wrapper of the backend :func:`easy_io.get_file_backend` picks.
+
+    Args:
+        filepath (str or Path, optional): Path to infer the backend from.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+
+    Returns:
+        AsyncBackend: :class:`AsyncS3Backend`, :class:`AsyncHTTPBackend` or
+        a thread-offloading :class:`AsyncBackend`.
+    """
+    backend = get_file_backend(filepath, backend_args=backend_args, enable_singleton=True, backend_key=backend_key)
+    wrapper = _async_backends.get(id(backend))
+    if wrapper is None or wrapper.backend is not backend:
+        if isinstance(backend, Boto3Backend) and aioboto3 is not None:
+            wrapper = AsyncS3Backend(backend)
+        elif isinstance(backend, HTTPBackend) and aiohttp is not None:
+            wrapper = AsyncHTTPBackend(backend)
+        else:
+            wrapper = AsyncBackend(backend)
+        _async_backends[id(backend)] = wrapper
+    return wrapper
+
+
+async def aclose() -> None:
+    """Close the S3 clients and HTTP sessions of the running event loop."""
+    for wrapper in list(_async_backends.values()):
+        await wrapper.aclose()
+
+
+async def _offload(offload: Offload, fn: Any, *args: Any) -> Any:
+    if offload is False:
+        return fn(*args)
+    if offload is True:
+        return await asyncio.to_thread(fn, *args)
+    return await asyncio.get_running_loop().run_in_executor(offload, fn, *args)
+
+
+async def aget(
+    filepath: Union[str, Path], backend_args: Optional[dict] = None, backend_key: Optional[str] = None
+) -> bytes:
+    """Async version of :func:`easy_io.get`."""
+    return await get_async_backend(filepath, backend_args, backend_key).get(filepath)
+
+
+async def aget_text(
+    filepath: Union[str, Path],
+    encoding: str = "utf-8",
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+) -> str:
+    """Async version of :func:`easy_io.get_text`."""
+    return await get_async_backend(filepath, backend_args, backend_key).get_text(filepath, encoding)
+
+
+async def aput(
+    obj: bytes, filepath: Union[str, Path], backend_args: Optional[dict] = None, backend_key: Optional[str] = None
+) -> None:
+    """Async version of :func:`easy_io.put`."""
+    await get_async_backend(filepath, backend_args, backend_key).put(obj, filepath)
+
+
+async def aput_text(
+    obj: str,
+    filepath: Union[str, Path],
+    encoding: str = "utf-8",
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+) -> None:
+    """Async version of :func:`easy_io.put_text`."""
+    await get_async_backend(filepath, backend_args, backend_key).put_text(obj, filepath, encoding)
+
+
+async def aexists(
+    filepath: Union[str, Path], backend_args: Optional[dict] = None, backend_key: Optional[str] = None
+) -> bool:
+    """Async version of :func:`easy_io.exists`."""
+    return await get_async_backend(filepath, backend_args, backend_key).exists(filepath)
+
+
+async def alist_dir_or_file(
+    dir_path: Union[str, Path],
+    list_dir: bool = True,
+    list_file: bool = True,
+    suffix: Optional[Union[str, tuple[str]]] = None,
+    recursive: bool = False,
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+) -> AsyncIterator[str]:
+    """Async version of :func:`easy_io.list_dir_or_file`.
+
+    Examples:
+        >>> async for path in alist_dir_or_file('s3://bucket/dir', list_dir=False, recursive=True):
+        ...     print(path)
+    """
+    backend = get_async_backend(dir_path, backend_args, backend_key)
+    async for path in backend.list_dir_or_file(dir_path, list_dir, list_file, suffix, recursive):
+        yield path
+
+
+async def aload(
+    file: Union[str, Path],
+    file_format: Optional[str] = None,
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+    offload: Offload = False,
+    **kwargs,
+) -> Any:
+    """Async version of :func:`easy_io.load`.
+
+    Args:
+        file (str or Path): Filename.
+        file_format (str, optional): Format of the file, inferred from the
+            extension if not given.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+        offload (bool or Executor): Where to decode the data: False decodes on
+            the event loop, True in a thread, an ``Executor`` (e.g. a process
+            pool for large pickles) in that executor. Defaults to False.
+        **kwargs: Arguments of the format handler.
+
+    Returns:
+        The content from the file.
+
+    Examples:
+        >>> config = await aload('s3://bucket/config.yaml')
+        >>> state = await aload('s3://bucket/model.pt', offload=True)
+    """
+    file_format = _file_format(file, file_format)
+    backend = get_async_backend(file, backend_args, backend_key)
+    if file_handlers[file_format].str_like:
+        data = await backend.get_text(file)
+    else:
+        data = await backend.get(file)
+    return await _offload(offload, _decode, file_format, data, kwargs)
+
+
+async def adump(
+    obj: Any,
+    file: Union[str, Path],
+    file_format: Optional[str] = None,
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+    offload: Offload = False,
+    **kwargs,
+) -> None:
+    """Async version of :func:`easy_io.dump`.
+
+    Args:
+        obj (any): The python object to be dumped.
+        file (str or Path): Filename.
+        file_format (str, optional): Format of the file, inferred from the
+            extension if not given.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+        offload (bool or Executor): Where to encode the object, as in
+            :func:`aload`. Defaults to False.
+        **kwargs: Arguments of the format handler.
+
+    Examples:
+        >>> await adump({'a': 1}, 's3://bucket/config.json')
+    """
+    file_format = _file_format(file, file_format)
+    backend = get_async_backend(file, backend_args, backend_key)
+    data = await _offload(offload, _encode, file_format, obj, kwargs)
+    if isinstance(data, str):
+        await backend.put_text(data, file)
+    else:
+        await backend.put(data, file)
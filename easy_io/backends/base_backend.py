@@ -1,6 +1,7 @@
 import os
 import os.path as osp
 from abc import ABCMeta, abstractmethod
+from collections.abc import Sequence
 
 
 def mkdir_or_exist(dir_name, mode=0o777):
@@ -14,6 +15,39 @@ def has_method(obj, method):
     return hasattr(obj, method) and callable(getattr(obj, method))
 
 
+def merge_ranges(ranges: Sequence[tuple[int, int]], max_gap: int = 0) -> list[tuple[int, int, list[int]]]:
+    """Merge ``(offset, length)`` byte ranges that overlap or are at most ``max_gap`` bytes apart.
+
+    Returns:
+        list[tuple[int, int, list[int]]]: ``(offset, length, indices)`` of
+        every merged range, where ``indices`` are the positions in ``ranges``
+        it covers.
+    """
+    spans: list[list] = []
+    for i in sorted(range(len(ranges)), key=lambda i: ranges[i][0]):
+        offset, length = ranges[i]
+        if offset < 0 or length < 0:
+            raise ValueError(f"Invalid range: offset={offset}, length={length}")
+        if spans and offset <= spans[-1][1] + max_gap:
+            spans[-1][1] = max(spans[-1][1], offset + length)
+            spans[-1][2].append(i)
+        else:
+            spans.append([offset, offset + length, [i]])
+    return [(start, end - start, indices) for start, end, indices in spans]
+
+
+def slice_ranges(
+    ranges: Sequence[tuple[int, int]], spans: list[tuple[int, int, list[int]]], data: Sequence[bytes]
+) -> list[bytes]:
+    """Cut the ``ranges`` out of the ``data`` read for the ``spans`` of :func:`merge_ranges`."""
+    results = [b""] * len(ranges)
+    for (start, _, indices), span_data in zip(spans, data):
+        for i in indices:
+            offset, length = ranges[i]
+            results[i] = span_data[offset - start : offset - start + length]
+    return results
+
+
 class BaseStorageBackend(metaclass=ABCMeta):
     """Abstract class of storage backends.
 
@@ -43,3 +77,18 @@ class BaseStorageBackend(metaclass=ABCMeta):
     @abstractmethod
     def get_text(self, filepath):
         pass
+
+    def get_range(self, filepath, offset: int, length: int) -> bytes:
+        """Read ``length`` bytes at ``offset``, fewer at the end of the file.
+
+        Backends override this with a ranged read; the default reads the
+        whole file.
+        """
+        if offset < 0 or length < 0:
+            raise ValueError(f"Invalid range: offset={offset}, length={length}")
+        return self.get(filepath)[offset : offset + length]
+
+    def get_ranges(self, filepath, ranges: Sequence[tuple[int, int]]) -> list[bytes]:
+        """Read several ``(offset, length)`` ranges, merging adjacent and overlapping ones into one read."""
+        spans = merge_ranges(ranges)
+        return slice_ranges(ranges, spans, [self.get_range(filepath, offset, length) for offset, length, _ in spans])
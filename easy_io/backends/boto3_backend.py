@@ -1,8 +1,10 @@
+import concurrent.futures
+import functools
 import io
 import os
 import re
 import tempfile
-from collections.abc import Generator, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from pathlib import Path
 from shutil import SameFileError
@@ -10,7 +12,19 @@ from typing import Optional, Union
 
 from easy_io import log
 from easy_io.backends.base_backend import BaseStorageBackend, has_method, mkdir_or_exist
-from easy_io.backends.boto3_client import Boto3Client
+from easy_io.backends.boto3_client import COPY_THREADS, Boto3Client, S3Writer
+from easy_io.backends.disk_cache import DiskCache
+from easy_io.backends.listing_snapshot import ListingSnapshot
+from easy_io.backends.metadata_cache import MetadataCache
+from easy_io.backends.tree_transfer import TreeTransfer
+from easy_io.buffers import SharedMemoryBuffer
+
+
+def _delete_error(error: str) -> Exception:
+    """Convert an error reported by :meth:`Boto3Client.delete_many` to an exception."""
+    if error.startswith("AccessDenied"):
+        return PermissionError(error)
+    return OSError(error)
 
 
 class Boto3Backend(BaseStorageBackend):
@@ -27,6 +41,48 @@ class Boto3Backend(BaseStorageBackend):
             ``filepath`` will be replaced by ``dst``. Defaults to None.
         s3_credential_path (str, optional): Config path of Boto3 client. Default: None.
             `New in version 0.3.3`.
+        transfer_processes (int): Number of worker processes kept alive for
+            :meth:`fast_get` and :meth:`fast_put`. The workers are started on
+            the first fast transfer. Defaults to 32.
+        resumable_uploads (bool): Whether multipart uploads of :meth:`fast_put`
+            are recorded in a local manifest so that a failed upload can be
+            resumed by the next ``fast_put`` to the same path, e.g. through
+            ``dump(..., fast_backend=True)``. Defaults to False.
+        tree_workers (int): Maximum number of concurrent file transfers of
+            :meth:`copytree_to_local` and :meth:`copytree_from_local`.
+            Defaults to 32.
+        tree_max_bytes_in_flight (int): Maximum total size of the files
+            these methods transfer at once. Defaults to 1 GB.
+        metadata_cache_ttl (float, optional): If set, answers of
+            :meth:`exists`, :meth:`isfile` and :meth:`isdir` are cached in
+            :attr:`metadata_cache` for this many seconds. Writes and deletes
+            through this backend invalidate them. Defaults to None.
+        metadata_cache_size (int): Maximum number of cached answers.
+            Defaults to 100000.
+        list_workers (int): Maximum number of concurrent listing requests of
+            recursive :meth:`list_dir_or_file`, :meth:`rmtree` and
+            :meth:`copytree_to_local`, which shard large prefixes by
+            sub-directory and key range. 1 lists page by page. Defaults to 16.
+        ordered_listing (bool): Whether :meth:`list_dir_or_file` keeps the
+            keys in sorted order when listing concurrently. Defaults to True.
+        listing_snapshot_ttl (float, optional): If set, :meth:`list_dir_or_file`
+            is served from a :class:`ListingSnapshot` of the directory saved
+            on local disk, as long as it is younger than this many seconds.
+            Meant for immutable datasets: writes are not reflected until the
+            snapshot expires. Defaults to None.
+        listing_snapshot_version (str, optional): If set, listing snapshots
+            are used while they were taken with this version, e.g. the
+            dataset release. Bump it to list anew. Defaults to None.
+        listing_snapshot_dir (str, optional): Directory of the listing
+            snapshots. Defaults to ``EASY_IO_LISTING_SNAPSHOT_DIR`` or
+            ``~/.cache/easy_io/listings``.
+        disk_cache_dir (str, optional): If set, :meth:`get` and
+            :meth:`get_local_path` read through a :class:`DiskCache` in this
+            directory, validated by ETag and size. Processes sharing the
+            directory download each object once, e.g. all ranks of a node
+            loading the same checkpoint. Defaults to None.
+        disk_cache_max_bytes (int): Size budget of the disk cache, the least
+            recently used files are evicted beyond it. Defaults to 64 GB.
 
     Examples:
         >>> backend = Boto3Backend()
@@ -40,8 +96,34 @@ class Boto3Backend(BaseStorageBackend):
         self,
         s3_credential_path: str = "",
         path_mapping: Optional[dict] = None,
+        transfer_processes: int = 32,
+        resumable_uploads: bool = False,
+        tree_workers: int = 32,
+        tree_max_bytes_in_flight: int = 1024 * 1024 * 1024,
+        metadata_cache_ttl: Optional[float] = None,
+        metadata_cache_size: int = 100_000,
+        list_workers: int = 16,
+        ordered_listing: bool = True,
+        listing_snapshot_ttl: Optional[float] = None,
+        listing_snapshot_version: Optional[str] = None,
+        listing_snapshot_dir: Optional[str] = None,
+        disk_cache_dir: Optional[str] = None,
+        disk_cache_max_bytes: int = 64 * 1024**3,
     ):
-        self._client = Boto3Client(s3_credential_path=s3_credential_path)
+        self._client = Boto3Client(s3_credential_path=s3_credential_path, transfer_processes=transfer_processes)
+        self.resumable_uploads = resumable_uploads
+        self.tree_transfer = TreeTransfer(max_workers=tree_workers, max_bytes_in_flight=tree_max_bytes_in_flight)
+        self.metadata_cache: Optional[MetadataCache] = None
+        if metadata_cache_ttl is not None:
+            self.metadata_cache = MetadataCache(ttl=metadata_cache_ttl, max_entries=metadata_cache_size)
+        self.list_workers = list_workers
+        self.ordered_listing = ordered_listing
+        self.listing_snapshot_ttl = listing_snapshot_ttl
+        self.listing_snapshot_version = listing_snapshot_version
+        self.listing_snapshot_dir = listing_snapshot_dir
+        self.disk_cache: Optional[DiskCache] = None
+        if disk_cache_dir is not None:
+            self.disk_cache = DiskCache(disk_cache_dir, max_bytes=disk_cache_max_bytes)
         assert isinstance(path_mapping, dict) or path_mapping is None
         self.path_mapping = path_mapping
         if path_mapping:
@@ -74,6 +156,29 @@ class Boto3Backend(BaseStorageBackend):
         """
         return re.sub(r"\\+", "/", filepath)
 
+    def _list_objects(self, root: str, ordered: bool = True) -> Iterator[tuple[str, int]]:
+        if self.list_workers > 1:
+            return self._client.list_parallel(root, num_threads=self.list_workers, ordered=ordered)
+        return self._client.list_objects(root)
+
+    def _contains(self, filepath: str) -> bool:
+        if self.metadata_cache is None:
+            return self._client.contains(filepath)
+        return self.metadata_cache.lookup("isfile", filepath, lambda: self._client.contains(filepath))
+
+    def _isdir(self, filepath: str) -> bool:
+        if self.metadata_cache is None:
+            return self._client.isdir(filepath)
+        return self.metadata_cache.lookup("isdir", filepath, lambda: self._client.isdir(filepath))
+
+    def _invalidate(self, filepath: str, tree: bool = False) -> None:
+        """Drop cached metadata of a mapped ``filepath`` after writing or deleting it."""
+        if self.metadata_cache is not None:
+            if tree:
+                self.metadata_cache.invalidate_tree(filepath)
+            else:
+                self.metadata_cache.invalidate(filepath)
+
     def _replace_prefix(self, filepath: Union[str, Path]) -> str:
         filepath = str(filepath)
         return filepath
@@ -82,6 +187,11 @@ class Boto3Backend(BaseStorageBackend):
     def get(self, filepath: Union[str, Path]) -> bytes:
         """Read bytes from a given ``filepath`` with 'rb' mode.
 
+        The download method is picked from the object size: a single request
+        for small objects, concurrent ranged requests on a thread pool for
+        mid-size ones and the process pool of :meth:`fast_get` for large ones
+        (see :meth:`Boto3Client.get_auto`).
+
         Args:
             filepath (str or Path): Path to read data.
 
@@ -97,23 +207,113 @@ class Boto3Backend(BaseStorageBackend):
         filepath = self._map_path(filepath)
         filepath = self._format_path(filepath)
         filepath = self._replace_prefix(filepath)
-        value = self._client.get(filepath)
-        return value
+        if self.disk_cache is None:
+            return self._client.get_auto(filepath)
+
+        stat = self._client.stat(filepath)
+        return self.disk_cache.fetch(filepath, stat["etag"], stat["size"], lambda: self._client.get_auto(filepath))
+
+    def stat(self, filepath: Union[str, Path]) -> dict:
+        """Return the size, ETag and modification time of a file.
+
+        Args:
+            filepath (str or Path): Path of the file.
+
+        Returns:
+            dict: ``size`` in bytes, ``etag`` and ``mtime`` as a POSIX timestamp.
+
+        Examples:
+            >>> backend = Boto3Backend()
+            >>> backend.stat('s3://path/of/file')
+            {'size': 11, 'etag': '5eb63bbbe01eeed093cb22bb8f5acdc3', 'mtime': 1760000000.0}
+        """
+        return self._client.stat(self._replace_prefix(self._format_path(self._map_path(filepath))))
+
+    def get_range(self, filepath: Union[str, Path], offset: int, length: int, etag: Optional[str] = None) -> bytes:
+        """Read ``length`` bytes at ``offset`` with a ranged GET, fewer at the end of the file.
+
+        With ``etag``, e.g. from :meth:`stat`, only that version of the file
+        is read and a ``ConnectionError`` is raised if it changed.
+
+        Examples:
+            >>> backend = Boto3Backend()
+            >>> backend.get_range('s3://path/of/file', 6, 5)
+            b'world'
+        """
+        return self._client.get_range(
+            self._replace_prefix(self._format_path(self._map_path(filepath))), offset, length, etag=etag
+        )
+
+    def get_ranges(self, filepath: Union[str, Path], ranges: Sequence[tuple[int, int]]) -> list[bytes]:
+        """Read several ``(offset, length)`` ranges with concurrent ranged GETs, see :meth:`Boto3Client.get_ranges`.
+
+        Examples:
+            >>> backend = Boto3Backend()
+            >>> backend.get_ranges('s3://path/of/file', [(0, 5), (6, 5)])
+            [b'hello', b'world']
+        """
+        return self._client.get_ranges(self._replace_prefix(self._format_path(self._map_path(filepath))), ranges)
 
-    def fast_get(self, filepath: Union[str, Path], num_processes: int = 32) -> bytes:
+    def fast_get(
+        self, filepath: Union[str, Path], num_processes: Optional[int] = None, zero_copy: bool = False
+    ) -> Union[bytes, SharedMemoryBuffer]:
         """Read bytes from a given ``filepath`` with multiple processes and async
 
         Args:
             filepath (str or Path): Path to read data.
-            num_processes (int): Number of processes to read data. Defaults to 8.
+            num_processes (int, optional): Number of tasks the download is split
+                into. Defaults to ``transfer_processes``.
+            zero_copy (bool): Return a :class:`SharedMemoryBuffer` over the
+                downloaded data instead of copying it into ``bytes``. The
+                buffer should be released by the caller. Defaults to False.
+
+        Examples:
+            >>> backend = Boto3Backend()
+            >>> with backend.fast_get('s3://path/of/file', zero_copy=True) as buffer:
+            ...     array = np.frombuffer(buffer.view, dtype=np.uint8)
         """
-        assert num_processes > 1
+        assert num_processes is None or num_processes > 1
         filepath = self._map_path(filepath)
         filepath = self._format_path(filepath)
         filepath = self._replace_prefix(filepath)
-        value = self._client.fast_get(filepath, num_processes=num_processes)
+        value = self._client.fast_get(filepath, num_processes=num_processes, zero_copy=zero_copy)
         return value
 
+    def fast_get_to_file(
+        self, filepath: Union[str, Path], local_path: Union[str, Path], num_processes: Optional[int] = None
+    ) -> None:
+        """Download ``filepath`` into ``local_path`` with multiple processes and async.
+
+        Every part is written straight into its byte range of the pre-sized
+        destination, so objects larger than the available RAM can be fetched.
+
+        Args:
+            filepath (str or Path): Path to read data.
+            local_path (str or Path): Local destination, replaced if it exists.
+            num_processes (int, optional): Number of tasks the download is split
+                into. Defaults to ``transfer_processes``.
+
+        Examples:
+            >>> backend = Boto3Backend()
+            >>> backend.fast_get_to_file('s3://path/of/file', '/tmp/file')
+        """
+        assert num_processes is None or num_processes > 1
+        filepath = self._map_path(filepath)
+        filepath = self._format_path(filepath)
+        filepath = self._replace_prefix(filepath)
+        self._client.fast_get_to_file(filepath, str(local_path), num_processes=num_processes)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes kept alive for fast transfers.
+
+        They are started again on the next :meth:`fast_get` or :meth:`fast_put`.
+
+        Examples:
+            >>> backend = Boto3Backend()
+            >>> backend.shutdown()
+        """
+        self._client.shutdown()
+
     def get_text(
         self,
         filepath: Union[str, Path],
@@ -153,14 +353,49 @@ class Boto3Backend(BaseStorageBackend):
         filepath = self._format_path(filepath)
         filepath = self._replace_prefix(filepath)
         self._client.put(obj, filepath)
+        self._invalidate(filepath)
 
-    def fast_put(self, obj: Union[bytes, io.BytesIO], filepath: Union[str, Path], num_processes: int = 32) -> None:
-        """Write bytes to a given ``filepath`` with multiple processes and async"""
-        assert num_processes > 1
+    def fast_put(
+        self,
+        obj: Union[bytes, io.BytesIO, str, Path],
+        filepath: Union[str, Path],
+        num_processes: Optional[int] = None,
+        resumable: Optional[bool] = None,
+    ) -> None:
+        """Write bytes or a local file to a given ``filepath`` with multiple processes and async.
+
+        ``resumable`` defaults to :attr:`resumable_uploads`, see
+        :meth:`Boto3Client.fast_put`.
+        """
+        assert num_processes is None or num_processes > 1
         filepath = self._map_path(filepath)
         filepath = self._format_path(filepath)
         filepath = self._replace_prefix(filepath)
-        self._client.fast_put(obj, filepath, num_processes=num_processes)
+        if resumable is None:
+            resumable = self.resumable_uploads
+        self._client.fast_put(obj, filepath, num_processes=num_processes, resumable=resumable)
+        self._invalidate(filepath)
+
+    def open_write(self, filepath: Union[str, Path], **kwargs) -> S3Writer:
+        """Open ``filepath`` for streaming writes with a multipart upload.
+
+        Parts are uploaded in the background while the caller writes, see
+        :class:`S3Writer`. The object is created when the file object is
+        closed, and not at all if the ``with`` block raises.
+
+        Args:
+            filepath (str or Path): Path to write data.
+            **kwargs: Arguments of :class:`S3Writer`, e.g. ``part_size``.
+
+        Examples:
+            >>> backend = Boto3Backend()
+            >>> with backend.open_write('s3://path/of/file') as f:
+            ...     torch.save(state_dict, f)
+        """
+        filepath = self._map_path(filepath)
+        filepath = self._format_path(filepath)
+        filepath = self._replace_prefix(filepath)
+        return self._client.open_write(filepath, on_complete=lambda: self._invalidate(filepath), **kwargs)
 
     def put_text(
         self,
@@ -208,7 +443,7 @@ class Boto3Backend(BaseStorageBackend):
         filepath = self._map_path(filepath)
         filepath = self._format_path(filepath)
         filepath = self._replace_prefix(filepath)
-        return self._client.contains(filepath) or self._client.isdir(filepath)
+        return self._contains(filepath) or self._isdir(filepath)
 
     def isdir(self, filepath: Union[str, Path]) -> bool:
         """Check whether a file path is a directory.
@@ -237,7 +472,7 @@ class Boto3Backend(BaseStorageBackend):
         filepath = self._map_path(filepath)
         filepath = self._format_path(filepath)
         filepath = self._replace_prefix(filepath)
-        return self._client.isdir(filepath)
+        return self._isdir(filepath)
 
     def isfile(self, filepath: Union[str, Path]) -> bool:
         """Check whether a file path is a file.
@@ -265,7 +500,7 @@ class Boto3Backend(BaseStorageBackend):
         filepath = self._map_path(filepath)
         filepath = self._format_path(filepath)
         filepath = self._replace_prefix(filepath)
-        return self._client.contains(filepath)
+        return self._contains(filepath)
 
     def join_path(
         self,
@@ -313,6 +548,10 @@ class Boto3Backend(BaseStorageBackend):
         can be called with ``with`` statement, and when exists from the
         ``with`` statement, the temporary path will be released.
 
+        With a disk cache, the path of the cached file is yielded instead and
+        kept after the ``with`` statement; it must not be modified. No process
+        evicts it while the ``with`` statement runs.
+
         Args:
             filepath (str or Path): Download a file from ``filepath``.
 
@@ -327,12 +566,25 @@ class Boto3Backend(BaseStorageBackend):
             >>> with backend.get_local_path(filepath) as path:
             ...     # do something here
         """
+        if self.disk_cache is not None:
+            # The cached file itself is yielded, it must not be modified.
+            path = self._replace_prefix(self._format_path(self._map_path(filepath)))
+            stat = self._client.stat(path)
+            with self.disk_cache.pin_file(
+                path,
+                stat["etag"],
+                stat["size"],
+                lambda tmp_path: self._client.fast_get_to_file(path, tmp_path, size=stat["size"]),
+            ) as cached_path:
+                yield cached_path
+            return
+
         assert self.isfile(filepath)
         temp_path = None
         try:
             with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                temp_file.write(self.get(filepath))
                 temp_path = temp_file.name
+            self.fast_get_to_file(filepath, temp_path)
             if temp_path is None:
                 raise RuntimeError("Failed to create temporary file for S3 object")
             yield temp_path
@@ -383,7 +635,9 @@ class Boto3Backend(BaseStorageBackend):
         if src == dst:
             raise SameFileError("src and dst should not be same")
 
-        self.put(self.get(src), dst)
+        # Server-side copy, the data never leaves S3.
+        self._client.copy(self._replace_prefix(src), self._replace_prefix(dst))
+        self._invalidate(self._replace_prefix(dst))
         return dst
 
     def copytree(
@@ -394,7 +648,8 @@ class Boto3Backend(BaseStorageBackend):
         """Recursively copy an entire directory tree rooted at src to a
         directory named dst and return the destination directory.
 
-        src and dst should have the same prefix.
+        src and dst should have the same prefix. The objects are copied
+        server-side, ``COPY_THREADS`` at a time.
 
         Args:
             src (str or Path): A directory to be copied.
@@ -422,10 +677,29 @@ class Boto3Backend(BaseStorageBackend):
         if self.exists(dst):
             raise FileExistsError("dst should not exist")
 
-        for path in self.list_dir_or_file(src, list_dir=False, recursive=True):
-            src_path = self.join_path(src, path)
-            dst_path = self.join_path(dst, path)
-            self.put(self.get(src_path), dst_path)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=COPY_THREADS) as executor:
+            pending: set[concurrent.futures.Future] = set()
+            try:
+                # Copies overlap with the listing; bound the queued ones, the prefix may hold millions of keys.
+                for path in self.list_dir_or_file(src, list_dir=False, recursive=True):
+                    while len(pending) >= 2 * COPY_THREADS:
+                        done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    pending.add(
+                        executor.submit(
+                            self._client.copy,
+                            self._replace_prefix(self.join_path(src, path)),
+                            self._replace_prefix(self.join_path(dst, path)),
+                        )
+                    )
+                for future in concurrent.futures.as_completed(pending):
+                    future.result()
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+            finally:
+                self._invalidate(self._replace_prefix(dst), tree=True)
 
         return dst
 
@@ -463,8 +737,10 @@ class Boto3Backend(BaseStorageBackend):
         if self.isdir(dst):
             dst = self.join_path(dst, os.path.basename(src))
 
-        with open(src, "rb") as f:
-            self.put(f.read(), dst)
+        # Large files are uploaded in parts that the transfer workers read
+        # from ``src`` themselves, so the file is never loaded into memory.
+        self._client.fast_put(str(src), self._replace_prefix(dst), resumable=self.resumable_uploads)
+        self._invalidate(self._replace_prefix(dst))
 
         return dst
 
@@ -476,6 +752,9 @@ class Boto3Backend(BaseStorageBackend):
         """Recursively copy an entire directory tree rooted at src to a
         directory named dst and return the destination directory.
 
+        The files are uploaded concurrently by :attr:`tree_transfer` while
+        the directory is still being walked.
+
         Args:
             src (str or Path): A local directory to be copied.
             dst (str or Path): Copy directory to dst.
@@ -500,12 +779,20 @@ class Boto3Backend(BaseStorageBackend):
 
         src = str(src)
 
-        for cur_dir, _, files in os.walk(src):
-            for f in files:
-                src_path = os.path.join(cur_dir, f)
-                dst_path = self.join_path(dst, src_path.replace(src, ""))
-                self.copyfile_from_local(src_path, dst_path)
+        def tasks() -> Iterator[tuple[Callable[[], None], int]]:
+            for cur_dir, _, files in os.walk(src):
+                for f in files:
+                    src_path = os.path.join(cur_dir, f)
+                    dst_path = self._replace_prefix(self.join_path(dst, src_path.replace(src, "")))
+                    upload = functools.partial(
+                        self._client.fast_put, src_path, dst_path, resumable=self.resumable_uploads
+                    )
+                    yield upload, os.path.getsize(src_path)
 
+        try:
+            self.tree_transfer.run(tasks())
+        finally:
+            self._invalidate(self._replace_prefix(dst), tree=True)
         return dst
 
     def copyfile_to_local(
@@ -556,9 +843,7 @@ class Boto3Backend(BaseStorageBackend):
         os.makedirs(parent_dir, exist_ok=True)
 
         try:
-            with open(dst, "wb") as f:
-                data = self.fast_get(src)
-                f.write(data)
+            self.fast_get_to_file(src, dst)
         except Exception as e:
             log.error(f"Failed to write file: {e}")
             raise
@@ -573,6 +858,9 @@ class Boto3Backend(BaseStorageBackend):
         """Recursively copy an entire directory tree rooted at src to a local
         directory named dst and return the destination directory.
 
+        The files are downloaded concurrently by :attr:`tree_transfer`,
+        starting as soon as the first listing page arrives.
+
         Args:
             src (str or Path): A directory to be copied.
             dst (str or Path): Copy directory to local dst.
@@ -589,12 +877,20 @@ class Boto3Backend(BaseStorageBackend):
             >>> backend.copytree_to_local(src, dst)
             'path/of/your/dir'
         """
-        for path in self.list_dir_or_file(src, list_dir=False, recursive=True):
+        root = self._replace_prefix(self._format_path(self._map_path(src)))
+        if not root.endswith("/"):
+            root += "/"
+
+        def download(path: str, size: int) -> None:
             dst_path = os.path.join(dst, path)
             mkdir_or_exist(os.path.dirname(dst_path))
-            with open(dst_path, "wb") as f:
-                f.write(self.get(self.join_path(src, path)))
+            self._client.fast_get_to_file(root + path, dst_path, size=size)
 
+        self.tree_transfer.run(
+            (functools.partial(download, path, size), size)
+            for path, size in self._list_objects(root, ordered=False)
+            if not path.endswith("/")
+        )
         return dst
 
     def remove(self, filepath: Union[str, Path]) -> None:
@@ -632,21 +928,62 @@ class Boto3Backend(BaseStorageBackend):
         filepath = self._format_path(filepath)
         filepath = self._replace_prefix(filepath)
         self._client.delete(filepath)
+        self._invalidate(filepath)
+
+    def remove_many(self, filepaths: Iterable[Union[str, Path]]) -> dict[str, Exception]:
+        """Remove many files with batched requests.
+
+        Unlike :meth:`remove`, the paths are not checked first and missing
+        files are ignored.
+
+        Args:
+            filepaths (Iterable[str or Path]): Paths to be removed.
+
+        Returns:
+            dict[str, Exception]: The error of every path that could not be
+            removed.
+
+        Examples:
+            >>> backend = Boto3Backend()
+            >>> backend.remove_many(['s3://path/of/file1', 's3://path/of/file2'])
+            {}
+        """
+        originals = {}
+        for filepath in filepaths:
+            originals[self._replace_prefix(self._format_path(self._map_path(filepath)))] = str(filepath)
+        errors = self._client.delete_many(originals)
+        for filepath in originals:
+            self._invalidate(filepath)
+        return {originals[path]: _delete_error(error) for path, error in errors.items()}
 
     def rmtree(self, dir_path: Union[str, Path]) -> None:
         """Recursively delete a directory tree.
 
+        The listing is streamed into batched delete requests.
+
         Args:
             dir_path (str or Path): A directory to be removed.
 
+        Raises:
+            OSError: If some files could not be removed.
+
         Examples:
             >>> backend = Boto3Backend()
             >>> dir_path = 's3://path/of/dir'
             >>> backend.rmtree(dir_path)
         """
-        for path in self.list_dir_or_file(dir_path, list_dir=False, recursive=True):
-            filepath = self.join_path(dir_path, path)
-            self.remove(filepath)
+        root = self._replace_prefix(self._format_path(self._map_path(dir_path)))
+        if not root.endswith("/"):
+            root += "/"
+        try:
+            # Always list live, a listing snapshot may miss recent files.
+            errors = self._client.delete_many(root + path for path, _ in self._list_objects(root, ordered=False))
+        finally:
+            self._invalidate(root, tree=True)
+        if errors:
+            for path, error in list(errors.items())[:10]:
+                log.error(f"Failed to remove {path}: {error}", rank0_only=False)
+            raise OSError(f"Failed to remove {len(errors)} files under {dir_path}")
 
     def copy_if_symlink_fails(
         self,
@@ -786,7 +1123,13 @@ class Boto3Backend(BaseStorageBackend):
             # Keep track of directories we've already yielded to avoid duplicates
             yielded_dirs = set() if list_dir else None
 
-            for path in self._client.list(dir_path):
+            if self.listing_snapshot_ttl is not None or self.listing_snapshot_version is not None:
+                # Suffix filtering runs vectorized on the snapshot.
+                keys = self._listing_snapshot(dir_path).keys(suffix=suffix)
+            else:
+                keys = (path for path, _ in self._list_objects(dir_path, ordered=self.ordered_listing))
+
+            for path in keys:
                 # All paths returned by S3 list are file paths, never directory paths
                 absolute_path = self.join_path(dir_path, path)
                 rel_path = absolute_path[len(root) :]
@@ -822,6 +1165,45 @@ class Boto3Backend(BaseStorageBackend):
 
         return _list_dir_or_file(dir_path, list_dir, list_file, suffix, recursive)
 
+    def listing_snapshot(self, dir_path: Union[str, Path], refresh: bool = False) -> ListingSnapshot:
+        """Return a snapshot of the recursive listing of a directory.
+
+        A snapshot saved on local disk is reused while it is fresh according
+        to ``listing_snapshot_ttl`` and ``listing_snapshot_version``.
+        Otherwise the directory is listed and a new snapshot is saved.
+
+        Args:
+            dir_path (str or Path): Path of the directory.
+            refresh (bool): Whether to list anew even if a fresh snapshot
+                exists. Defaults to False.
+
+        Returns:
+            ListingSnapshot: The listing, with keys relative to ``dir_path``.
+
+        Examples:
+            >>> backend = Boto3Backend(listing_snapshot_version='v1')
+            >>> snapshot = backend.listing_snapshot('s3://bucket/dataset')
+            >>> len(snapshot), snapshot.total_size
+            (1000000, 123456789012)
+        """
+        root = self._replace_prefix(self._format_path(self._map_path(dir_path)))
+        return self._listing_snapshot(root if root.endswith("/") else root + "/", refresh=refresh)
+
+    def _listing_snapshot(self, root: str, refresh: bool = False) -> ListingSnapshot:
+        path = ListingSnapshot.default_path(root, self.listing_snapshot_dir)
+        if not refresh:
+            try:
+                snapshot = ListingSnapshot(path)
+                if snapshot.is_fresh(ttl=self.listing_snapshot_ttl, version=self.listing_snapshot_version):
+                    return snapshot
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError) as e:
+                log.warning(f"Ignoring unreadable listing snapshot {path}: {e}", rank0_only=False)
+
+        entries = self._client.list_parallel(root, num_threads=max(1, self.list_workers), metadata=True)
+        return ListingSnapshot.write(path, entries, prefix=root, version=self.listing_snapshot_version)
+
     def generate_presigned_url(self, url: str, client_method: str = "get_object", expires_in: int = 3600) -> str:
         """Generate the presigned url of video stream which can be passed to
         mmcv.VideoReader. Now only work on Boto3 backend.
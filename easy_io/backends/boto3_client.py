@@ -1,12 +1,19 @@
 import asyncio
 import concurrent.futures
+import contextlib
+import hashlib
 import io
+import json
 import os
+import random
+import threading
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Sequence
+from concurrent.futures.process import BrokenProcessPool
 from math import ceil
 from multiprocessing import shared_memory
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
 
 import boto3
 import numpy as np
@@ -15,6 +22,10 @@ from botocore.exceptions import ClientError
 
 import easy_io.backends.auto_auth as auto
 from easy_io import log
+from easy_io.backends.base_backend import merge_ranges, slice_ranges
+from easy_io.backends.parallel_lister import ParallelLister
+from easy_io.backends.transfer_planner import MAX_PARTS, TransferPlan, TransferPlanner
+from easy_io.buffers import SharedMemoryBuffer
 
 try:
     # pyrefly: ignore  # import-error
@@ -34,6 +45,140 @@ except ImportError:
 
 MAX_RETRIES = 5
 RETRY_DELAY = 1  # seconds
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # chunk size when streaming a part to disk
+RANGED_GET_THREADS = 16  # threads of the in-process ranged GET used by ``get_auto``
+RANGED_GET_MAX_SIZE = 256 * 1024 * 1024  # larger objects go through the process pool
+COPY_THREADS = 16  # concurrent server-side copies of ``copytree``
+COPY_MAX_SINGLE_SIZE = 5 * 1024 * 1024 * 1024  # largest object CopyObject accepts
+COPY_PART_SIZE = 512 * 1024 * 1024  # part size of multipart server-side copies
+DELETE_BATCH_SIZE = 1000  # most keys DeleteObjects accepts
+DELETE_THREADS = 8  # concurrent DeleteObjects requests of ``delete_many``
+LIST_THREADS = 16  # concurrent ListObjectsV2 requests of ``list_parallel``
+RANGE_MERGE_GAP = 1024 * 1024  # ranges closer than this are read with one request by ``get_ranges``
+WRITE_PART_SIZE = 64 * 1024 * 1024  # part size of ``S3Writer``
+WRITE_PENDING_PARTS = 4  # parts an ``S3Writer`` uploads concurrently
+UPLOAD_MANIFEST_DIR = os.environ.get("EASY_IO_UPLOAD_MANIFEST_DIR", os.path.expanduser("~/.cache/easy_io/uploads"))
+# Error codes after which retrying or resuming a multipart upload cannot succeed.
+PERMANENT_UPLOAD_ERRORS = frozenset(
+    {
+        "AccessDenied",
+        "EntityTooLarge",
+        "EntityTooSmall",
+        "InvalidAccessKeyId",
+        "InvalidArgument",
+        "InvalidBucketName",
+        "InvalidPart",
+        "InvalidPartOrder",
+        "NoSuchBucket",
+        "NoSuchUpload",
+        "SignatureDoesNotMatch",
+    }
+)
+
+# Per-process state of transfer workers: one event loop and one warm aioboto3
+# client per (client config, transfer kind), reused across tasks.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop owned by the current (worker) process."""
+    if _WORKER_STATE.get("pid") != os.getpid():
+        # Either the first task in this process, or state inherited through fork.
+        _WORKER_STATE.clear()
+        _WORKER_STATE["pid"] = os.getpid()
+        _WORKER_STATE["loop"] = asyncio.new_event_loop()
+        _WORKER_STATE["clients"] = {}
+        asyncio.set_event_loop(_WORKER_STATE["loop"])
+    return _WORKER_STATE["loop"]
+
+
+async def _worker_client(client_config: dict[str, Any], kind: str):
+    """Return a cached aioboto3 S3 client of this worker process.
+
+    Args:
+        client_config (dict[str, Any]): The S3 client configuration.
+        kind (str): Either "upload" or "download", each has its own timeouts.
+    """
+    cache_key = (json.dumps(client_config, sort_keys=True), kind)
+    clients = _WORKER_STATE["clients"]
+    if cache_key not in clients:
+        if kind == "upload":
+            config = AioConfig(retries={"max_attempts": 3, "mode": "adaptive"}, connect_timeout=5, read_timeout=10)
+        else:
+            config = AioConfig(retries={"max_attempts": 5, "mode": "adaptive"}, connect_timeout=10, read_timeout=30)
+        session = aioboto3.Session()
+        # The client lives as long as the worker process, so its context is never exited.
+        clients[cache_key] = await session.client("s3", config=config, **client_config).__aenter__()
+    return clients[cache_key]
+
+
+class TransferPool:
+    """A lazily started process pool shared by the multipart transfers of a
+    :class:`Boto3Client`.
+
+    Worker processes keep their event loop and S3 clients warm between calls,
+    so repeated ``fast_get`` / ``fast_put`` calls only pay for the transfer.
+    The pool is never shared with forked children: a child process starts its
+    own pool on first use.
+
+    Args:
+        max_workers (int): Number of worker processes. Defaults to 32.
+    """
+
+    def __init__(self, max_workers: int = 32):
+        assert max_workers > 0, "max_workers should be positive"
+        self.max_workers = max_workers
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def _check_pid(self) -> None:
+        if self._pid != os.getpid():
+            # We are in a forked child: the parent's workers and lock are not ours.
+            self._executor = None
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+
+    @property
+    def executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        self._check_pid()
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def map(self, fn, iterable) -> list:
+        """Run ``fn`` over ``iterable`` in the pool and return all results in order.
+
+        Exceptions raised by the workers are propagated. A broken pool (e.g. a
+        worker killed by the OOM killer) is dropped so the next call starts a
+        fresh one.
+        """
+        try:
+            return list(self.executor.map(fn, iterable))
+        except BrokenProcessPool:
+            self.shutdown(wait=False)
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes. The pool restarts lazily on next use."""
+        self._check_pid()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, so that failed requests of many workers do not retry in lockstep."""
+    return RETRY_DELAY * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)  # noqa: S311
+
+
+def _error_code(error: BaseException) -> str:
+    """Return the S3 error code of ``error``, or its type name for other errors."""
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code", "ClientError")
+    return type(error).__name__
 
 
 async def upload_single_part_async(
@@ -61,98 +206,151 @@ async def upload_single_part_async(
             return {"PartNumber": part_number, "ETag": response["ETag"]}
         except (ClientError, asyncio.TimeoutError, Exception) as e:
             log.warning(f"Attempt {attempt + 1} failed for part {part_number}: {e!s}", rank0_only=False)
+            if _error_code(e) in PERMANENT_UPLOAD_ERRORS:
+                raise
             if attempt < MAX_RETRIES - 1:
-                await asyncio.sleep(RETRY_DELAY * (2**attempt))  # Exponential backoff
+                await asyncio.sleep(_retry_delay(attempt + 1))
             else:
                 log.error(f"Failed to upload part {part_number} after {MAX_RETRIES} attempts", rank0_only=False)
                 raise
 
 
+def _read_part(source: tuple[str, str], offset: int, size: int) -> bytes:
+    """
+    Reads one part of an upload source.
+
+    Args:
+        source (tuple[str, str]): ``("file", path)`` for a local file or
+            ``("shm", name)`` for a shared memory block holding the data.
+        offset (int): The start byte of the part.
+        size (int): The maximum size of the part in bytes.
+
+    Returns:
+        bytes: The part data, shorter than ``size`` for the last part.
+    """
+    kind, name = source
+    if kind == "file":
+        fd = os.open(name, os.O_RDONLY)
+        try:
+            return os.pread(fd, size, offset)
+        finally:
+            os.close(fd)
+    if kind == "shm":
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            return bytes(shm.buf[offset : min(offset + size, shm.size)])
+        finally:
+            shm.close()
+    raise ValueError(f"Unknown upload source: {kind}")
+
+
 async def upload_parts_async(
     part_size: int,
     part_numbers: range,
     upload_id: str,
-    data: bytes,
+    source: tuple[str, str],
     bucket: str,
     key: str,
     client_config: dict[str, Any],
-) -> list[dict[str, Any]]:
+    known_etags: Optional[dict[int, str]] = None,
+    max_concurrency: Optional[int] = None,
+) -> tuple[list[dict[str, Any]], dict[int, str]]:
     """
     Uploads multiple parts of a file asynchronously to S3.
 
+    Each part is read from ``source`` right before it is sent, so at most
+    ``max_concurrency`` parts are held in memory at once. Parts listed in
+    ``known_etags`` were uploaded by an earlier attempt; they are only sent
+    again if the MD5 of the local data does not match their ETag.
+
     Args:
         part_size (int): The size of each part in bytes.
         part_numbers (range): The range of part numbers to upload.
         upload_id (str): The upload ID for the multipart upload.
-        data (bytes): The data to upload.
+        source (tuple[str, str]): Where to read the parts from, see :func:`_read_part`.
         bucket (str): The S3 bucket name.
         key (str): The S3 key (file path).
         client_config (dict[str, Any]): The S3 client configuration.
+        known_etags (dict[int, str], optional): ETags of parts that are
+            already uploaded, keyed by S3 part number.
+        max_concurrency (int, optional): Maximum number of parts uploaded at
+            once. Defaults to all parts.
 
     Returns:
-        list[dict[str, Any]]: A list of dictionaries containing part numbers and ETags.
+        tuple[list[dict[str, Any]], dict[int, str]]: The part numbers and ETags
+        of the uploaded parts, and the error codes of the failed parts keyed by
+        S3 part number.
     """
-    session = aioboto3.Session()
-    config = AioConfig(retries={"max_attempts": 3, "mode": "adaptive"}, connect_timeout=5, read_timeout=10)
-    start_idx = part_numbers[0]
-    async with session.client("s3", config=config, **client_config) as s3:
-        tasks = []
-        for part_number in part_numbers:
-            start = (part_number - start_idx) * part_size
-            end = min(start + part_size, len(data))
-            part_data = data[start:end]
-            tasks.append(upload_single_part_async(s3, bucket, key, part_number + 1, part_data, upload_id))
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        successful_parts = []
-        failed_parts = []
-        for part_number, result in enumerate(results, start=start_idx + 1):
-            if isinstance(result, Exception):
-                failed_parts.append(part_number)
-            else:
-                successful_parts.append(result)
+    s3 = await _worker_client(client_config, "upload")
+    semaphore = asyncio.Semaphore(max_concurrency or len(part_numbers) or 1)
+    known_etags = known_etags or {}
+
+    async def upload_part(part_number: int) -> dict[str, Any]:
+        async with semaphore:
+            part_data = await asyncio.to_thread(_read_part, source, part_number * part_size, part_size)
+            etag = known_etags.get(part_number + 1)
+            if etag is not None and etag.strip('"') == hashlib.md5(part_data).hexdigest():  # noqa: S324
+                return {"PartNumber": part_number + 1, "ETag": etag}
+            return await upload_single_part_async(s3, bucket, key, part_number + 1, part_data, upload_id)
+
+    results = await asyncio.gather(*[upload_part(part_number) for part_number in part_numbers], return_exceptions=True)
+
+    successful_parts = []
+    failed_parts = {}
+    for part_number, result in zip(part_numbers, results):
+        if isinstance(result, Exception):
+            failed_parts[part_number + 1] = _error_code(result)
+        else:
+            successful_parts.append(result)
 
-        if failed_parts:
-            log.error(f"Failed to upload parts: {failed_parts}", rank0_only=False)
-            raise Exception(f"Failed to upload {len(failed_parts)} parts")  # noqa: TRY002
+    if failed_parts:
+        log.error(f"Failed to upload parts: {sorted(failed_parts)}", rank0_only=False)
 
-        successful_parts.sort(key=lambda part: part["PartNumber"])
-        return successful_parts
+    successful_parts.sort(key=lambda part: part["PartNumber"])
+    return successful_parts, failed_parts
 
 
-def upload_parts_to_s3(args: tuple[range, str, int, bytes, str, str, dict[str, Any]]) -> list[dict[str, Any]]:
+def upload_parts_to_s3(args: tuple) -> tuple[list[dict[str, Any]], dict[int, str]]:
     """
-    Uploads parts of a file to S3 using a new event loop.
+    Uploads parts of a file to S3 using the event loop of the worker process.
 
     Args:
-        args (tuple[range, str, int, bytes, str, str, dict[str, Any]]): The arguments for uploading parts, including:
+        args (tuple): The arguments for uploading parts, including:
             part_numbers (range): The range of part numbers to upload.
             upload_id (str): The upload ID for the multipart upload.
             part_size (int): The size of each part in bytes.
-            data (bytes): The data to upload.
+            source (tuple[str, str]): Where the worker reads the parts from.
             bucket (str): The S3 bucket name.
             key (str): The S3 key (file path).
             client_config (dict[str, Any]): The S3 client configuration.
+            known_etags (dict[int, str]): ETags of already uploaded parts.
+            max_concurrency (int): Maximum number of parts uploaded at once.
 
     Returns:
-        list[dict[str, Any]]: A list of dictionaries containing part numbers and ETags.
+        tuple[list[dict[str, Any]], dict[int, str]]: See :func:`upload_parts_async`.
     """
-    part_numbers, upload_id, part_size, data, bucket, key, client_config = args
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    parts = loop.run_until_complete(
-        upload_parts_async(part_size, part_numbers, upload_id, data, bucket, key, client_config)
+    part_numbers, upload_id, part_size, source, bucket, key, client_config, known_etags, max_concurrency = args
+    return _worker_loop().run_until_complete(
+        upload_parts_async(
+            part_size, part_numbers, upload_id, source, bucket, key, client_config, known_etags, max_concurrency
+        )
     )
-    loop.close()
-    return parts
 
 
 async def download_single_part_async(
-    s3, bucket: str, key: str, part_number: int, start: int, end: int, shm_name: str, part_size: int
+    s3,
+    bucket: str,
+    key: str,
+    part_number: int,
+    start: int,
+    end: int,
+    shm_name: Optional[str],
+    part_size: int,
+    local_path: Optional[str] = None,
 ) -> None:
     """
-    Downloads a single part of a file asynchronously and writes it to shared memory.
+    Downloads a single part of a file asynchronously and writes it to shared memory,
+    or to its byte range of ``local_path`` when given.
 
     Args:
         s3 (S3): The S3 client.
@@ -161,13 +359,27 @@ async def download_single_part_async(
         part_number (int): The part number.
         start (int): The start byte of the part.
         end (int): The end byte of the part.
-        shm_name (str): The name of the shared memory block.
+        shm_name (str, optional): The name of the shared memory block.
         part_size (int): The size of each part in bytes.
+        local_path (str, optional): A pre-sized local file to write the part
+            into. The body is streamed to disk in chunks, so memory usage does
+            not grow with the part size.
     """
     for attempt in range(MAX_RETRIES):
         try:
             range_header = f"bytes={start}-{end}"
             response = await s3.get_object(Bucket=bucket, Key=key, Range=range_header)
+            if local_path is not None:
+                fd = os.open(local_path, os.O_WRONLY)
+                try:
+                    offset = start
+                    while chunk := await response["Body"].read(DOWNLOAD_CHUNK_SIZE):
+                        os.pwrite(fd, chunk, offset)
+                        offset += len(chunk)
+                finally:
+                    os.close(fd)
+                return
+
             data = await response["Body"].read()
 
             shm = shared_memory.SharedMemory(name=shm_name)
@@ -185,10 +397,18 @@ async def download_single_part_async(
 
 
 async def download_parts_async(
-    part_size: int, part_numbers: range, bucket: str, key: str, client_config: dict[str, Any], shm_name: str
+    part_size: int,
+    part_numbers: range,
+    bucket: str,
+    key: str,
+    client_config: dict[str, Any],
+    shm_name: Optional[str],
+    local_path: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
 ) -> None:
     """
-    Downloads multiple parts of a file asynchronously and writes them to shared memory.
+    Downloads multiple parts of a file asynchronously and writes them to shared memory
+    or to ``local_path``.
 
     Args:
         part_size (int): The size of each part in bytes.
@@ -196,13 +416,17 @@ async def download_parts_async(
         bucket (str): The S3 bucket name.
         key (str): The S3 key (file path).
         client_config (dict[str, Any]): The S3 client configuration.
-        shm_name (str): The name of the shared memory block.
+        shm_name (str, optional): The name of the shared memory block.
+        local_path (str, optional): A pre-sized local file to write the parts into.
+        max_concurrency (int, optional): Maximum number of parts downloaded at
+            once. Defaults to all parts.
     """
-    session = aioboto3.Session()
-    config = AioConfig(retries={"max_attempts": 5, "mode": "adaptive"}, connect_timeout=10, read_timeout=30)
-    async with session.client("s3", config=config, **client_config) as s3:
-        tasks = [
-            download_single_part_async(
+    s3 = await _worker_client(client_config, "download")
+    semaphore = asyncio.Semaphore(max_concurrency or len(part_numbers) or 1)
+
+    async def download_part(part_number: int) -> None:
+        async with semaphore:
+            await download_single_part_async(
                 s3,
                 bucket,
                 key,
@@ -211,37 +435,258 @@ async def download_parts_async(
                 (part_number + 1) * part_size - 1,
                 shm_name,
                 part_size,
+                local_path,
             )
-            for part_number in part_numbers
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        failed_parts = [part for part, result in zip(part_numbers, results) if isinstance(result, Exception)]
 
-        if failed_parts:
-            log.error(f"Failed to download parts: {failed_parts}", rank0_only=False)
-            raise Exception(f"Failed to download {len(failed_parts)} parts")  # noqa: TRY002
+    results = await asyncio.gather(
+        *[download_part(part_number) for part_number in part_numbers], return_exceptions=True
+    )
+    failed_parts = [part for part, result in zip(part_numbers, results) if isinstance(result, Exception)]
+
+    if failed_parts:
+        log.error(f"Failed to download parts: {failed_parts}", rank0_only=False)
+        raise Exception(f"Failed to download {len(failed_parts)} parts")  # noqa: TRY002
 
 
-def download_parts_to_s3(args: tuple[range, int, str, str, dict[str, Any], str]) -> bytes:
+def download_parts_to_s3(args: tuple) -> None:
     """
-    Downloads parts of a file using a new event loop.
+    Downloads parts of a file using the event loop of the worker process.
 
     Args:
-        args (tuple[range, int, str, str, dict[str, Any]]): The arguments for downloading parts, including:
+        args (tuple): The arguments for downloading parts, including:
             part_numbers (range): The range of part numbers to download.
             part_size (int): The size of each part in bytes.
             bucket (str): The S3 bucket name.
             key (str): The S3 key (file path).
             client_config (dict[str, Any]): The S3 client configuration.
+            shm_name (str): The name of the shared memory block.
+            local_path (str, optional): A local file to write the parts into
+                instead of the shared memory block.
+            max_concurrency (int): Maximum number of parts downloaded at once.
+    """
+    part_numbers, part_size, bucket, key, client_config, shm_name, local_path, max_concurrency = args
+    _worker_loop().run_until_complete(
+        download_parts_async(part_size, part_numbers, bucket, key, client_config, shm_name, local_path, max_concurrency)
+    )
 
-    Returns:
-        bytes: The combined file data from all downloaded parts.
+
+class UploadManifest:
+    """A small JSON file recording the state of a resumable multipart upload.
+
+    It holds the upload ID, the object and part sizes and the ETags of the
+    completed parts, so that a failed :meth:`Boto3Client.fast_put` can be
+    resumed by a later call instead of starting over.
+
+    Args:
+        bucket (str): The S3 bucket name.
+        key (str): The S3 key of the uploaded object.
+        manifest_dir (str, optional): Directory of the manifest files.
+            Defaults to ``UPLOAD_MANIFEST_DIR``.
+
+    Examples:
+        >>> manifest = UploadManifest('bucket', 'path/of/file')
+        >>> manifest.save({'upload_id': '...', 'size': 1024, 'part_size': 512, 'parts': {}})
+        >>> manifest.load()['upload_id']
+        '...'
     """
-    part_numbers, part_size, bucket, key, client_config, shm_name = args
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(download_parts_async(part_size, part_numbers, bucket, key, client_config, shm_name))
-    loop.close()
+
+    def __init__(self, bucket: str, key: str, manifest_dir: Optional[str] = None):
+        digest = hashlib.sha1(f"{bucket}/{key}".encode()).hexdigest()  # noqa: S324
+        self.path = os.path.join(manifest_dir or UPLOAD_MANIFEST_DIR, f"{digest}.json")
+        self.bucket = bucket
+        self.key = key
+
+    def load(self) -> Optional[dict[str, Any]]:
+        """Return the recorded state, or None if there is no usable manifest."""
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("bucket") != self.bucket or state.get("key") != self.key:
+            return None
+        state["parts"] = {int(number): etag for number, etag in state.get("parts", {}).items()}
+        return state
+
+    def save(self, state: dict[str, Any]) -> None:
+        """Atomically write ``state`` to the manifest."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({**state, "bucket": self.bucket, "key": self.key}, f)
+        os.replace(tmp_path, self.path)
+
+    def remove(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+
+class S3Writer(io.BufferedIOBase):
+    """A write-only file object that streams to S3 with a multipart upload.
+
+    Written data is buffered until it fills a part of ``part_size`` bytes,
+    which is then uploaded in the background while the caller keeps writing.
+    At most ``max_pending_parts`` parts are uploaded at once, by threads of
+    the writer so that other transfers of the client cannot hold them up; a
+    write that fills one more waits, so memory stays below
+    ``(max_pending_parts + 1) * part_size``. :meth:`close` uploads the last
+    part and completes the upload; data that fits in one part is written
+    with a single ``PutObject``. On an error, or when the ``with`` block
+    raises, the upload is aborted and no object is created.
+
+    Args:
+        client (Boto3Client): The client to upload with.
+        bucket (str): The bucket.
+        key (str): The key of the object.
+        part_size (int): Bytes per part, at least 5 MB. Defaults to
+            ``WRITE_PART_SIZE``.
+        max_pending_parts (int): Parts uploaded concurrently. Defaults to
+            ``WRITE_PENDING_PARTS``.
+        on_complete (Callable, optional): Called after the object was
+            written.
+
+    Examples:
+        >>> with client.open_write('s3://bucket/model.pt') as f:
+        ...     torch.save(state_dict, f)
+    """
+
+    def __init__(
+        self,
+        client: "Boto3Client",
+        bucket: str,
+        key: str,
+        part_size: int = WRITE_PART_SIZE,
+        max_pending_parts: int = WRITE_PENDING_PARTS,
+        on_complete: Optional[Callable[[], None]] = None,
+    ):
+        super().__init__()
+        assert part_size >= 5 * 1024 * 1024, "S3 parts must be at least 5 MB"
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.name = f"s3://{bucket}/{key}"
+        self.part_size = part_size
+        self.max_pending_parts = max_pending_parts
+        self.on_complete = on_complete
+        self._buffer = bytearray()
+        self._written = 0
+        self._upload_id: Optional[str] = None
+        self._parts: list[concurrent.futures.Future] = []
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    @property
+    def mode(self) -> str:
+        return "wb"
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._written
+
+    def write(self, b) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        data = memoryview(b).cast("B")
+        self._buffer += data
+        self._written += len(data)
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[: self.part_size])
+            del self._buffer[: self.part_size]
+            self._submit(part)
+        return len(data)
+
+    def _submit(self, data: bytes) -> None:
+        try:
+            if self._upload_id is None:
+                self._upload_id = self.client._client.create_multipart_upload(Bucket=self.bucket, Key=self.key)[
+                    "UploadId"
+                ]
+            pending = [future for future in self._parts if not future.done()]
+            if len(pending) >= self.max_pending_parts:
+                concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in self._parts:
+                if future.done():
+                    future.result()  # raises the error of a failed part
+            if len(self._parts) >= MAX_PARTS:
+                raise ValueError(f"{self.name} needs more than {MAX_PARTS} parts, increase part_size")  # noqa: TRY301
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_pending_parts, thread_name_prefix="easy_io_s3_write"
+                )
+            self._parts.append(self._executor.submit(self._upload_part, len(self._parts) + 1, data))
+        except BaseException:
+            self.abort()
+            raise
+
+    def _upload_part(self, number: int, data: bytes) -> dict[str, Any]:
+        attempt = 0
+        while True:
+            try:
+                response = self.client._client.upload_part(
+                    Bucket=self.bucket, Key=self.key, UploadId=self._upload_id, PartNumber=number, Body=data
+                )
+                return {"PartNumber": number, "ETag": response["ETag"]}
+            except Exception as e:
+                attempt += 1
+                log.error(f"Got an exception: attempt={attempt} - {e} - {self.name} part {number}", rank0_only=False)
+                if attempt >= self.client.max_attempt or _error_code(e) in PERMANENT_UPLOAD_ERRORS:
+                    raise
+                time.sleep(_retry_delay(attempt))
+
+    def close(self) -> None:
+        """Upload the rest of the data and complete the upload."""
+        if self.closed:
+            return
+        try:
+            if self._upload_id is None:
+                self.client._client.put_object(Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer))
+            else:
+                if self._buffer or not self._parts:
+                    self._submit(bytes(self._buffer))
+                parts = [future.result() for future in self._parts]
+                self.client._client.complete_multipart_upload(
+                    Bucket=self.bucket, Key=self.key, UploadId=self._upload_id, MultipartUpload={"Parts": parts}
+                )
+        except BaseException:
+            self.abort()
+            raise
+        self._shutdown()
+        self._buffer = bytearray()
+        super().close()
+        if self.on_complete is not None:
+            self.on_complete()
+
+    def abort(self) -> None:
+        """Discard the written data and abort the upload."""
+        if self.closed:
+            return
+        for future in self._parts:
+            future.cancel()
+        concurrent.futures.wait(self._parts)
+        self._shutdown()
+        if self._upload_id is not None:
+            self.client._abort_multipart_upload(self.bucket, self.key, self._upload_id)
+        self._buffer = bytearray()
+        super().close()
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            # All parts are done or cancelled.
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def __del__(self) -> None:
+        # Unlike ``IOBase``, never complete an upload that was not closed explicitly; it may be partial.
+        if not self.closed:
+            log.warning(f"{self.name} was not closed, aborting its upload", rank0_only=False)
+            self.abort()
 
 
 class Boto3Client:
@@ -249,6 +694,7 @@ class Boto3Client:
         self,
         s3_credential_path: str,
         max_attempt: int = 3,
+        transfer_processes: int = 32,
     ):
         self.max_attempt = max_attempt
         assert s3_credential_path, "s3_credential_path is required"
@@ -261,11 +707,36 @@ class Boto3Client:
             s3={"addressing_style": "virtual"},
             response_checksum_validation="when_required",
             request_checksum_calculation="when_required",
+            max_pool_connections=max(
+                10, RANGED_GET_THREADS + COPY_THREADS + DELETE_THREADS + LIST_THREADS + WRITE_PENDING_PARTS
+            ),
         )
 
         self._client = boto3.client("s3", **conf, config=s3_config)
         self._s3_cred_info = conf
         self._mc_kv_store = None
+        self.transfer_pool = TransferPool(max_workers=transfer_processes)
+        self.transfer_planner = TransferPlanner(max_processes=transfer_processes)
+        self._thread_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._thread_pool_pid: Optional[int] = None
+
+    @property
+    def thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """ThreadPoolExecutor: Threads for in-process parallel requests, started on first use."""
+        if self._thread_pool is None or self._thread_pool_pid != os.getpid():
+            # Threads do not survive a fork, a child process needs its own pool.
+            self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=RANGED_GET_THREADS, thread_name_prefix="easy_io_s3"
+            )
+            self._thread_pool_pid = os.getpid()
+        return self._thread_pool
+
+    def shutdown(self) -> None:
+        """Stop the worker processes and threads used by the parallel transfers."""
+        self.transfer_pool.shutdown()
+        if self._thread_pool is not None and self._thread_pool_pid == os.getpid():
+            self._thread_pool.shutdown()
+        self._thread_pool = None
 
     def get(self, filepath):
         filepath = self._check_path(filepath)
@@ -293,6 +764,280 @@ class Boto3Client:
 
         raise ConnectionError(f"Unable to read {filepath} from. {attempt} attempts tried.")
 
+    def get_auto(self, filepath) -> bytes:
+        """
+        Downloads a file from S3 with the fastest method for its size.
+
+        The first request fetches up to ``transfer_planner.multipart_threshold``
+        bytes, which is the whole object for small files. Objects up to
+        ``RANGED_GET_MAX_SIZE`` are then completed with :meth:`get_threaded`,
+        larger ones are downloaded with the process pool of :meth:`fast_get`.
+
+        Args:
+            filepath (str): The S3 path of the file to download.
+
+        Returns:
+            bytes: The downloaded file data.
+        """
+        original_filepath = filepath
+        filepath = self._check_path(filepath)
+        if self._mc_kv_store and self._mc_kv_store.available:
+            return self.get(original_filepath)
+        bucket = filepath.split("/")[0]
+        key = "/".join(filepath.split("/")[1:])
+
+        attempt = 0
+        while True:
+            try:
+                response = self._client.get_object(
+                    Bucket=bucket, Key=key, Range=f"bytes=0-{self.transfer_planner.multipart_threshold - 1}"
+                )
+                head = response["Body"].read()
+                break
+            except Exception as e:
+                if _error_code(e) == "InvalidRange":
+                    # Empty objects reject any range.
+                    return b""
+                attempt += 1
+                log.error(f"Got an exception: attempt={attempt} - {e} - {filepath}", rank0_only=False)
+                if attempt >= self.max_attempt:
+                    raise ConnectionError(f"Unable to read {filepath} from. {attempt} attempts tried.") from e
+        size = int(response["ContentRange"].rsplit("/", 1)[1])
+        if size <= len(head):
+            return head
+        if size > RANGED_GET_MAX_SIZE and aioboto3 is not None:
+            return self.fast_get(original_filepath)
+        return self._get_threaded(bucket, key, size, head, response["ETag"])
+
+    def get_threaded(self, filepath, num_threads: Optional[int] = None) -> bytes:
+        """
+        Downloads a file from S3 with concurrent ranged GETs on a thread pool.
+
+        All ranges are written into one preallocated buffer. This avoids the
+        process start-up and shared memory of :meth:`fast_get`, and suits
+        objects of a few hundred MB at most.
+
+        Args:
+            filepath (str): The S3 path of the file to download.
+            num_threads (int, optional): Maximum number of parallel requests.
+                Defaults to ``RANGED_GET_THREADS``.
+
+        Returns:
+            bytes: The downloaded file data.
+        """
+        filepath = self._check_path(filepath)
+        bucket = filepath.split("/")[0]
+        key = "/".join(filepath.split("/")[1:])
+        response = self._client.head_object(Bucket=bucket, Key=key)
+        return self._get_threaded(bucket, key, response["ContentLength"], b"", response["ETag"], num_threads)
+
+    def _get_threaded(
+        self, bucket: str, key: str, size: int, head: bytes, etag: str, num_threads: Optional[int] = None
+    ) -> bytes:
+        """Download ``size`` bytes of which the first ``head`` are already known."""
+        num_threads = min(num_threads or RANGED_GET_THREADS, RANGED_GET_THREADS)
+        plan = self.transfer_planner.plan(size - len(head), num_processes=num_threads)
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        view[: len(head)] = head
+
+        def download_range(start: int) -> None:
+            end = min(start + plan.part_size, size) - 1
+            for attempt in range(self.max_attempt):
+                try:
+                    # IfMatch makes sure that all ranges come from the same version of the object.
+                    response = self._client.get_object(
+                        Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag
+                    )
+                    offset = start
+                    for chunk in response["Body"].iter_chunks(DOWNLOAD_CHUNK_SIZE):
+                        view[offset : offset + len(chunk)] = chunk
+                        offset += len(chunk)
+                    if offset != end + 1:
+                        raise ConnectionError(f"Incomplete range {start}-{end}: got {offset - start} bytes")  # noqa: TRY301
+                    return
+                except Exception as e:
+                    log.error(f"Got an exception: attempt={attempt + 1} - {e} - s3://{bucket}/{key}", rank0_only=False)
+                    if attempt + 1 >= self.max_attempt or _error_code(e) == "PreconditionFailed":
+                        raise
+
+        log.debug(f"Downloading s3://{bucket}/{key} with {min(num_threads, plan.num_parts)} threads: {plan}")
+        start_time = time.perf_counter()
+        futures = [self.thread_pool.submit(download_range, start) for start in range(len(head), size, plan.part_size)]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            concurrent.futures.wait(futures)
+            raise
+        finally:
+            view.release()
+        self.transfer_planner.record(size - len(head), time.perf_counter() - start_time, min(num_threads, len(futures)))
+        return bytes(buffer)
+
+    def get_range(self, filepath, offset: int, length: int, etag: Optional[str] = None) -> bytes:
+        """
+        Reads ``length`` bytes at ``offset`` of an object with a ranged GET.
+
+        Fewer bytes are returned at the end of the object.
+
+        Args:
+            filepath (str): The S3 path of the object.
+            offset (int): Position of the first byte.
+            length (int): Number of bytes.
+            etag (str, optional): Only read this version of the object, e.g.
+                the ``etag`` of :meth:`stat`.
+
+        Returns:
+            bytes: The data of the range.
+
+        Raises:
+            FileNotFoundError: If the object does not exist.
+            ConnectionError: If the object no longer has ``etag``.
+        """
+        return self.get_ranges(filepath, [(offset, length)], etag=etag)[0]
+
+    def get_ranges(
+        self,
+        filepath,
+        ranges: Sequence[tuple[int, int]],
+        max_gap: int = RANGE_MERGE_GAP,
+        etag: Optional[str] = None,
+    ) -> list[bytes]:
+        """
+        Reads several ``(offset, length)`` ranges of an object with concurrent ranged GETs.
+
+        Ranges that overlap or are at most ``max_gap`` bytes apart are merged
+        into one request, since a few wasted bytes cost less than another
+        round trip. All requests must see the same ETag, so the ranges are
+        read from one version of the object.
+
+        Args:
+            filepath (str): The S3 path of the object.
+            ranges (Sequence[tuple[int, int]]): The ranges to read.
+            max_gap (int): Largest gap between merged ranges. Defaults to
+                ``RANGE_MERGE_GAP``.
+            etag (str, optional): Only read this version of the object, e.g.
+                the ``etag`` of :meth:`stat`.
+
+        Returns:
+            list[bytes]: The data of every range.
+
+        Raises:
+            FileNotFoundError: If the object does not exist.
+            ConnectionError: If the object changed while reading or no longer
+                has ``etag``.
+        """
+        filepath = self._check_path(filepath)
+        bucket = filepath.split("/")[0]
+        key = "/".join(filepath.split("/")[1:])
+        spans = merge_ranges(ranges, max_gap)
+        if len(spans) == 1:
+            fetched = [self._get_range(bucket, key, spans[0][0], spans[0][1], etag)]
+        else:
+            fetched = list(
+                self.thread_pool.map(lambda span: self._get_range(bucket, key, span[0], span[1], etag), spans)
+            )
+        if len({etag for _, etag in fetched if etag}) > 1:
+            raise ConnectionError(f"s3://{filepath} changed while reading its ranges")
+        return slice_ranges(ranges, spans, [data for data, _ in fetched])
+
+    def _get_range(
+        self, bucket: str, key: str, offset: int, length: int, etag: Optional[str] = None
+    ) -> tuple[bytes, str]:
+        """Return the data of a range and the ETag of the object, which is empty if nothing was read."""
+        if length == 0:
+            return b"", ""
+        kwargs = {"IfMatch": f'"{etag}"'} if etag else {}
+        attempt = 0
+        while True:
+            try:
+                response = self._client.get_object(
+                    Bucket=bucket, Key=key, Range=f"bytes={offset}-{offset + length - 1}", **kwargs
+                )
+                return response["Body"].read(), response["ETag"]
+            except Exception as e:
+                code = _error_code(e)
+                if code == "InvalidRange":
+                    # The range starts at or after the end of the object.
+                    return b"", ""
+                if code in ("404", "NoSuchKey"):
+                    raise FileNotFoundError(f"s3://{bucket}/{key}") from e
+                if code in ("412", "PreconditionFailed"):
+                    raise ConnectionError(f"s3://{bucket}/{key} changed, its ETag is no longer {etag}") from e
+                attempt += 1
+                log.error(f"Got an exception: attempt={attempt} - {e} - s3://{bucket}/{key}", rank0_only=False)
+                if attempt >= self.max_attempt:
+                    raise
+
+    def copy(self, src: str, dst: str) -> None:
+        """
+        Copies an object within S3 without downloading it.
+
+        Objects up to 5 GB are copied with a single ``copy_object`` request,
+        larger ones with concurrent ``upload_part_copy`` requests.
+
+        Args:
+            src (str): The S3 path of the source object.
+            dst (str): The S3 path of the destination object.
+        """
+        src, dst = self._check_path(src), self._check_path(dst)
+        src_bucket, src_key = src.split("/")[0], "/".join(src.split("/")[1:])
+        dst_bucket, dst_key = dst.split("/")[0], "/".join(dst.split("/")[1:])
+
+        response = self._client.head_object(Bucket=src_bucket, Key=src_key)
+        size = response["ContentLength"]
+        copy_source = {"Bucket": src_bucket, "Key": src_key}
+        if size <= COPY_MAX_SINGLE_SIZE:
+            attempt = 0
+            while attempt < self.max_attempt:
+                try:
+                    self._client.copy_object(CopySource=copy_source, Bucket=dst_bucket, Key=dst_key)
+                    return
+                except ClientError as e:
+                    attempt += 1
+                    log.error(f"Got an exception: attempt={attempt} - {e} - s3://{src} -> s3://{dst}", rank0_only=False)
+            raise ConnectionError(f"Unable to copy s3://{src} to s3://{dst}. {attempt} attempts tried.")
+
+        self._multipart_copy(copy_source, dst_bucket, dst_key, size, response["ETag"])
+
+    def _multipart_copy(self, copy_source: dict[str, str], bucket: str, key: str, size: int, etag: str) -> None:
+        part_size = max(COPY_PART_SIZE, ceil(size / MAX_PARTS))
+        upload_id = self._client.create_multipart_upload(Bucket=bucket, Key=key)["UploadId"]
+
+        def copy_part(part_number: int) -> dict[str, Any]:
+            start = (part_number - 1) * part_size
+            end = min(start + part_size, size) - 1
+            attempt = 0
+            while True:
+                try:
+                    response = self._client.upload_part_copy(
+                        Bucket=bucket,
+                        Key=key,
+                        UploadId=upload_id,
+                        PartNumber=part_number,
+                        CopySource=copy_source,
+                        CopySourceRange=f"bytes={start}-{end}",
+                        CopySourceIfMatch=etag,
+                    )
+                    return {"PartNumber": part_number, "ETag": response["CopyPartResult"]["ETag"]}
+                except ClientError as e:
+                    attempt += 1
+                    log.error(f"Got an exception: attempt={attempt} - {e} - part {part_number}", rank0_only=False)
+                    if attempt >= self.max_attempt or _error_code(e) in PERMANENT_UPLOAD_ERRORS:
+                        raise
+
+        try:
+            parts = list(self.thread_pool.map(copy_part, range(1, ceil(size / part_size) + 1)))
+            self._client.complete_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            self._abort_multipart_upload(bucket, key, upload_id)
+            raise
+
     def _get_file_size(self, bucket, key, max_retries=10):
         retries = 0
         while retries < max_retries:
@@ -316,53 +1061,150 @@ class Boto3Client:
                     raise  # Re-raise the exception after max retries
                 time.sleep(2)  # Wait for 2 seconds before retrying
 
-    def fast_get(self, filepath, num_processes: int = 32) -> bytes:
+    def fast_get(
+        self, filepath, num_processes: Optional[int] = None, zero_copy: bool = False
+    ) -> Union[bytes, SharedMemoryBuffer]:
         """
         Downloads a file from S3 in multiple parts asynchronously and combines them.
 
+        Part size and parallelism are chosen by :attr:`transfer_planner`.
+
         Args:
             filepath (str): The S3 path of the file to download.
+            num_processes (int, optional): Number of tasks the parts are split
+                into. Defaults to the choice of :attr:`transfer_planner`.
+            zero_copy (bool): If True, return the shared memory block the parts
+                were downloaded into instead of copying it into ``bytes``.
+                The caller owns the returned buffer and should release it.
+                Defaults to False.
 
         Returns:
-            bytes: The downloaded file data.
+            bytes or SharedMemoryBuffer: The downloaded file data.
         """
         assert aioboto3 is not None, "aioboto3 is required for fast_get"
         original_filepath = filepath
         filepath = self._check_path(filepath)
         bucket = filepath.split("/")[0]
         key = "/".join(filepath.split("/")[1:])
-        part_size = 16 * 1024 * 1024  # 16 MB part size
 
         file_size = self._get_file_size(bucket=bucket, key=key)
-        if file_size <= part_size:
-            return self.get(original_filepath)
-        num_parts = ceil(file_size / part_size)
-
-        shm = shared_memory.SharedMemory(create=True, size=num_parts * part_size)
-        shm_name = shm.name
-
-        part_numbers = np.array_split(np.arange(num_parts), num_processes)
+        plan = self.transfer_planner.plan(file_size, num_processes=num_processes)
+        if not plan.multipart:
+            data = self.get(original_filepath)
+            if not zero_copy:
+                return data
+            # Keep the return type stable, copying a single part is cheap.
+            shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+            shm.buf[: len(data)] = data
+            shm.unlink()
+            return SharedMemoryBuffer(shm, len(data))
 
+        shm = shared_memory.SharedMemory(create=True, size=plan.num_parts * plan.part_size)
         try:
-            with concurrent.futures.ProcessPoolExecutor(max_workers=num_processes) as executor:
-                args = []
-                for i in range(num_processes):
-                    cur_parts = part_numbers[i].tolist()
-                    args.append((cur_parts, part_size, bucket, key, self._s3_cred_info, shm_name))
-                executor.map(download_parts_to_s3, args)
-
-            all_data = shm.buf[:file_size].tobytes()
+            self._run_download(bucket, key, plan, shm.name, None)
         except Exception as e:
             log.critical(f"An error occurred: {e}", rank0_only=False)
 
             import traceback
 
             traceback.print_exc()
+            shm.close()
             raise
         finally:
-            shm.close()
+            # The workers are done with the name; the mapping stays valid until closed.
             shm.unlink()
-        return all_data
+
+        if zero_copy:
+            return SharedMemoryBuffer(shm, file_size)
+        try:
+            return shm.buf[:file_size].tobytes()
+        finally:
+            shm.close()
+
+    def fast_get_to_file(
+        self, filepath, local_path: str, num_processes: Optional[int] = None, size: Optional[int] = None
+    ) -> None:
+        """
+        Downloads a file from S3 straight into ``local_path``.
+
+        The destination is pre-sized and every part is streamed into its own
+        byte range with positional writes, so memory usage is bounded by the
+        parts in flight rather than by the object size. Small files are
+        streamed with a single request.
+
+        Args:
+            filepath (str): The S3 path of the file to download.
+            local_path (str): The local destination, replaced if it exists.
+            num_processes (int, optional): Number of tasks the parts are split
+                into. Defaults to the choice of :attr:`transfer_planner`.
+            size (int, optional): The size of the object, if already known
+                from a listing. Saves a HEAD request.
+        """
+        filepath = self._check_path(filepath)
+        bucket = filepath.split("/")[0]
+        key = "/".join(filepath.split("/")[1:])
+        local_path = str(local_path)
+
+        file_size = self._get_file_size(bucket=bucket, key=key) if size is None else size
+        plan = self.transfer_planner.plan(file_size, num_processes=num_processes)
+        try:
+            if not plan.multipart or aioboto3 is None:
+                self._download_file(bucket, key, local_path)
+                return
+
+            with open(local_path, "wb") as f:
+                f.truncate(file_size)
+                if hasattr(os, "posix_fallocate"):
+                    # Not supported by every filesystem, the sparse file works too.
+                    with contextlib.suppress(OSError):
+                        os.posix_fallocate(f.fileno(), 0, file_size)
+
+            self._run_download(bucket, key, plan, None, local_path)
+        except Exception as e:
+            log.error(f"Failed to download s3://{filepath} to {local_path}: {e}", rank0_only=False)
+            if os.path.exists(local_path):
+                os.remove(local_path)
+            raise
+
+    def _run_download(
+        self, bucket: str, key: str, plan: TransferPlan, shm_name: Optional[str], local_path: Optional[str]
+    ) -> None:
+        """Download all parts of ``plan`` with the transfer pool and record the throughput."""
+        log.debug(f"Downloading s3://{bucket}/{key}: {plan}")
+        part_numbers = np.array_split(np.arange(plan.num_parts), plan.num_processes)
+        args = [
+            (
+                cur_parts.tolist(),
+                plan.part_size,
+                bucket,
+                key,
+                self._s3_cred_info,
+                shm_name,
+                local_path,
+                plan.concurrency,
+            )
+            for cur_parts in part_numbers
+            if len(cur_parts) > 0
+        ]
+        start = time.perf_counter()
+        self.transfer_pool.map(download_parts_to_s3, args)
+        self.transfer_planner.record(plan.size, time.perf_counter() - start, plan.num_processes * plan.concurrency)
+
+    def _download_file(self, bucket: str, key: str, local_path: str) -> None:
+        attempt = 0
+        while attempt < self.max_attempt:
+            try:
+                # A plain GET, the managed transfer of ``download_file`` costs more than it saves on small files.
+                response = self._client.get_object(Bucket=bucket, Key=key)
+                with open(local_path, "wb") as f:
+                    for chunk in response["Body"].iter_chunks(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                return
+            except Exception as e:
+                attempt += 1
+                log.error(f"Got an exception: attempt={attempt} - {e} - s3://{bucket}/{key}", rank0_only=False)
+
+        raise ConnectionError(f"Unable to read s3://{bucket}/{key}. {attempt} attempts tried.")
 
     def put(self, obj, filepath):
         filepath = self._check_path(filepath)
@@ -373,7 +1215,12 @@ class Boto3Client:
             try:
                 # If obj is a string path to a local file, use upload_file instead
                 if isinstance(obj, str) and os.path.isfile(obj):
-                    self._client.upload_file(Filename=obj, Bucket=bucket_name, Key=key)
+                    if os.path.getsize(obj) <= self.transfer_planner.multipart_threshold:
+                        # One request, without the set-up of a managed transfer.
+                        with open(obj, "rb") as f:
+                            self._client.put_object(Body=f, Bucket=bucket_name, Key=key)
+                    else:
+                        self._client.upload_file(Filename=obj, Bucket=bucket_name, Key=key)
                     return
                 if isinstance(obj, io.BytesIO):
                     obj.seek(0)
@@ -390,48 +1237,248 @@ class Boto3Client:
 
         raise ConnectionError(f"Unable to write {filepath} to. {attempt} attempts tried.")
 
-    def fast_put(self, obj, filepath, num_processes: int = 32):
-        assert aioboto3 is not None, "aioboto3 is required for fast_put"
+    def open_write(self, filepath, **kwargs) -> S3Writer:
+        """
+        Opens an object for streaming writes with a multipart upload.
+
+        Args:
+            filepath (str): The S3 path of the object.
+            **kwargs: Arguments of :class:`S3Writer`, e.g. ``part_size``.
+
+        Returns:
+            S3Writer: The file object; the object is written when it is closed.
+        """
+        filepath = self._check_path(filepath)
+        return S3Writer(self, filepath.split("/")[0], "/".join(filepath.split("/")[1:]), **kwargs)
+
+    def fast_put(self, obj, filepath, num_processes: Optional[int] = None, resumable: bool = False):
+        """
+        Uploads an object to S3 in multiple parts with the transfer pool.
+
+        Part size and parallelism are chosen by :attr:`transfer_planner`.
+        Workers read their own parts: straight from the file when ``obj`` is a
+        local path, or from a shared memory block that in-memory data is
+        copied into once. Each worker holds at most ``plan.concurrency`` parts
+        in memory, whatever the size of the object.
+
+        Failed parts are retried up to ``max_attempt`` rounds. If the upload
+        fails for good it is aborted, unless ``resumable`` is set and the
+        failure is transient: then the upload ID and the completed parts are
+        kept in an :class:`UploadManifest`, and the next resumable
+        ``fast_put`` to the same path only uploads the missing parts.
+
+        Args:
+            obj (bytes, io.BytesIO or str): The data, or the path of a local file.
+            filepath (str): The S3 path to upload to.
+            num_processes (int, optional): Number of tasks the parts are split
+                into. Defaults to the choice of :attr:`transfer_planner`.
+            resumable (bool): Whether to record the upload in a local manifest
+                and resume it from there. Defaults to False.
+        """
         original_filepath = filepath
         filepath = self._check_path(filepath)
         bucket = filepath.split("/")[0]
         key = "/".join(filepath.split("/")[1:])
-        part_size = 16 * 1024 * 1024  # 16 MB part size
 
+        if isinstance(obj, Path):
+            obj = str(obj)
         if isinstance(obj, bytes):
-            data = obj
+            file_size = len(obj)
         elif isinstance(obj, str) and os.path.isfile(obj):
-            with open(obj, "rb") as f:
-                data = f.read()
+            file_size = os.path.getsize(obj)
         elif isinstance(obj, io.BytesIO):
-            obj.seek(0)
-            data = obj.read()
+            file_size = obj.getbuffer().nbytes
         else:
             raise ValueError("Unsupported object type for upload")
 
-        file_size = len(data)
-        if file_size <= part_size * num_processes:
-            return self.put(data, original_filepath)
-        num_parts = ceil(file_size / part_size)
+        manifest = UploadManifest(bucket, key) if resumable else None
+        state = manifest.load() if manifest is not None else None
+        # A recorded upload can only be resumed with its own part size.
+        part_size = state["part_size"] if state is not None and state.get("size") == file_size else None
+        plan = self.transfer_planner.plan(file_size, num_processes=num_processes, part_size=part_size)
+        if not plan.multipart or aioboto3 is None:
+            return self.put(obj, original_filepath)
+
+        shm = None
+        if isinstance(obj, str):
+            source = ("file", os.path.abspath(obj))
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=file_size)
+            with memoryview(obj) if isinstance(obj, bytes) else obj.getbuffer() as view:
+                shm.buf[:file_size] = view
+            source = ("shm", shm.name)
+
+        try:
+            state = self._start_multipart_upload(bucket, key, plan, manifest, state)
+            start = time.perf_counter()
+            parts = self._upload_parts(bucket, key, source, state, plan, manifest)
+            self.transfer_planner.record(file_size, time.perf_counter() - start, plan.num_processes * plan.concurrency)
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        self._complete_multipart_upload(bucket, key, state["upload_id"], parts, manifest)
+
+    def _start_multipart_upload(
+        self,
+        bucket: str,
+        key: str,
+        plan: TransferPlan,
+        manifest: Optional[UploadManifest],
+        state: Optional[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Resume the upload recorded in ``state`` if it still matches ``plan``, or create a new one."""
+        log.debug(f"Uploading s3://{bucket}/{key}: {plan}")
+        if state is not None and state.get("size") == plan.size and state.get("part_size") == plan.part_size:
+            try:
+                state["parts"].update(self.list_parts(bucket, key, state["upload_id"]))
+                log.info(f"Resuming upload of s3://{bucket}/{key}: {len(state['parts'])} parts uploaded")
+                return state
+            except ClientError as e:
+                log.warning(f"Cannot resume upload of s3://{bucket}/{key}: {e}", rank0_only=False)
+        elif state is not None:
+            self._abort_multipart_upload(bucket, key, state["upload_id"])
+
         upload_id = self._client.create_multipart_upload(Bucket=bucket, Key=key)["UploadId"]
+        state = {"upload_id": upload_id, "size": plan.size, "part_size": plan.part_size, "parts": {}}
+        if manifest is not None:
+            manifest.save(state)
+        return state
 
-        part_numbers = np.array_split(np.arange(num_parts), num_processes)
-
-        with concurrent.futures.ProcessPoolExecutor(max_workers=num_processes) as executor:
-            args = []
-            for i in range(num_processes):
-                cur_parts = part_numbers[i].tolist()
-                cur_data = data[cur_parts[0] * part_size : min(cur_parts[-1] * part_size + part_size, file_size)]
-                args.append((cur_parts, upload_id, part_size, cur_data, bucket, key, self._s3_cred_info))
-            results = executor.map(upload_parts_to_s3, args)
-            parts = []
-            for result in results:
-                parts.extend(result)
-
-        parts = sorted(parts, key=lambda part: part["PartNumber"])
-        self._client.complete_multipart_upload(
-            Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
-        )
+    def _upload_parts(
+        self,
+        bucket: str,
+        key: str,
+        source: tuple[str, str],
+        state: dict[str, Any],
+        plan: TransferPlan,
+        manifest: Optional[UploadManifest],
+    ) -> list[dict[str, Any]]:
+        """Upload the parts of ``state`` in rounds until all are done, and return them sorted."""
+        upload_id, part_size = state["upload_id"], state["part_size"]
+        pending = list(range(ceil(state["size"] / part_size)))
+        done: dict[int, str] = {}
+        failed: dict[int, str] = {}
+        try:
+            for _ in range(self.max_attempt):
+                part_numbers = np.array_split(np.array(pending), min(plan.num_processes, len(pending)))
+                args = [
+                    (
+                        cur_parts.tolist(),
+                        upload_id,
+                        part_size,
+                        source,
+                        bucket,
+                        key,
+                        self._s3_cred_info,
+                        {
+                            number + 1: state["parts"][number + 1]
+                            for number in cur_parts
+                            if number + 1 in state["parts"]
+                        },
+                        plan.concurrency,
+                    )
+                    for cur_parts in part_numbers
+                ]
+                failed = {}
+                for parts, failed_parts in self.transfer_pool.map(upload_parts_to_s3, args):
+                    done.update((part["PartNumber"], part["ETag"]) for part in parts)
+                    failed.update(failed_parts)
+                if manifest is not None:
+                    manifest.save({**state, "parts": {**state["parts"], **done}})
+                if not failed or PERMANENT_UPLOAD_ERRORS.intersection(failed.values()):
+                    break
+                pending = [number - 1 for number in sorted(failed)]
+        except BaseException:
+            # The upload can only be picked up again through a manifest.
+            if manifest is None:
+                self._abort_multipart_upload(bucket, key, upload_id)
+            raise
+
+        if failed:
+            if manifest is None or PERMANENT_UPLOAD_ERRORS.intersection(failed.values()):
+                self._abort_multipart_upload(bucket, key, upload_id)
+                if manifest is not None:
+                    manifest.remove()
+            raise ConnectionError(
+                f"Failed to upload {len(failed)} parts of s3://{bucket}/{key}: {sorted(set(failed.values()))}"
+            )
+        return [{"PartNumber": number, "ETag": etag} for number, etag in sorted(done.items())]
+
+    def _complete_multipart_upload(
+        self,
+        bucket: str,
+        key: str,
+        upload_id: str,
+        parts: list[dict[str, Any]],
+        manifest: Optional[UploadManifest],
+    ) -> None:
+        """Complete the upload, or abort it if the failure cannot be resumed, like failed parts in :meth:`_upload_parts`."""
+        try:
+            self._client.complete_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException as e:
+            if manifest is None or _error_code(e) in PERMANENT_UPLOAD_ERRORS:
+                self._abort_multipart_upload(bucket, key, upload_id)
+                if manifest is not None:
+                    manifest.remove()
+            raise
+        if manifest is not None:
+            manifest.remove()
+
+    def _abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        try:
+            self._client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        except ClientError as e:
+            log.warning(f"Failed to abort upload {upload_id} of s3://{bucket}/{key}: {e}", rank0_only=False)
+
+    def list_parts(self, bucket: str, key: str, upload_id: str) -> dict[int, str]:
+        """
+        Lists the parts already uploaded for a multipart upload.
+
+        Args:
+            bucket (str): The S3 bucket name.
+            key (str): The S3 key of the uploaded object.
+            upload_id (str): The upload ID of the multipart upload.
+
+        Returns:
+            dict[int, str]: The ETags of the uploaded parts keyed by part number.
+        """
+        parts = {}
+        paginator = self._client.get_paginator("list_parts")
+        for page in paginator.paginate(Bucket=bucket, Key=key, UploadId=upload_id):
+            parts.update((part["PartNumber"], part["ETag"]) for part in page.get("Parts", []))
+        return parts
+
+    def stat(self, filepath: str) -> dict[str, Any]:
+        """
+        Returns the size, ETag and modification time of an object.
+
+        Args:
+            filepath (str): The S3 path of the object.
+
+        Returns:
+            dict: ``size`` in bytes, ``etag`` and ``mtime`` as a POSIX timestamp.
+
+        Raises:
+            FileNotFoundError: If the object does not exist.
+        """
+        filepath = self._check_path(filepath)
+        bucket = filepath.split("/")[0]
+        key = "/".join(filepath.split("/")[1:])
+        try:
+            response = self._client.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if _error_code(e) in ("404", "NoSuchKey"):
+                raise FileNotFoundError(f"s3://{filepath}") from e
+            raise
+        return {
+            "size": response["ContentLength"],
+            "etag": response["ETag"].strip('"'),
+            "mtime": response["LastModified"].timestamp(),
+        }
 
     def contains(self, filepath: str, max_retries=10) -> bool:
         """
@@ -521,6 +1568,67 @@ class Boto3Client:
         filepath = self._check_path(filepath)
         self._client.delete_object(Bucket=filepath.split("/")[0], Key="/".join(filepath.split("/")[1:]))
 
+    def delete_many(self, filepaths: Iterable[str]) -> dict[str, str]:
+        """
+        Deletes objects with batched ``delete_objects`` requests.
+
+        ``filepaths`` is consumed lazily: every ``DELETE_BATCH_SIZE`` keys of
+        a bucket are sent as one request, up to ``DELETE_THREADS`` requests at
+        once, while the rest of the paths are still being produced (e.g. by a
+        listing).
+
+        Args:
+            filepaths (Iterable[str]): The S3 paths of the objects to delete.
+
+        Returns:
+            dict[str, str]: ``"<code>: <message>"`` of every path that could not
+            be deleted. Missing objects are not errors.
+        """
+        errors: dict[str, str] = {}
+        batches: dict[str, list[str]] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=DELETE_THREADS) as executor:
+            pending: set[concurrent.futures.Future] = set()
+
+            def submit(bucket: str, keys: list[str]) -> None:
+                # Bound the number of queued batches, the paths may come from a huge listing.
+                while len(pending) >= 2 * DELETE_THREADS:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        errors.update(future.result())
+                pending.add(executor.submit(self._delete_batch, bucket, keys))
+
+            for filepath in filepaths:
+                filepath = self._check_path(filepath)
+                bucket = filepath.split("/")[0]
+                keys = batches.setdefault(bucket, [])
+                keys.append("/".join(filepath.split("/")[1:]))
+                if len(keys) >= DELETE_BATCH_SIZE:
+                    submit(bucket, batches.pop(bucket))
+            for bucket, keys in batches.items():
+                submit(bucket, keys)
+            for future in concurrent.futures.as_completed(pending):
+                errors.update(future.result())
+        return errors
+
+    def _delete_batch(self, bucket: str, keys: list[str]) -> dict[str, str]:
+        attempt = 0
+        while True:
+            try:
+                response = self._client.delete_objects(
+                    Bucket=bucket, Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True}
+                )
+                break
+            except Exception as e:
+                attempt += 1
+                log.error(f"Got an exception: attempt={attempt} - {e} - s3://{bucket}", rank0_only=False)
+                if attempt >= self.max_attempt:
+                    return {f"s3://{bucket}/{key}": f"{_error_code(e)}: {e}" for key in keys}
+        return {
+            f"s3://{bucket}/{error['Key']}": f"{error.get('Code')}: {error.get('Message')}"
+            for error in response.get("Errors", [])
+        }
+
     def ls_dir(self, filepath: str) -> Generator[str, None, None]:
         """
         List all folders in an S3 bucket with a given prefix.
@@ -556,6 +1664,54 @@ class Boto3Client:
             else:
                 break
 
+    def list_objects(self, filepath: str) -> Generator[tuple[str, int], None, None]:
+        """
+        List all keys in an S3 bucket with a given prefix, with their sizes.
+
+        Keys are yielded page by page as the listing proceeds.
+
+        Args:
+            filepath (str): The S3 path of the prefix to list.
+
+        Yields:
+            tuple[str, int]: The key relative to the prefix and the object size.
+        """
+        filepath = self._check_path(filepath)
+        bucket = filepath.split("/")[0]
+        prefix = "/".join(filepath.split("/")[1:])
+
+        paginator = self._client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for item in page.get("Contents", []):
+                yield item["Key"][len(prefix) :], item["Size"]
+
+    def list_parallel(
+        self, filepath: str, num_threads: Optional[int] = None, ordered: bool = True, metadata: bool = False
+    ) -> Generator[tuple, None, None]:
+        """
+        List all keys under a prefix with concurrent requests, see :class:`ParallelLister`.
+
+        Args:
+            filepath (str): The S3 path of the prefix to list.
+            num_threads (int, optional): Maximum number of concurrent requests.
+                Defaults to ``LIST_THREADS``.
+            ordered (bool): Whether to yield the keys in the order of :meth:`list_objects`.
+                Defaults to True.
+            metadata (bool): Whether to yield the ETag and the modification time as well.
+                Defaults to False.
+
+        Yields:
+            tuple: The key relative to the prefix and the object size, followed by
+            the ETag and the modification time if ``metadata`` is set.
+        """
+        filepath = self._check_path(filepath)
+        bucket = filepath.split("/")[0]
+        prefix = "/".join(filepath.split("/")[1:])
+
+        lister = ParallelLister(self._client, max_workers=num_threads or LIST_THREADS)
+        for entry in lister.list_objects(bucket, prefix, ordered=ordered, metadata=metadata):
+            yield (entry[0][len(prefix) :], *entry[1:])
+
     def list(self, filepath: str, exclude_prefix: Optional[str] = None) -> Generator[str, None, None]:
         """
         List all keys in an S3 bucket with a given prefix, excluding files that start with
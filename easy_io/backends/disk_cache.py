@@ -0,0 +1,380 @@
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+from collections.abc import Generator
+from typing import Callable, Optional
+
+from easy_io import log
+
+try:
+    import fcntl
+except ImportError:
+    # No file locks, e.g. on Windows: concurrent misses fetch independently.
+    fcntl = None
+
+DISK_CACHE_DIR = os.environ.get("EASY_IO_DISK_CACHE_DIR", os.path.expanduser("~/.cache/easy_io/data"))
+_TMP_PREFIX = ".tmp-"
+_LOCK_PREFIX = ".lock-"
+
+
+def _lock_file(f, path: str, operation: int) -> bool:
+    """``flock`` the open file ``f`` of ``path``; return False if ``path`` was removed or replaced before."""
+    fcntl.flock(f, operation)
+    try:
+        if os.stat(path).st_ino == os.fstat(f.fileno()).st_ino:
+            return True
+    except FileNotFoundError:
+        pass
+    fcntl.flock(f, fcntl.LOCK_UN)
+    return False
+
+
+def _remove_unpinned(path: str) -> bool:
+    """Remove the cache entry ``path`` unless it is pinned by :meth:`DiskCache.pin_file`; return whether it is gone."""
+    try:
+        entry = open(path, "rb")  # noqa: SIM115
+    except FileNotFoundError:
+        return True
+    with entry:
+        if fcntl is not None:
+            try:
+                fcntl.flock(entry, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+        with contextlib.suppress(FileNotFoundError):
+            # Readers that already opened the file keep reading it.
+            os.remove(path)
+    return True
+
+
+def _reap_lock(lock_path: str) -> None:
+    """Remove the fetch lock file ``lock_path`` unless a process holds or waits for it.
+
+    The file is only removed while holding its lock, and lockers check that
+    the file they locked is still the one under its name, so no two
+    processes can hold different files of the same name.
+    """
+    if fcntl is None:
+        # Without locks there is no safe moment; the files are empty.
+        return
+    try:
+        lock = open(lock_path, "rb")  # noqa: SIM115
+    except FileNotFoundError:
+        return
+    with lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(lock_path)
+
+
+class DiskCache:
+    """A read-through cache of remote objects on local disk.
+
+    Entries are named after the object URI together with its ETag and size,
+    so a changed object never matches an entry of an older version; the
+    older entry is dropped when the new one is written. Files are written to
+    a temporary name and renamed into place, so readers in any process only
+    ever see complete files.
+
+    The total size is bounded by ``max_bytes``. Every hit touches the
+    modification time of the entry, and when a write exceeds the budget the
+    least recently used entries are removed until the cache is back below
+    ``low_watermark`` of it. The directory can be shared by backends and
+    processes.
+
+    Misses are single-flight across processes on the node: :meth:`fetch` and
+    :meth:`fetch_file` take an exclusive file lock per entry, so when all
+    ranks of a job read the same object at once only one of them downloads
+    it and the others wait and read the finished file. A lock is released
+    by the OS if its holder dies, and the next waiter fetches instead. Lock
+    files are removed with their entry unless a process holds or waits for
+    them.
+
+    Args:
+        cache_dir (str, optional): Directory of the cache, ideally on a fast
+            local disk. Defaults to ``EASY_IO_DISK_CACHE_DIR`` or
+            ``~/.cache/easy_io/data``.
+        max_bytes (int): Size budget of the cache. Defaults to 64 GB.
+        low_watermark (float): Fraction of ``max_bytes`` an eviction frees
+            the cache down to. Defaults to 0.9.
+
+    Examples:
+        >>> cache = DiskCache('/local_nvme/easy_io', max_bytes=500 * 1024**3)
+        >>> path = cache.lookup('s3://bucket/shard-0.tar', etag='"9b2c..."', size=1048576)
+        >>> if path is None:
+        ...     path = cache.put_file('s3://bucket/shard-0.tar', '"9b2c..."', 1048576, download)
+        >>> data = cache.fetch('s3://bucket/shard-1.tar', '"77ae..."', 1048576, lambda: client.get(uri))
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 64 * 1024**3, low_watermark: float = 0.9):
+        self.cache_dir = cache_dir or DISK_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.low_watermark = low_watermark
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None  # bytes written as seen by this process, rescanned on eviction
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.coalesced = 0  # misses served by a fetch of another process or thread
+
+    def _paths(self, uri: str, etag: str, size: int) -> tuple[str, str]:
+        """Return the directory and the file name prefix of ``uri`` and the entry of this version."""
+        name = hashlib.sha256(uri.encode()).hexdigest()
+        version = hashlib.sha256(f"{etag}\0{size}".encode()).hexdigest()[:16]
+        directory = os.path.join(self.cache_dir, name[:2])
+        return directory, os.path.join(directory, f"{name}.{version}")
+
+    def lookup(self, uri: str, etag: str, size: int) -> Optional[str]:
+        """Return the path of the cached copy of this version of ``uri``, or None."""
+        _, path = self._paths(uri, etag, size)
+        try:
+            if os.path.getsize(path) == size:
+                # The modification time is the LRU clock shared by all processes.
+                os.utime(path)
+                with self._lock:
+                    self.hits += 1
+                return path
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def get(self, uri: str, etag: str, size: int) -> Optional[bytes]:
+        """Return the cached data of this version of ``uri``, or None."""
+        path = self.lookup(uri, etag, size)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            # Evicted by another process in the meantime.
+            return None
+
+    def put(self, uri: str, etag: str, size: int, data: bytes) -> str:
+        """Cache ``data`` as this version of ``uri`` and return the path of the entry."""
+
+        def write(tmp_path: str) -> None:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+
+        return self.put_file(uri, etag, size, write)
+
+    def put_file(self, uri: str, etag: str, size: int, fill: Callable[[str], None]) -> str:
+        """Cache this version of ``uri`` by calling ``fill`` with a temporary path to write it to.
+
+        Args:
+            uri (str): The remote path.
+            etag (str): The ETag or another validator of the object.
+            size (int): The object size in bytes.
+            fill (Callable[[str], None]): Writes the object to the given path,
+                e.g. a download function.
+
+        Returns:
+            str: The path of the cache entry.
+        """
+        directory, path = self._paths(uri, etag, size)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=_TMP_PREFIX, dir=directory)
+        os.close(fd)
+        try:
+            fill(tmp_path)
+            written = os.path.getsize(tmp_path)
+            if written != size:
+                raise OSError(f"Expected {size} bytes of {uri} but got {written}")  # noqa: TRY301
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+
+        # Drop older versions of the same object.
+        name = os.path.basename(path).rsplit(".", 1)[0]
+        freed = 0
+        for entry in os.scandir(directory):
+            if entry.name.startswith(name + ".") and entry.path != path:
+                with contextlib.suppress(FileNotFoundError):
+                    entry_size = entry.stat().st_size
+                    # A pinned version stays until a later eviction.
+                    if _remove_unpinned(entry.path):
+                        freed += entry_size
+        self._account(size - freed)
+        return path
+
+    @contextlib.contextmanager
+    def _single_flight(self, uri: str, etag: str, size: int) -> Generator[Optional[str], None, None]:
+        """Hold the fetch lock of this version of ``uri``; yield its path if it was fetched meanwhile."""
+        directory, path = self._paths(uri, etag, size)
+        os.makedirs(directory, exist_ok=True)
+        lock_path = os.path.join(directory, _LOCK_PREFIX + os.path.basename(path))
+        while True:
+            lock = open(lock_path, "ab")  # noqa: SIM115
+            if fcntl is None or _lock_file(lock, lock_path, fcntl.LOCK_EX):
+                break
+            # The lock file was reaped by an eviction after it was opened here, lock the new one.
+            lock.close()
+        with lock:
+            try:
+                fetched = None
+                with contextlib.suppress(FileNotFoundError):
+                    if os.path.getsize(path) == size:
+                        os.utime(path)
+                        fetched = path
+                        with self._lock:
+                            self.coalesced += 1
+                yield fetched
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def fetch_file(self, uri: str, etag: str, size: int, fill: Callable[[str], None]) -> str:
+        """Return the path of the cached copy of this version of ``uri``, fetching it on a miss.
+
+        Args:
+            uri (str): The remote path.
+            etag (str): The ETag or another validator of the object.
+            size (int): The object size in bytes.
+            fill (Callable[[str], None]): Downloads the object to the given
+                path. Only called by one process at a time.
+
+        Returns:
+            str: The path of the cache entry.
+        """
+        path = self.lookup(uri, etag, size)
+        if path is not None:
+            return path
+        with self._single_flight(uri, etag, size) as path:
+            return path if path is not None else self.put_file(uri, etag, size, fill)
+
+    @contextlib.contextmanager
+    def pin_file(self, uri: str, etag: str, size: int, fill: Callable[[str], None]) -> Generator[str, None, None]:
+        """Like :meth:`fetch_file`, but keep the entry from being evicted until the context exits.
+
+        A shared file lock is held on the entry, and :meth:`evict` in any
+        process skips entries it cannot lock exclusively, so the path can be
+        reopened inside the context.
+
+        Examples:
+            >>> with cache.pin_file('s3://bucket/model.pt', etag, size, download) as path:
+            ...     model = torch.load(path)
+        """
+        for _ in range(3):
+            path = self.fetch_file(uri, etag, size, fill)
+            try:
+                entry = open(path, "rb")  # noqa: SIM115
+            except FileNotFoundError:
+                # Evicted in the meantime.
+                continue
+            with entry:
+                if fcntl is not None and not _lock_file(entry, path, fcntl.LOCK_SH):
+                    continue
+                yield path
+                return
+        raise OSError(
+            f"{uri} is evicted from the disk cache {self.cache_dir} right after fetching, is max_bytes too small?"
+        )
+
+    def fetch(self, uri: str, etag: str, size: int, download: Callable[[], bytes]) -> bytes:
+        """Return the data of this version of ``uri``, downloading it on a miss.
+
+        Like :meth:`fetch_file`, but ``download`` returns the data, which is
+        handed back without reading it from disk again.
+        """
+        for _ in range(3):
+            path = self.lookup(uri, etag, size)
+            if path is None:
+                with self._single_flight(uri, etag, size) as path:
+                    if path is None:
+                        data = download()
+                        if len(data) == size:
+                            self.put(uri, etag, size, data)
+                        return data
+            try:
+                with open(path, "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                # Evicted by another process in the meantime.
+                continue
+        return download()
+
+    def _entries(self) -> Generator[os.DirEntry, None, None]:
+        if not os.path.isdir(self.cache_dir):
+            return
+        for subdir in os.scandir(self.cache_dir):
+            if subdir.is_dir():
+                # Skips temporary files and locks.
+                yield from (entry for entry in os.scandir(subdir.path) if not entry.name.startswith("."))
+
+    def _scan_size(self) -> int:
+        size = 0
+        for entry in self._entries():
+            with contextlib.suppress(FileNotFoundError):
+                size += entry.stat().st_size
+        return size
+
+    def _account(self, delta: int) -> None:
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += delta
+            if self._size <= self.max_bytes:
+                return
+        self.evict()
+
+    def evict(self, target_bytes: Optional[int] = None) -> int:
+        """Remove least recently used entries until the cache is below ``target_bytes``.
+
+        Args:
+            target_bytes (int, optional): Size to free the cache down to.
+                Defaults to ``low_watermark * max_bytes``.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        if target_bytes is None:
+            target_bytes = int(self.low_watermark * self.max_bytes)
+        entries = []
+        for entry in self._entries():
+            with contextlib.suppress(FileNotFoundError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= target_bytes:
+                break
+            if not _remove_unpinned(path):
+                continue
+            removed += 1
+            _reap_lock(os.path.join(os.path.dirname(path), _LOCK_PREFIX + os.path.basename(path)))
+            total -= size
+        with self._lock:
+            self._size = total
+            self.evictions += removed
+        if removed:
+            log.info(f"Evicted {removed} entries from the disk cache {self.cache_dir}")
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.evict(target_bytes=0)
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit, miss, coalesced miss and eviction counters of this process and the size of the cache."""
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "size": self._size,
+            }
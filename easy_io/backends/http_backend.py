@@ -1,17 +1,36 @@
 import os
+import shutil
 import tempfile
 from collections.abc import Generator
 from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
+from urllib.error import HTTPError
 from urllib.parse import urlparse
-from urllib.request import urlopen
+from urllib.request import Request, urlopen
 
 from easy_io.backends.base_backend import BaseStorageBackend
+from easy_io.backends.disk_cache import DiskCache
 
 
 class HTTPBackend(BaseStorageBackend):
-    """HTTP and HTTPS storage bachend."""
+    """HTTP and HTTPS storage bachend.
+
+    Args:
+        disk_cache_dir (str, optional): If set, :meth:`get` and
+            :meth:`get_local_path` read through a :class:`DiskCache` in this
+            directory. Responses are validated with a ``HEAD`` request by
+            their ``ETag`` (or ``Last-Modified``) and ``Content-Length``;
+            responses without them are not cached. Defaults to None.
+        disk_cache_max_bytes (int): Size budget of the disk cache.
+            Defaults to 64 GB.
+    """
+
+    def __init__(self, disk_cache_dir: Optional[str] = None, disk_cache_max_bytes: int = 64 * 1024**3):
+        self.disk_cache: Optional[DiskCache] = None
+        if disk_cache_dir is not None:
+            self.disk_cache = DiskCache(disk_cache_dir, max_bytes=disk_cache_max_bytes)
 
     @staticmethod
     def _validate_url(filepath: str) -> None:
@@ -34,7 +53,82 @@ class HTTPBackend(BaseStorageBackend):
             b'hello world'
         """
         self._validate_url(filepath)
-        return urlopen(filepath).read()  # noqa: S310
+        stat = self.stat(filepath) if self.disk_cache is not None else None
+        if stat is None or not self._cacheable(stat):
+            return urlopen(filepath).read()  # noqa: S310
+
+        validator = stat["etag"] or str(stat["mtime"])
+        return self.disk_cache.fetch(filepath, validator, stat["size"], lambda: urlopen(filepath).read())  # noqa: S310
+
+    def get_range(self, filepath: str, offset: int, length: int, etag: Optional[str] = None) -> bytes:
+        """Read ``length`` bytes at ``offset`` with a ``Range`` request.
+
+        Fewer bytes are returned at the end of the file. Servers that ignore
+        ``Range`` send the whole file, which is then cut. With ``etag``, e.g.
+        from :meth:`stat`, it is sent as ``If-Match`` and a
+        ``ConnectionError`` is raised if the file changed.
+
+        Examples:
+            >>> backend = HTTPBackend()
+            >>> backend.get_range('http://path/of/file', 6, 5)
+            b'world'
+        """
+        self._validate_url(filepath)
+        if offset < 0 or length < 0:
+            raise ValueError(f"Invalid range: offset={offset}, length={length}")
+        if length == 0:
+            return b""
+        if etag and etag.startswith("W/"):
+            # If-Match compares strong ETags only.
+            etag = None
+        headers = {"Range": f"bytes={offset}-{offset + length - 1}"}
+        if etag:
+            headers["If-Match"] = f'"{etag}"'
+        request = Request(filepath, headers=headers)  # noqa: S310
+        try:
+            with urlopen(request) as response:  # noqa: S310
+                if etag and response.headers.get("ETag", "").strip('"') not in ("", etag):
+                    # The server ignored If-Match.
+                    raise ConnectionError(f"{filepath} changed, its ETag is no longer {etag}")
+                if response.status == 206:
+                    return response.read()
+                return response.read()[offset : offset + length]
+        except HTTPError as e:
+            if e.code == 416:
+                # The range starts at or after the end of the file.
+                return b""
+            if e.code == 412:
+                raise ConnectionError(f"{filepath} changed, its ETag is no longer {etag}") from e
+            raise
+
+    def stat(self, filepath: str) -> dict:
+        """Return the size, ETag and modification time of a file from a ``HEAD`` request.
+
+        Args:
+            filepath (str): Path of the file.
+
+        Returns:
+            dict: ``size`` in bytes (-1 if unknown), ``etag`` (empty if
+            unknown) and ``mtime`` as a POSIX timestamp (0 if unknown).
+
+        Examples:
+            >>> backend = HTTPBackend()
+            >>> backend.stat('http://path/of/file')
+            {'size': 11, 'etag': '5eb63bbbe01eeed093cb22bb8f5acdc3', 'mtime': 1760000000.0}
+        """
+        self._validate_url(filepath)
+        with urlopen(Request(filepath, method="HEAD")) as response:  # noqa: S310
+            headers = response.headers
+        last_modified = headers.get("Last-Modified")
+        return {
+            "size": int(headers.get("Content-Length", -1)),
+            "etag": headers.get("ETag", "").strip('"'),
+            "mtime": parsedate_to_datetime(last_modified).timestamp() if last_modified else 0.0,
+        }
+
+    @staticmethod
+    def _cacheable(stat: dict) -> bool:
+        return stat["size"] >= 0 and bool(stat["etag"] or stat["mtime"])
 
     def get_text(self, filepath, encoding="utf-8") -> str:
         """Read text from a given ``filepath``.
@@ -52,8 +146,7 @@ class HTTPBackend(BaseStorageBackend):
             >>> backend.get_text('http://path/of/file')
             'hello world'
         """
-        self._validate_url(filepath)
-        return urlopen(filepath).read().decode(encoding)  # noqa: S310
+        return self.get(filepath).decode(encoding)
 
     @contextmanager
     def get_local_path(self, filepath: str) -> Generator[Union[str, Path], None, None]:
@@ -64,6 +157,10 @@ class HTTPBackend(BaseStorageBackend):
         can be called with ``with`` statement, and when exists from the
         ``with`` statement, the temporary path will be released.
 
+        With a disk cache, the path of the cached file is yielded instead and
+        kept after the ``with`` statement; it must not be modified. No process
+        evicts it while the ``with`` statement runs.
+
         Args:
             filepath (str): Download a file from ``filepath``.
 
@@ -77,6 +174,20 @@ class HTTPBackend(BaseStorageBackend):
             >>> with backend.get_local_path('http://path/of/file') as path:
             ...     # do something here
         """
+        stat = self.stat(filepath) if self.disk_cache is not None else None
+        if stat is not None and self._cacheable(stat):
+
+            def download(tmp_path: str) -> None:
+                with urlopen(filepath) as response, open(tmp_path, "wb") as f:  # noqa: S310
+                    shutil.copyfileobj(response, f, 1024 * 1024)
+
+            # The cached file itself is yielded, it must not be modified.
+            with self.disk_cache.pin_file(
+                filepath, stat["etag"] or str(stat["mtime"]), stat["size"], download
+            ) as cached_path:
+                yield cached_path
+            return
+
         temp_path = None
         try:
             with tempfile.NamedTemporaryFile(delete=False) as temp_file:
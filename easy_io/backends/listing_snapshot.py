@@ -0,0 +1,247 @@
+import bisect
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional, Union
+
+import numpy as np
+
+LISTING_SNAPSHOT_DIR = os.environ.get("EASY_IO_LISTING_SNAPSHOT_DIR", os.path.expanduser("~/.cache/easy_io/listings"))
+MAGIC = b"EIOLIST1"
+FORMAT_VERSION = 1
+WRITE_CHUNK = 65536  # entries buffered per column while writing
+_COLUMNS = {
+    "keys": np.uint8,
+    "key_offsets": np.int64,
+    "sizes": np.int64,
+    "mtimes": np.float64,
+    "etags": np.uint8,
+    "etag_offsets": np.int64,
+}
+
+
+class _Keys:
+    """Sequence view of the encoded keys, for :mod:`bisect`."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> bytes:
+        return self._blob[self._offsets[i] : self._offsets[i + 1]].tobytes()
+
+
+class ListingSnapshot:
+    """A listing of a prefix saved to disk as sorted columnar arrays.
+
+    Keys (relative to the listed prefix), sizes, modification times and
+    ETags are stored in one file that is opened with ``mmap``, so loading a
+    snapshot of millions of keys reads only the pages that are used. Keys
+    are sorted, which makes prefix filtering a binary search; suffix
+    filtering is vectorized over the key bytes.
+
+    A snapshot records when it was created and an optional version string,
+    which :meth:`is_fresh` checks against a TTL or an expected version.
+
+    Args:
+        path (str): Path of the snapshot file, see :meth:`write`.
+
+    Examples:
+        >>> ListingSnapshot.write('/tmp/listing', backend._client.list_parallel('s3://bucket/data/'))
+        >>> snapshot = ListingSnapshot('/tmp/listing')
+        >>> snapshot.is_fresh(ttl=3600)
+        True
+        >>> list(snapshot.keys(prefix='train/', suffix='.tar'))
+        ['train/00000.tar', 'train/00001.tar']
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a listing snapshot")
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size))
+        if header["format"] != FORMAT_VERSION:
+            raise ValueError(f"{path} has unsupported snapshot format {header['format']}")
+        self.prefix: str = header["prefix"]
+        self.version: Optional[str] = header["version"]
+        self.created: float = header["created"]
+
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        columns = {}
+        for name, (offset, nbytes) in header["columns"].items():
+            columns[name] = data[offset : offset + nbytes].view(_COLUMNS[name])
+        self._key_blob = columns["keys"]
+        self._key_offsets = columns["key_offsets"]
+        self.sizes: np.ndarray = columns["sizes"]
+        self.mtimes: np.ndarray = columns["mtimes"]
+        self._etag_blob = columns["etags"]
+        self._etag_offsets = columns["etag_offsets"]
+        self._keys = _Keys(self._key_blob, self._key_offsets)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def total_size(self) -> int:
+        """int: Sum of the object sizes."""
+        return int(self.sizes.sum())
+
+    def is_fresh(self, ttl: Optional[float] = None, version: Optional[str] = None) -> bool:
+        """Whether the snapshot is younger than ``ttl`` seconds and has ``version``, where given."""
+        if version is not None and version != self.version:
+            return False
+        return ttl is None or time.time() - self.created <= ttl
+
+    def key(self, i: int) -> str:
+        return self._keys[i].decode()
+
+    def etag(self, i: int) -> str:
+        return self._etag_blob[self._etag_offsets[i] : self._etag_offsets[i + 1]].tobytes().decode()
+
+    def indices(self, prefix: str = "", suffix: Optional[Union[str, tuple[str, ...]]] = None) -> np.ndarray:
+        """Return the sorted indices of the keys that start with ``prefix`` and end with ``suffix``."""
+        encoded = prefix.encode()
+        # UTF-8 never contains 0xff, so every key starting with ``prefix`` sorts below it.
+        start = bisect.bisect_left(self._keys, encoded)
+        stop = bisect.bisect_left(self._keys, encoded + b"\xff", lo=start) if encoded else len(self)
+        indices = np.arange(start, stop, dtype=np.int64)
+        if suffix is None:
+            return indices
+
+        ends = self._key_offsets[start + 1 : stop + 1]
+        lengths = ends - self._key_offsets[start:stop]
+        mask = np.zeros(len(indices), dtype=bool)
+        for s in (suffix,) if isinstance(suffix, str) else suffix:
+            s = s.encode()
+            match = lengths >= len(s)
+            for j, byte in enumerate(s):
+                match[match] &= self._key_blob[ends[match] - len(s) + j] == byte
+            mask |= match
+        return indices[mask]
+
+    def keys(self, prefix: str = "", suffix: Optional[Union[str, tuple[str, ...]]] = None) -> Iterator[str]:
+        """Yield the keys, relative to :attr:`prefix`, filtered as in :meth:`indices`."""
+        for i in self.indices(prefix, suffix):
+            yield self.key(i)
+
+    def entries(self, prefix: str = "", suffix: Optional[Union[str, tuple[str, ...]]] = None) -> Iterator[tuple]:
+        """Yield ``(key, size, etag, mtime)`` tuples, filtered as in :meth:`indices`."""
+        for i in self.indices(prefix, suffix):
+            yield self.key(i), int(self.sizes[i]), self.etag(i), float(self.mtimes[i])
+
+    @staticmethod
+    def default_path(uri: str, snapshot_dir: Optional[str] = None) -> str:
+        """Return the path of the snapshot of ``uri`` in ``snapshot_dir``."""
+        name = hashlib.sha1(uri.encode()).hexdigest()  # noqa: S324
+        return os.path.join(snapshot_dir or LISTING_SNAPSHOT_DIR, f"{name}.listing")
+
+    @staticmethod
+    def write(
+        path: str,
+        entries: Iterable[tuple[Any, ...]],
+        prefix: str = "",
+        version: Optional[str] = None,
+    ) -> "ListingSnapshot":
+        """Save a listing to ``path``.
+
+        The entries are streamed into per-column temporary files, so the
+        listing is never held in memory. The file is replaced atomically.
+
+        Args:
+            path (str): Path of the snapshot file.
+            entries (Iterable[tuple]): ``(key, size, etag, mtime)`` tuples,
+                sorted by key. ``etag`` and ``mtime`` may be missing.
+            prefix (str): The listed prefix, for reference.
+            version (str, optional): Version of the listed data, checked by
+                :meth:`is_fresh`.
+
+        Returns:
+            ListingSnapshot: The written snapshot.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=directory) as tmp:
+            with contextlib.ExitStack() as stack:
+                files = {name: stack.enter_context(open(os.path.join(tmp, name), "wb")) for name in _COLUMNS}
+                ListingSnapshot._write_columns(files, entries)
+
+            header: dict[str, Any] = {
+                "format": FORMAT_VERSION,
+                "prefix": prefix,
+                "version": version,
+                "created": time.time(),
+                "columns": {},
+            }
+            # The header is written last but placed first; reserve room for the offsets.
+            offset = len(MAGIC) + 8 + len(json.dumps(header)) + 64 * len(_COLUMNS)
+            for name in _COLUMNS:
+                offset += -offset % 8
+                nbytes = os.path.getsize(os.path.join(tmp, name))
+                header["columns"][name] = [offset, nbytes]
+                offset += nbytes
+            encoded = json.dumps(header).encode()
+            data_start = header["columns"]["keys"][0]
+
+            tmp_path = os.path.join(tmp, "snapshot")
+            with open(tmp_path, "wb") as out:
+                out.write(MAGIC + len(encoded).to_bytes(8, "little") + encoded)
+                for name in _COLUMNS:
+                    out.write(b"\0" * (header["columns"][name][0] - out.tell()))
+                    with open(os.path.join(tmp, name), "rb") as f:
+                        while chunk := f.read(1 << 20):
+                            out.write(chunk)
+            assert len(MAGIC) + 8 + len(encoded) <= data_start
+            os.replace(tmp_path, path)
+        return ListingSnapshot(path)
+
+    @staticmethod
+    def _write_columns(files: dict, entries: Iterable[tuple[Any, ...]]) -> None:
+        key_end = etag_end = 0
+        last_key = None
+        np.zeros(1, dtype=np.int64).tofile(files["key_offsets"])
+        np.zeros(1, dtype=np.int64).tofile(files["etag_offsets"])
+
+        chunk: list[tuple[Any, ...]] = []
+
+        def flush() -> None:
+            nonlocal key_end, etag_end
+            keys = [entry[0].encode() for entry in chunk]
+            etags = [(entry[2] if len(entry) > 2 and entry[2] else "").strip('"').encode() for entry in chunk]
+            files["keys"].write(b"".join(keys))
+            files["etags"].write(b"".join(etags))
+            key_offsets = key_end + np.cumsum([len(key) for key in keys], dtype=np.int64)
+            etag_offsets = etag_end + np.cumsum([len(etag) for etag in etags], dtype=np.int64)
+            key_offsets.tofile(files["key_offsets"])
+            etag_offsets.tofile(files["etag_offsets"])
+            key_end, etag_end = int(key_offsets[-1]), int(etag_offsets[-1])
+            np.array([entry[1] for entry in chunk], dtype=np.int64).tofile(files["sizes"])
+            mtimes = [_timestamp(entry[3]) if len(entry) > 3 else 0.0 for entry in chunk]
+            np.array(mtimes, dtype=np.float64).tofile(files["mtimes"])
+            chunk.clear()
+
+        for entry in entries:
+            if last_key is not None and entry[0].encode() <= last_key:
+                raise ValueError(f"listing is not sorted: {entry[0]!r} after {last_key.decode()!r}")
+            last_key = entry[0].encode()
+            chunk.append(entry)
+            if len(chunk) == WRITE_CHUNK:
+                flush()
+        if chunk:
+            flush()
+
+
+def _timestamp(mtime: Any) -> float:
+    if mtime is None:
+        return 0.0
+    if hasattr(mtime, "timestamp"):
+        return mtime.timestamp()
+    return float(mtime)
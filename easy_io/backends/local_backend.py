@@ -1,13 +1,121 @@
+import concurrent.futures
+import errno
 import io
 import os
 import os.path as osp
 import shutil
-from collections.abc import Generator, Iterator
+from collections.abc import Generator, Iterator, Sequence
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Union
 
 from easy_io.backends.base_backend import BaseStorageBackend, mkdir_or_exist
+from easy_io.buffers import map_file
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+COPY_THREADS = 16  # concurrent file copies of ``copytree``
+COPY_CHUNK_SIZE = 1024 * 1024 * 1024  # bytes per copy_file_range / sendfile call
+FICLONE = 0x40049409  # ioctl cloning a whole file on Linux (Btrfs, XFS, ...)
+
+# Errors of a kernel copy that mean the files do not support it, not that the copy failed.
+_UNSUPPORTED_COPY_ERRORS = frozenset(
+    getattr(errno, name)
+    for name in ("ENOSYS", "EXDEV", "EINVAL", "ENOTSUP", "EOPNOTSUPP", "ENOTTY")
+    if hasattr(errno, name)
+)
+
+
+def _pread(f: io.BufferedReader, offset: int, length: int) -> bytes:
+    if offset < 0 or length < 0:
+        raise ValueError(f"Invalid range: offset={offset}, length={length}")
+    if not hasattr(os, "pread"):
+        f.seek(offset)
+        return f.read(length)
+    chunks = []
+    while length > 0:
+        # A single pread returns at most ~2 GB on Linux.
+        chunk = os.pread(f.fileno(), length, offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        offset += len(chunk)
+        length -= len(chunk)
+    return b"".join(chunks)
+
+
+def _reflink(src_fd: int, dst_fd: int, size: int) -> None:
+    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int) -> None:
+    offset = 0
+    while offset < size:
+        copied = os.copy_file_range(src_fd, dst_fd, min(size - offset, COPY_CHUNK_SIZE), offset, offset)
+        if copied == 0:
+            break
+        offset += copied
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int) -> None:
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, min(size - offset, COPY_CHUNK_SIZE))
+        if sent == 0:
+            break
+        offset += sent
+
+
+def _copy_engines() -> list:
+    engines = []
+    if fcntl is not None and hasattr(fcntl, "ioctl") and os.uname().sysname == "Linux":
+        engines.append(("reflink", _reflink, _UNSUPPORTED_COPY_ERRORS))
+    if hasattr(os, "copy_file_range"):
+        # Seccomp profiles of container runtimes that predate the syscall deny it with EPERM.
+        engines.append(("copy_file_range", _copy_file_range, _UNSUPPORTED_COPY_ERRORS | {errno.EPERM}))
+    if hasattr(os, "sendfile") and os.uname().sysname == "Linux":
+        # Only Linux can sendfile into a regular file.
+        engines.append(("sendfile", _sendfile, _UNSUPPORTED_COPY_ERRORS))
+    return engines
+
+
+_COPY_ENGINES = _copy_engines() if hasattr(os, "uname") else []
+
+
+def _copy_file(src: Union[str, Path], dst: Union[str, Path]) -> str:
+    """Copy the data of ``src`` to ``dst`` in the kernel where possible.
+
+    The engines are tried in order: a reflink clone, which shares the blocks
+    on copy-on-write filesystems and is instant, ``copy_file_range``, which
+    copies in the kernel and lets the filesystem or NFS server copy
+    server-side, ``sendfile`` and a buffered copy through user space. An
+    engine is skipped when the files do not support it.
+
+    Returns:
+        str: Name of the engine that copied the data.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        # Files like those in /proc report size 0, read them to the end.
+        if size > 0:
+            for name, engine, unsupported_errors in _COPY_ENGINES:
+                try:
+                    engine(fsrc.fileno(), fdst.fileno(), size)
+                except OSError as e:
+                    if e.errno not in unsupported_errors:
+                        raise
+                else:
+                    # Some filesystems report success but copy nothing.
+                    if os.fstat(fdst.fileno()).st_size == size:
+                        return name
+                # Drop anything the engine wrote before the next one starts over.
+                fdst.truncate(0)
+        fdst.seek(0)
+        shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+    return "buffered"
 
 
 class LocalBackend(BaseStorageBackend):
@@ -15,25 +123,56 @@ class LocalBackend(BaseStorageBackend):
 
     _allow_symlink = True
 
-    def get(self, filepath: Union[str, Path]) -> bytes:
+    def get(self, filepath: Union[str, Path], mmap: bool = False) -> Union[bytes, memoryview]:
         """Read bytes from a given ``filepath`` with 'rb' mode.
 
         Args:
             filepath (str or Path): Path to read data.
+            mmap (bool): Whether to map the file into memory and return a
+                read-only ``memoryview`` of it instead of reading it, which
+                copies nothing, see :func:`easy_io.buffers.map_file`.
+                Defaults to False.
 
         Returns:
-            bytes: Expected bytes object.
+            bytes or memoryview: Expected bytes object, or the view of the
+            mapped file.
 
         Examples:
             >>> backend = LocalBackend()
             >>> filepath = '/path/of/file'
             >>> backend.get(filepath)
             b'hello world'
+            >>> np.frombuffer(backend.get('/path/of/array.bin', mmap=True), dtype=np.float32)
         """
+        if mmap:
+            return map_file(filepath)
         with open(filepath, "rb") as f:
             value = f.read()
         return value
 
+    def get_range(self, filepath: Union[str, Path], offset: int, length: int) -> bytes:
+        """Read ``length`` bytes at ``offset`` of ``filepath`` with ``pread``.
+
+        Fewer bytes are returned at the end of the file.
+
+        Examples:
+            >>> backend = LocalBackend()
+            >>> backend.get_range('/path/of/file', 6, 5)
+            b'world'
+        """
+        return self.get_ranges(filepath, [(offset, length)])[0]
+
+    def get_ranges(self, filepath: Union[str, Path], ranges: Sequence[tuple[int, int]]) -> list[bytes]:
+        """Read several ``(offset, length)`` ranges of ``filepath`` with one open file.
+
+        Examples:
+            >>> backend = LocalBackend()
+            >>> backend.get_ranges('/path/of/file', [(0, 5), (6, 5)])
+            [b'hello', b'world']
+        """
+        with open(filepath, "rb") as f:
+            return [_pread(f, offset, length) for offset, length in ranges]
+
     def get_text(self, filepath: Union[str, Path], encoding: str = "utf-8") -> str:
         """Read text from a given ``filepath`` with 'r' mode.
 
@@ -154,6 +293,24 @@ class LocalBackend(BaseStorageBackend):
         """
         return osp.isfile(filepath)
 
+    def stat(self, filepath: Union[str, Path]) -> dict:
+        """Return the size and modification time of a file.
+
+        Args:
+            filepath (str or Path): Path of the file.
+
+        Returns:
+            dict: ``size`` in bytes, ``etag`` (always empty for local files)
+            and ``mtime`` as a POSIX timestamp.
+
+        Examples:
+            >>> backend = LocalBackend()
+            >>> backend.stat('/path/of/file')
+            {'size': 11, 'etag': '', 'mtime': 1760000000.123456}
+        """
+        stat = os.stat(filepath)
+        return {"size": stat.st_size, "etag": "", "mtime": stat.st_mtime_ns / 1e9}
+
     def join_path(self, filepath: Union[str, Path], *filepaths: Union[str, Path]) -> str:
         r"""Concatenate all file paths.
 
@@ -233,23 +390,34 @@ class LocalBackend(BaseStorageBackend):
             >>> backend.copyfile(src, dst)
             '/path1/of/dir/file'
         """
-        return shutil.copy(src, dst)
+        if osp.isdir(dst):
+            dst = osp.join(dst, osp.basename(src))
+        if osp.exists(dst) and osp.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        _copy_file(src, dst)
+        shutil.copymode(src, dst)
+        return dst
 
     def copytree(
         self,
         src: Union[str, Path],
         dst: Union[str, Path],
+        max_workers: int = COPY_THREADS,
     ) -> str:
         """Recursively copy an entire directory tree rooted at src to a
         directory named dst and return the destination directory.
 
         src and dst should have the same prefix and dst must not already exist.
+        Files are copied ``max_workers`` at a time while the tree is walked,
+        like :meth:`copyfile`, and keep their permission bits and times.
 
         TODO: Whether to support dirs_exist_ok parameter.
 
         Args:
             src (str or Path): A directory to be copied.
             dst (str or Path): Copy directory to dst.
+            max_workers (int): Number of concurrent file copies.
+                Defaults to 16.
 
         Returns:
             str: The destination directory.
@@ -265,7 +433,35 @@ class LocalBackend(BaseStorageBackend):
             >>> backend.copytree(src, dst)
             '/path/of/dir2'
         """
-        return shutil.copytree(src, dst)
+        os.makedirs(dst)
+        dirs = [(src, dst)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix="easy_io_copy") as executor:
+            futures = []
+            try:
+                # Symlinks are followed, like shutil.copytree does by default.
+                for root, dirnames, filenames in os.walk(src, followlinks=True):
+                    target = osp.join(dst, osp.relpath(root, src))
+                    for dirname in dirnames:
+                        os.makedirs(osp.join(target, dirname), exist_ok=True)
+                        dirs.append((osp.join(root, dirname), osp.join(target, dirname)))
+                    for filename in filenames:
+                        futures.append(
+                            executor.submit(self._copy_with_stat, osp.join(root, filename), osp.join(target, filename))
+                        )
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+        # Deepest first, so read-only directories are restricted after their contents are copied.
+        for src_dir, dst_dir in reversed(dirs):
+            shutil.copystat(src_dir, dst_dir)
+        return dst
+
+    @staticmethod
+    def _copy_with_stat(src: str, dst: str) -> None:
+        _copy_file(src, dst)
+        shutil.copystat(src, dst)
 
     def copyfile_from_local(
         self,
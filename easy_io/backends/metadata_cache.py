@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class MetadataCache:
+    """A TTL and LRU cache of path metadata such as ``exists`` or ``isdir``.
+
+    Object stores answer these questions with a request each, which
+    dominates when e.g. a data loader checks every sample path. Negative
+    answers are cached too. Backends invalidate a path, and all its parent
+    directories, whenever they write or delete it.
+
+    Args:
+        ttl (float): Seconds a positive answer stays valid. Defaults to 60.
+        negative_ttl (float, optional): Seconds a negative answer stays
+            valid. Defaults to ``ttl``.
+        max_entries (int): Maximum number of cached answers. The least
+            recently used ones are evicted first. Defaults to 100000.
+
+    Examples:
+        >>> cache = MetadataCache(ttl=30)
+        >>> cache.lookup('isfile', 's3://bucket/file', lambda: True)
+        True
+        >>> cache.lookup('isfile', 's3://bucket/file', lambda: False)  # cached
+        True
+        >>> cache.stats()
+        {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1}
+    """
+
+    def __init__(self, ttl: float = 60.0, negative_ttl: Optional[float] = None, max_entries: int = 100_000):
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[bool, float]] = OrderedDict()
+        self._kinds: set[str] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return str(path).rstrip("/")
+
+    def get(self, kind: str, path: str) -> Optional[bool]:
+        """Return the cached answer of ``kind`` for ``path``, or None on a miss."""
+        key = (kind, self._key(path))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, kind: str, path: str, value: bool) -> None:
+        ttl = self.ttl if value else self.negative_ttl
+        if ttl <= 0:
+            return
+        key = (kind, self._key(path))
+        with self._lock:
+            self._kinds.add(kind)
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def lookup(self, kind: str, path: str, fetch: Callable[[], bool]) -> bool:
+        """Return the cached answer, or call ``fetch`` and cache its result."""
+        value = self.get(kind, path)
+        if value is None:
+            value = bool(fetch())
+            self.put(kind, path, value)
+        return value
+
+    def _drop(self, path: str) -> None:
+        for kind in self._kinds:
+            self._entries.pop((kind, path), None)
+
+    def _drop_parents(self, path: str) -> None:
+        while "/" in path:
+            path = path.rsplit("/", 1)[0]
+            self._drop(path)
+
+    def invalidate(self, path: str) -> None:
+        """Forget ``path`` and its parent directories after it was written or deleted."""
+        path = self._key(path)
+        with self._lock:
+            self._drop(path)
+            self._drop_parents(path)
+
+    def invalidate_tree(self, path: str) -> None:
+        """Forget everything under the directory ``path``, the directory and its parents."""
+        path = self._key(path)
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == path or key[1].startswith(path + "/")]:
+                del self._entries[key]
+            self._drop_parents(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit, miss and eviction counters and the current size."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._entries)}
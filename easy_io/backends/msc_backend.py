@@ -1,9 +1,10 @@
 import copy
+import functools
 import io
 import os
 import re
 import tempfile
-from collections.abc import Generator, Iterator
+from collections.abc import Callable, Generator, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from shutil import SameFileError
@@ -11,12 +12,18 @@ from typing import Optional, Union
 
 try:
     from multistorageclient import StorageClient, StorageClientConfig
+    from multistorageclient.types import Range
 except ImportError:
     StorageClient = None
     StorageClientConfig = None
+    Range = None
 
 from easy_io import log
 from easy_io.backends.base_backend import BaseStorageBackend, mkdir_or_exist
+from easy_io.backends.disk_cache import DiskCache
+from easy_io.backends.metadata_cache import MetadataCache
+from easy_io.backends.tree_transfer import TreeTransfer
+from easy_io.remote_io import TempFileWriter
 
 # {scheme}://
 _URL_PREFIX_REGEX = r"[a-zA-Z0-9+.-]*:\/\/"
@@ -43,7 +50,18 @@ class MSCBackend(BaseStorageBackend):
     _storage_client: StorageClient
     _path_mapping: dict[str, str]
 
-    def __init__(self, config_path: str, profile: str, path_mapping: Optional[dict[str, str]] = None):
+    def __init__(
+        self,
+        config_path: str,
+        profile: str,
+        path_mapping: Optional[dict[str, str]] = None,
+        tree_workers: int = 32,
+        tree_max_bytes_in_flight: int = 1024 * 1024 * 1024,
+        metadata_cache_ttl: Optional[float] = None,
+        metadata_cache_size: int = 100_000,
+        disk_cache_dir: Optional[str] = None,
+        disk_cache_max_bytes: int = 64 * 1024**3,
+    ):
         """Initialize a backend.
 
         Args:
@@ -52,6 +70,18 @@ class MSCBackend(BaseStorageBackend):
             path_mapping (dict, optional): Path mapping dict from src path to dst path.
                 When ``path_mapping={'src': 'dst'}``, ``src`` in ``filepath`` will be replaced by ``dst``.
                 Doesn't apply to the local path in ``copy{file,tree}_{from,to}_local`` methods.
+            tree_workers (int): Maximum number of concurrent file transfers of
+                ``copytree_{from,to}_local``. Defaults to 32.
+            tree_max_bytes_in_flight (int): Maximum total size of the files
+                these methods transfer at once. Defaults to 1 GB.
+            metadata_cache_ttl (float, optional): If set, answers of ``exists``,
+                ``isfile`` and ``isdir`` are cached in ``metadata_cache`` for this many
+                seconds. Writes and deletes through this backend invalidate them. Defaults to None.
+            metadata_cache_size (int): Maximum number of cached answers. Defaults to 100000.
+            disk_cache_dir (str, optional): If set, ``get`` and ``get_local_path`` read through a
+                ``DiskCache`` in this directory, validated by ETag (or modification time) and size.
+                Processes sharing the directory download each object once. Defaults to None.
+            disk_cache_max_bytes (int): Size budget of the disk cache. Defaults to 64 GB.
         """
         # easy_io needs backend args to be JSON-serializable for backend instance cache keys.
         #
@@ -65,6 +95,27 @@ class MSCBackend(BaseStorageBackend):
         self._path_mapping = {} if path_mapping is None else copy.deepcopy(path_mapping)
         for src, dst in self._path_mapping.items():
             log.critical(f"Path mapping: {src} -> {dst}", rank0_only=False)
+        self.tree_transfer = TreeTransfer(max_workers=tree_workers, max_bytes_in_flight=tree_max_bytes_in_flight)
+        self.metadata_cache: Optional[MetadataCache] = None
+        if metadata_cache_ttl is not None:
+            self.metadata_cache = MetadataCache(ttl=metadata_cache_ttl, max_entries=metadata_cache_size)
+        self.disk_cache: Optional[DiskCache] = None
+        if disk_cache_dir is not None:
+            self.disk_cache = DiskCache(disk_cache_dir, max_bytes=disk_cache_max_bytes)
+
+    def _cached(self, kind: str, path: str, fetch: Callable[[], bool]) -> bool:
+        if self.metadata_cache is None:
+            return fetch()
+        return self.metadata_cache.lookup(kind, path, fetch)
+
+    def _invalidate(self, filepath: Union[str, Path], tree: bool = False) -> None:
+        """Drop cached metadata of ``filepath`` after writing or deleting it."""
+        if self.metadata_cache is not None:
+            path = self._translate_filepath(filepath=filepath)
+            if tree:
+                self.metadata_cache.invalidate_tree(path)
+            else:
+                self.metadata_cache.invalidate(path)
 
     def _translate_filepath(self, filepath: Union[str, Path], translate_url: bool = True) -> str:
         """Translate a `filepath` to a string.
@@ -120,7 +171,49 @@ class MSCBackend(BaseStorageBackend):
             b'hello world'
         """
         path = self._translate_filepath(filepath=filepath)
-        return self._storage_client.read(path=path)
+        if self.disk_cache is None:
+            return self._storage_client.read(path=path)
+
+        stat = self.stat(filepath)
+        validator = stat["etag"] or str(stat["mtime"])
+        return self.disk_cache.fetch(path, validator, stat["size"], lambda: self._storage_client.read(path=path))
+
+    def get_range(self, filepath: Union[str, Path], offset: int, length: int) -> bytes:
+        """Read ``length`` bytes at ``offset`` of ``filepath`` with a ranged read of the storage provider.
+
+        Examples:
+            >>> backend = MSCBackend()
+            >>> backend.get_range("path/of/file", 6, 5)
+            b'world'
+        """
+        if offset < 0 or length < 0:
+            raise ValueError(f"Invalid range: offset={offset}, length={length}")
+        if length == 0:
+            return b""
+        path = self._translate_filepath(filepath=filepath)
+        return self._storage_client.read(path=path, byte_range=Range(offset=offset, size=length))
+
+    def stat(self, filepath: Union[str, Path]) -> dict:
+        """Return the size, ETag and modification time of a file.
+
+        Args:
+            filepath (str or Path): Path of the file.
+
+        Returns:
+            dict: ``size`` in bytes, ``etag`` (empty if the storage provides
+            none) and ``mtime`` as a POSIX timestamp.
+
+        Examples:
+            >>> backend = MSCBackend()
+            >>> backend.stat("path/of/file")
+            {'size': 11, 'etag': '5eb63bbbe01eeed093cb22bb8f5acdc3', 'mtime': 1760000000.0}
+        """
+        metadata = self._storage_client.info(path=self._translate_filepath(filepath=filepath), strict=True)
+        return {
+            "size": metadata.content_length,
+            "etag": (metadata.etag or "").strip('"'),
+            "mtime": metadata.last_modified.timestamp(),
+        }
 
     def get_text(
         self,
@@ -166,6 +259,29 @@ class MSCBackend(BaseStorageBackend):
 
         path = self._translate_filepath(filepath=filepath)
         self._storage_client.write(path=path, body=obj)
+        self._invalidate(filepath)
+
+    def open_write(self, filepath: Union[str, Path]) -> TempFileWriter:
+        """Open ``filepath`` for writing through a local temporary file.
+
+        The file is uploaded with the storage client when the file object is
+        closed, with multipart uploads for large objects where the provider
+        supports them. Nothing is uploaded if the ``with`` block raises, see
+        :class:`~easy_io.remote_io.TempFileWriter`. Cached metadata of
+        ``filepath`` is dropped once the upload is done.
+
+        Examples:
+            >>> backend = MSCBackend()
+            >>> with backend.open_write("path/of/file") as f:
+            ...     torch.save(state_dict, f)
+        """
+        path = self._translate_filepath(filepath=filepath)
+
+        def upload(local_path: str) -> None:
+            self._storage_client.upload_file(remote_path=path, local_path=local_path)
+            self._invalidate(filepath)
+
+        return TempFileWriter(upload, filepath)
 
     def put_text(
         self,
@@ -204,7 +320,7 @@ class MSCBackend(BaseStorageBackend):
             True
         """
         path = self._translate_filepath(filepath=filepath)
-        return not self._storage_client.is_empty(path=path)
+        return self._cached("exists", path, lambda: not self._storage_client.is_empty(path=path))
 
     def isdir(self, filepath: Union[str, Path]) -> bool:
         """Check whether a file path is a directory.
@@ -224,12 +340,16 @@ class MSCBackend(BaseStorageBackend):
             True
         """
         path = self._translate_filepath(filepath=filepath)
-        try:
-            # Include directories and files.
-            metadata = self._storage_client.info(path=path, strict=True)
-        except FileNotFoundError:
-            return False
-        return metadata.type == "directory"
+
+        def isdir() -> bool:
+            try:
+                # Include directories and files.
+                metadata = self._storage_client.info(path=path, strict=True)
+            except FileNotFoundError:
+                return False
+            return metadata.type == "directory"
+
+        return self._cached("isdir", path, isdir)
 
     def isfile(self, filepath: Union[str, Path]) -> bool:
         """Check whether a file path is a file.
@@ -248,10 +368,14 @@ class MSCBackend(BaseStorageBackend):
             True
         """
         path = self._translate_filepath(filepath=filepath)
-        try:
-            return self._storage_client.is_file(path=path)
-        except FileNotFoundError:
-            return False
+
+        def isfile() -> bool:
+            try:
+                return self._storage_client.is_file(path=path)
+            except FileNotFoundError:
+                return False
+
+        return self._cached("isfile", path, isfile)
 
     def join_path(
         self,
@@ -299,6 +423,10 @@ class MSCBackend(BaseStorageBackend):
         can be called with ``with`` statement, and when exists from the
         ``with`` statement, the temporary path will be released.
 
+        With a disk cache, the path of the cached file is yielded instead and
+        kept after the ``with`` statement; it must not be modified. No process
+        evicts it while the ``with`` statement runs.
+
         Args:
             filepath (str or Path): Download a file from ``filepath``.
 
@@ -313,6 +441,19 @@ class MSCBackend(BaseStorageBackend):
             >>> with backend.get_local_path(filepath) as path:
             ...     # do something here
         """
+        if self.disk_cache is not None:
+            # The cached file itself is yielded, it must not be modified.
+            path = self._translate_filepath(filepath=filepath)
+            stat = self.stat(filepath)
+            with self.disk_cache.pin_file(
+                path,
+                stat["etag"] or str(stat["mtime"]),
+                stat["size"],
+                lambda tmp_path: self._storage_client.download_file(remote_path=path, local_path=tmp_path),
+            ) as cached_path:
+                yield cached_path
+            return
+
         assert self.isfile(filepath=filepath)
         temp_path = None
         try:
@@ -401,11 +542,14 @@ class MSCBackend(BaseStorageBackend):
         if self.exists(filepath=dst):
             raise FileExistsError("dst should not exist")
 
-        self._storage_client.sync_from(
-            source_client=self._storage_client,
-            source_path=self._translate_filepath(filepath=src),
-            target_path=self._translate_filepath(filepath=dst),
-        )
+        try:
+            self._storage_client.sync_from(
+                source_client=self._storage_client,
+                source_path=self._translate_filepath(filepath=src),
+                target_path=self._translate_filepath(filepath=dst),
+            )
+        finally:
+            self._invalidate(dst, tree=True)
 
         return self._translate_filepath(filepath=dst, translate_url=False)
 
@@ -453,6 +597,9 @@ class MSCBackend(BaseStorageBackend):
         """Recursively copy an entire directory tree rooted at src to a
         directory named dst and return the destination directory.
 
+        The files are uploaded concurrently by :attr:`tree_transfer` while
+        the directory is still being walked.
+
         Args:
             src (str or Path): A local directory to be copied.
             dst (str or Path): Copy directory to dst.
@@ -476,12 +623,20 @@ class MSCBackend(BaseStorageBackend):
 
         src = str(src)
 
-        for cur_dir, _, files in os.walk(src):
-            for f in files:
-                src_path = os.path.join(cur_dir, f)
-                dst_path = self.join_path(dst, src_path.replace(src, ""))
-                self.copyfile_from_local(src=src_path, dst=dst_path)
+        def tasks() -> Iterator[tuple[Callable[[], None], int]]:
+            for cur_dir, _, files in os.walk(src):
+                for f in files:
+                    src_path = os.path.join(cur_dir, f)
+                    dst_path = self._translate_filepath(filepath=self.join_path(dst, src_path.replace(src, "")))
+                    upload = functools.partial(
+                        self._storage_client.upload_file, remote_path=dst_path, local_path=src_path
+                    )
+                    yield upload, os.path.getsize(src_path)
 
+        try:
+            self.tree_transfer.run(tasks())
+        finally:
+            self._invalidate(dst, tree=True)
         return self._translate_filepath(filepath=dst, translate_url=False)
 
     def copyfile_to_local(
@@ -549,6 +704,9 @@ class MSCBackend(BaseStorageBackend):
         """Recursively copy an entire directory tree rooted at src to a local
         directory named dst and return the destination directory.
 
+        The files are downloaded concurrently by :attr:`tree_transfer`,
+        starting as soon as the first listing page arrives.
+
         Args:
             src (str or Path): A directory to be copied.
             dst (str or Path): Copy directory to local dst.
@@ -563,12 +721,20 @@ class MSCBackend(BaseStorageBackend):
             >>> backend.copytree_to_local(src, dst)
             'path/of/your/dir'
         """
-        for path in self.list_dir_or_file(dir_path=src, list_dir=False, recursive=True):
+        src_path = self._translate_filepath(filepath=src).removesuffix("/") + "/"
+
+        def download(path: str) -> None:
             dst_path = os.path.join(dst, path)
             mkdir_or_exist(os.path.dirname(dst_path))
-            with open(dst_path, "wb") as f:
-                f.write(self.get(filepath=self.join_path(src, path)))
+            self._storage_client.download_file(remote_path=src_path + path, local_path=dst_path)
 
+        self.tree_transfer.run(
+            (functools.partial(download, metadata.key.removeprefix(src_path)), metadata.content_length)
+            for metadata in self._storage_client.list(
+                path=src_path, include_directories=False, include_url_prefix=False
+            )
+            if metadata.type == "file"
+        )
         return dst
 
     def remove(self, filepath: Union[str, Path]) -> None:
@@ -596,6 +762,7 @@ class MSCBackend(BaseStorageBackend):
             raise IsADirectoryError("filepath should be a file")
 
         self._storage_client.delete(path=self._translate_filepath(filepath=filepath), recursive=False)
+        self._invalidate(filepath)
 
     def rmtree(self, dir_path: Union[str, Path]) -> None:
         """Recursively delete a directory tree.
@@ -608,7 +775,10 @@ class MSCBackend(BaseStorageBackend):
             >>> dir_path = "path/of/dir"  # or "s3://path/of/dir"
             >>> backend.rmtree(dir_path)
         """
-        self._storage_client.delete(path=self._translate_filepath(filepath=dir_path), recursive=True)
+        try:
+            self._storage_client.delete(path=self._translate_filepath(filepath=dir_path), recursive=True)
+        finally:
+            self._invalidate(dir_path, tree=True)
 
     def copy_if_symlink_fails(
         self,
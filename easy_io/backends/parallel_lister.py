@@ -0,0 +1,225 @@
+import concurrent.futures
+import queue
+import string
+import threading
+from collections.abc import Generator, Iterator
+from typing import Any, Optional
+
+# Sorts after every character S3 keys use in practice, so ``prefix + MAX_CHAR``
+# is a ``StartAfter`` that skips everything below ``prefix``.
+MAX_CHAR = "\U0010ffff"
+# Boundaries of the key ranges a flat prefix is split into.
+SPLIT_CHARS = string.digits + string.ascii_uppercase + string.ascii_lowercase
+PAGE_QUEUE_SIZE = 2  # pages buffered per shard ahead of the consumer
+
+_DONE = object()
+
+
+class Shard:
+    """A part of the key space under ``prefix``.
+
+    Keys of the shard are greater than ``start_after`` and not greater than
+    ``stop_after``; None leaves that end open.
+    """
+
+    def __init__(self, prefix: str, start_after: Optional[str] = None, stop_after: Optional[str] = None):
+        self.prefix = prefix
+        self.start_after = start_after
+        self.stop_after = stop_after
+
+    def __repr__(self) -> str:
+        return f"Shard(prefix={self.prefix!r}, start_after={self.start_after!r}, stop_after={self.stop_after!r})"
+
+
+class ParallelLister:
+    """Lists a large S3 prefix with concurrent ``list_objects_v2`` requests.
+
+    ``list_objects_v2`` returns at most 1000 keys per request and each page
+    needs the continuation token of the previous one, so a plain listing is
+    one long chain of round trips. This lister first splits the prefix into
+    shards: it walks the common prefixes (``Delimiter="/"``) level by level
+    until there are at least ``min_shards`` of them, and splits levels with
+    too many direct keys into character ranges with ``StartAfter``. The
+    shards are then listed concurrently.
+
+    The keys are yielded as a stream. With ``ordered=True`` they come in the
+    same order as a plain listing; pages of later shards are buffered only
+    up to ``PAGE_QUEUE_SIZE`` per shard, so memory stays bounded by
+    ``max_workers`` pages either way.
+
+    Args:
+        client: A boto3 S3 client.
+        max_workers (int): Maximum number of concurrent requests.
+            Defaults to 16.
+        min_shards (int, optional): Stop splitting once there are this many
+            shards. Defaults to ``4 * max_workers``.
+        max_depth (int): Maximum number of directory levels walked to find
+            shards. Defaults to 3.
+
+    Examples:
+        >>> lister = ParallelLister(s3_client, max_workers=32)
+        >>> for key, size in lister.list_objects('bucket', 'dataset/'):
+        ...     print(key, size)
+    """
+
+    def __init__(self, client: Any, max_workers: int = 16, min_shards: Optional[int] = None, max_depth: int = 3):
+        assert max_workers > 0
+        self._client = client
+        self.max_workers = max_workers
+        self.min_shards = min_shards or 4 * max_workers
+        self.max_depth = max_depth
+
+    def _split_level(self, bucket: str, prefix: str) -> list[Any]:
+        """Split ``prefix`` into its direct keys, sub-prefixes and key ranges, in key order.
+
+        Direct keys are returned as ``(key, size, etag, mtime)`` tuples, the rest as :class:`Shard`.
+        """
+        resp = self._client.list_objects_v2(Bucket=bucket, Prefix=prefix, Delimiter="/")
+        items: list[tuple[str, Any]] = [(item["Key"], _entry(item)) for item in resp.get("Contents", [])]
+        items += [(item["Prefix"], Shard(item["Prefix"])) for item in resp.get("CommonPrefixes", [])]
+        items.sort(key=lambda item: item[0])
+        result = [item for _, item in items]
+        if not resp.get("IsTruncated"):
+            return result
+
+        # More than one page: list the rest as character ranges instead of
+        # walking it page by page here.
+        last = items[-1][0]
+        start_after = last + MAX_CHAR if last.endswith("/") else last
+        for char in SPLIT_CHARS:
+            boundary = prefix + char
+            if boundary > start_after:
+                result.append(Shard(prefix, start_after, boundary))
+                start_after = boundary
+        result.append(Shard(prefix, start_after))
+        return result
+
+    def shards(self, bucket: str, prefix: str, executor: concurrent.futures.Executor) -> list[Any]:
+        """Split ``prefix`` into shards, in key order. Direct keys found on the way are returned as entries."""
+        items: list[Any] = [Shard(prefix)]
+        for _ in range(self.max_depth):
+            expandable = [item for item in items if isinstance(item, Shard) and item.start_after is None]
+            num_shards = sum(isinstance(item, Shard) for item in items)
+            if not expandable or num_shards >= self.min_shards:
+                break
+            levels = dict(
+                zip(map(id, expandable), executor.map(lambda s: self._split_level(bucket, s.prefix), expandable))
+            )
+            expanded: list[Any] = []
+            for item in items:
+                expanded.extend(levels.get(id(item), [item]))
+            items = expanded
+        return items
+
+    def _list_shard(self, bucket: str, shard: Shard) -> Iterator[list[tuple]]:
+        """Yield the pages of ``shard``."""
+        kwargs = {"Bucket": bucket, "Prefix": shard.prefix}
+        if shard.start_after is not None:
+            kwargs["StartAfter"] = shard.start_after
+        while True:
+            resp = self._client.list_objects_v2(**kwargs)
+            page = [_entry(item) for item in resp.get("Contents", [])]
+            if shard.stop_after is not None and page and page[-1][0] > shard.stop_after:
+                yield [item for item in page if item[0] <= shard.stop_after]
+                return
+            yield page
+            if not resp.get("IsTruncated"):
+                return
+            kwargs["ContinuationToken"] = resp["NextContinuationToken"]
+
+    def _produce(self, bucket: str, shard: Shard, pages: queue.Queue, stop: threading.Event) -> None:
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            for page in self._list_shard(bucket, shard):
+                if not put(page):
+                    return
+        except Exception as e:
+            put(e)
+        put(_DONE)
+
+    def list_objects(
+        self, bucket: str, prefix: str, ordered: bool = True, metadata: bool = False
+    ) -> Generator[tuple, None, None]:
+        """List all keys under ``prefix``.
+
+        Args:
+            bucket (str): The bucket.
+            prefix (str): The key prefix.
+            ordered (bool): Whether to yield the keys in key order. Without
+                it, pages are yielded as soon as any shard delivers them.
+                Defaults to True.
+            metadata (bool): Whether to yield the ETag and the modification
+                time as well. Defaults to False.
+
+        Yields:
+            tuple: The key and the object size, followed by the ETag and the
+            modification time if ``metadata`` is set.
+        """
+        stop = threading.Event()
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="easy_io_list"
+        )
+        try:
+            items = self.shards(bucket, prefix, executor)
+            if ordered:
+                entries = self._list_ordered(bucket, items, executor, stop)
+            else:
+                entries = self._list_unordered(bucket, items, executor, stop)
+            for entry in entries:
+                yield entry if metadata else entry[:2]
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _list_ordered(
+        self, bucket: str, items: list[Any], executor: concurrent.futures.Executor, stop: threading.Event
+    ) -> Generator[tuple, None, None]:
+        # Shards are started at most ``max_workers`` ahead of the one being consumed.
+        window: dict[int, queue.Queue] = {}
+        shard_indices = [i for i, item in enumerate(items) if isinstance(item, Shard)]
+        next_start = 0
+
+        for i, item in enumerate(items):
+            while next_start < len(shard_indices) and len(window) < self.max_workers:
+                pages: queue.Queue = queue.Queue(maxsize=PAGE_QUEUE_SIZE)
+                window[shard_indices[next_start]] = pages
+                executor.submit(self._produce, bucket, items[shard_indices[next_start]], pages, stop)
+                next_start += 1
+            if not isinstance(item, Shard):
+                yield item
+                continue
+            pages = window.pop(i)
+            while (page := pages.get()) is not _DONE:
+                if isinstance(page, Exception):
+                    raise page
+                yield from page
+
+    def _list_unordered(
+        self, bucket: str, items: list[Any], executor: concurrent.futures.Executor, stop: threading.Event
+    ) -> Generator[tuple, None, None]:
+        shards = [item for item in items if isinstance(item, Shard)]
+        yield from (item for item in items if not isinstance(item, Shard))
+        pages: queue.Queue = queue.Queue(maxsize=PAGE_QUEUE_SIZE * self.max_workers)
+        for shard in shards:
+            executor.submit(self._produce, bucket, shard, pages, stop)
+        remaining = len(shards)
+        while remaining:
+            page = pages.get()
+            if page is _DONE:
+                remaining -= 1
+            elif isinstance(page, Exception):
+                raise page
+            else:
+                yield from page
+
+
+def _entry(item: dict) -> tuple[str, int, str, Any]:
+    return item["Key"], item["Size"], item.get("ETag", "").strip('"'), item.get("LastModified")
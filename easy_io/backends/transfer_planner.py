@@ -0,0 +1,136 @@
+import os
+import threading
+from math import ceil
+from typing import Optional
+
+MB = 1024 * 1024
+
+MIN_PART_SIZE = 5 * MB  # smallest part S3 accepts, except for the last one
+MAX_PART_SIZE = 5 * 1024 * MB
+MAX_PARTS = 10000
+
+
+class TransferPlan:
+    """How an object is split up for a multipart transfer.
+
+    Args:
+        size (int): Size of the object in bytes.
+        part_size (int): Size of each part in bytes.
+        num_processes (int): Number of worker tasks the parts are split into.
+        concurrency (int): Number of parts each worker transfers at once.
+        multipart (bool): False if the object is small enough to be
+            transferred with a single request.
+    """
+
+    def __init__(self, size: int, part_size: int, num_processes: int, concurrency: int, multipart: bool = True):
+        self.size = size
+        self.part_size = part_size
+        self.num_processes = num_processes
+        self.concurrency = concurrency
+        self.multipart = multipart
+
+    @property
+    def num_parts(self) -> int:
+        return max(1, ceil(self.size / self.part_size))
+
+    def __repr__(self) -> str:
+        if not self.multipart:
+            return f"TransferPlan(size={self.size}, single request)"
+        return (
+            f"TransferPlan(size={self.size}, part_size={self.part_size}, num_parts={self.num_parts}, "
+            f"num_processes={self.num_processes}, concurrency={self.concurrency})"
+        )
+
+
+class TransferPlanner:
+    """Picks part size and parallelism of S3 transfers.
+
+    The part size starts at ``default_part_size`` and then follows the
+    per-connection throughput measured on earlier transfers, so that a part
+    takes about ``target_part_seconds`` to move. It is shrunk for mid-size
+    objects so that every connection gets work, and grown to stay below the
+    S3 limit of 10,000 parts. The number of processes is bounded by
+    ``max_processes`` and the CPU count; the remaining parallelism is spread
+    over coroutines inside each process.
+
+    Args:
+        max_processes (int): Upper bound of worker processes. Defaults to 32.
+        max_concurrency (int): Upper bound of parts in flight per process.
+            Defaults to 8.
+        multipart_threshold (int): Objects up to this size are transferred
+            with a single request. Defaults to 16 MB.
+        default_part_size (int): Part size used before any throughput has
+            been measured. Defaults to 16 MB.
+        target_part_seconds (float): Time one part should take on one
+            connection. Defaults to 2.
+
+    Examples:
+        >>> planner = TransferPlanner(max_processes=8)
+        >>> planner.plan(256 * 1024 * 1024)  # with at least 8 CPUs
+        TransferPlan(size=268435456, part_size=5242880, num_parts=52, num_processes=8, concurrency=7)
+        >>> planner.record(256 * 1024 * 1024, seconds=4.0, connections=32)
+    """
+
+    def __init__(
+        self,
+        max_processes: int = 32,
+        max_concurrency: int = 8,
+        multipart_threshold: int = 16 * MB,
+        default_part_size: int = 16 * MB,
+        target_part_seconds: float = 2.0,
+    ):
+        self.max_processes = max_processes
+        self.max_concurrency = max_concurrency
+        self.multipart_threshold = multipart_threshold
+        self.default_part_size = default_part_size
+        self.target_part_seconds = target_part_seconds
+        self._throughput: Optional[float] = None  # bytes per second and connection
+        self._lock = threading.Lock()
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """float, optional: Measured throughput of one connection in bytes per second."""
+        return self._throughput
+
+    def record(self, size: int, seconds: float, connections: int) -> None:
+        """Record a finished transfer of ``size`` bytes over ``connections`` connections."""
+        if seconds <= 0 or size <= 0 or connections <= 0:
+            return
+        throughput = size / seconds / connections
+        with self._lock:
+            if self._throughput is None:
+                self._throughput = throughput
+            else:
+                # Exponential moving average, recent transfers weigh more.
+                self._throughput = 0.7 * self._throughput + 0.3 * throughput
+
+    def plan(self, size: int, num_processes: Optional[int] = None, part_size: Optional[int] = None) -> TransferPlan:
+        """Plan the transfer of an object of ``size`` bytes.
+
+        Args:
+            size (int): Size of the object in bytes.
+            num_processes (int, optional): Use this many worker tasks instead
+                of choosing it.
+            part_size (int, optional): Use this part size instead of choosing
+                it, e.g. to resume an upload.
+
+        Returns:
+            TransferPlan: The chosen plan.
+        """
+        if part_size is None and size <= self.multipart_threshold:
+            return TransferPlan(size, max(size, 1), 1, 1, multipart=False)
+
+        max_processes = num_processes or min(self.max_processes, os.cpu_count() or 1)
+        if part_size is None:
+            part_size = self.default_part_size
+            if self._throughput is not None:
+                part_size = int(self._throughput * self.target_part_seconds)
+            # Enough parts to keep every connection busy.
+            part_size = min(part_size, ceil(size / (max_processes * self.max_concurrency)))
+            part_size = max(part_size, ceil(size / MAX_PARTS), MIN_PART_SIZE)
+            part_size = min(ceil(part_size / MB) * MB, MAX_PART_SIZE)
+
+        num_parts = max(1, ceil(size / part_size))
+        num_processes = max(1, min(max_processes, num_parts))
+        concurrency = max(1, min(self.max_concurrency, ceil(num_parts / num_processes)))
+        return TransferPlan(size, part_size, num_processes, concurrency)
@@ -0,0 +1,89 @@
+import concurrent.futures
+import threading
+from collections.abc import Iterable
+from typing import Any, Callable
+
+from easy_io import log
+
+
+class TreeTransfer:
+    """Runs the file transfers of a directory tree concurrently.
+
+    The tasks are consumed lazily, so a listing that feeds them keeps
+    running while the first files are already being transferred. At most
+    ``max_workers`` transfers run at once, and a new one only starts when
+    the sizes of the running ones stay below ``max_bytes_in_flight``. A file
+    larger than the cap still runs, alone.
+
+    Args:
+        max_workers (int): Maximum number of concurrent transfers.
+            Defaults to 32.
+        max_bytes_in_flight (int): Maximum total size of the files being
+            transferred at once. Defaults to 1 GB.
+
+    Examples:
+        >>> transfer = TreeTransfer(max_workers=16)
+        >>> transfer.run((functools.partial(download, path), size) for path, size in listing)
+        128
+    """
+
+    def __init__(self, max_workers: int = 32, max_bytes_in_flight: int = 1024 * 1024 * 1024):
+        assert max_workers > 0 and max_bytes_in_flight > 0
+        self.max_workers = max_workers
+        self.max_bytes_in_flight = max_bytes_in_flight
+
+    def run(self, tasks: Iterable[tuple[Callable[[], Any], int]]) -> int:
+        """Run every ``(transfer, size)`` task of ``tasks``.
+
+        Args:
+            tasks (Iterable[tuple[Callable, int]]): The transfers, each with
+                the number of bytes it moves.
+
+        Returns:
+            int: The number of transfers.
+
+        Raises:
+            Exception: The first error of a transfer. Transfers that have not
+                started yet are cancelled.
+        """
+        condition = threading.Condition()
+        in_flight = {"bytes": 0, "tasks": 0}
+        count = 0
+
+        def release(size: int) -> None:
+            with condition:
+                in_flight["bytes"] -= size
+                in_flight["tasks"] -= 1
+                condition.notify_all()
+
+        def has_room(size: int) -> bool:
+            if in_flight["tasks"] == 0:
+                return True
+            return in_flight["tasks"] < self.max_workers and in_flight["bytes"] + size <= self.max_bytes_in_flight
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="easy_io_tree"
+        )
+        futures: set[concurrent.futures.Future] = set()
+        try:
+            for transfer, size in tasks:
+                with condition:
+                    condition.wait_for(lambda size=size: has_room(size))
+                    in_flight["bytes"] += size
+                    in_flight["tasks"] += 1
+                future = executor.submit(transfer)
+                future.add_done_callback(lambda _, size=size: release(size))
+                futures.add(future)
+                count += 1
+                # Surface errors early and keep the set of futures small.
+                for done in [future for future in futures if future.done()]:
+                    futures.remove(done)
+                    done.result()
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        except BaseException:
+            log.error(f"Tree transfer failed after {count} files were scheduled", rank0_only=False)
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+        return count
@@ -0,0 +1,102 @@
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+_DONE = object()
+
+
+def run_batch(  # noqa: C901
+    fn: Callable[[Any], tuple[Any, int]],
+    items: Iterable[Any],
+    max_workers: int = 32,
+    max_bytes_in_flight: Optional[int] = None,
+    ordered: bool = True,
+    cost: Optional[Callable[[Any], int]] = None,
+) -> Iterator[tuple[Any, Any]]:
+    """Run ``fn`` over ``items`` on a thread pool and yield ``(item, result)`` pairs.
+
+    Items are read from the iterable lazily, so it may be a stream. An
+    exception of ``fn`` is yielded as the result of its item instead of
+    stopping the batch.
+
+    Memory is bounded by ``max_bytes_in_flight``: every item is charged
+    ``cost(item)`` when it is submitted, e.g. the size of data to upload,
+    plus the size ``fn`` reports for its result, e.g. the size of a download,
+    until its result has been yielded. No new item is submitted while the
+    charge exceeds the budget, except when nothing else is in flight.
+
+    Args:
+        fn (Callable): Returns the result of an item and its size in bytes.
+        items (Iterable): Items to process.
+        max_workers (int): Number of concurrent calls of ``fn``.
+            Defaults to 32.
+        max_bytes_in_flight (int, optional): Budget of the charged bytes.
+            Defaults to no limit.
+        ordered (bool): Whether to yield results in the order of ``items``
+            instead of as they complete. Defaults to True.
+        cost (Callable, optional): Bytes an item holds before it is
+            processed. Defaults to 0.
+
+    Yields:
+        tuple: ``(item, result)``, where ``result`` is the result of ``fn``
+        or its exception.
+
+    Examples:
+        >>> for path, data in run_batch(lambda p: (get(p), ...), paths, max_workers=64):
+        ...     if isinstance(data, Exception):
+        ...         ...
+    """
+    lock = threading.Lock()
+    charged = 0
+    completed: queue.Queue = queue.Queue()
+
+    def run(item: Any, item_cost: int) -> tuple[Any, int]:
+        nonlocal charged
+        try:
+            result, nbytes = fn(item)
+        except Exception as e:
+            result, nbytes = e, 0
+        with lock:
+            charged += nbytes
+        return result, item_cost + nbytes
+
+    iterator = iter(items)
+    pending: dict[Future, Any] = {}  # in submission order
+    executor = ThreadPoolExecutor(max_workers, thread_name_prefix="easy_io_batch")
+
+    def submit() -> bool:
+        """Submit the next item unless over budget; return whether one was submitted."""
+        nonlocal charged
+        with lock:
+            if max_bytes_in_flight is not None and charged >= max_bytes_in_flight and pending:
+                return False
+        item = next(iterator, _DONE)
+        if item is _DONE:
+            return False
+        item_cost = cost(item) if cost is not None else 0
+        with lock:
+            charged += item_cost
+        future = executor.submit(run, item, item_cost)
+        pending[future] = item
+        if not ordered:
+            future.add_done_callback(completed.put)
+        return True
+
+    try:
+        while True:
+            while len(pending) < 2 * max_workers and submit():
+                pass
+            if not pending:
+                return
+            future = next(iter(pending)) if ordered else completed.get()
+            item = pending.pop(future)
+            result, nbytes = future.result()
+            with lock:
+                charged -= nbytes
+            yield item, result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
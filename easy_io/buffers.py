@@ -0,0 +1,224 @@
+import io
+import mmap
+import os
+import threading
+from multiprocessing import shared_memory
+from typing import Any, Optional, Union
+
+import numpy as np
+
+# Shared memory blocks whose release had to be postponed because views of
+# them were still alive. They are retried on every later release.
+_deferred: list[tuple[memoryview, shared_memory.SharedMemory]] = []
+_deferred_lock = threading.Lock()
+
+
+def _close_shared_memory(view: memoryview, shm: shared_memory.SharedMemory) -> bool:
+    """Try to unmap ``shm``. Return False if views of it are still exported."""
+    try:
+        view.release()
+        shm.close()
+    except BufferError:
+        return False
+    return True
+
+
+def _sweep_deferred() -> None:
+    with _deferred_lock:
+        _deferred[:] = [item for item in _deferred if not _close_shared_memory(*item)]
+
+
+def map_file(filepath: Union[str, os.PathLike]) -> memoryview:
+    """Map a local file into memory and return a read-only view of it.
+
+    Nothing is read up front: pages come from the page cache when they are
+    accessed. The file is unmapped once the view and all views derived from
+    it are gone.
+
+    Examples:
+        >>> view = map_file('/data/tokens.bin')
+        >>> tokens = np.frombuffer(view, dtype=np.uint16)
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped.
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+class SharedMemoryBuffer:
+    """A read-only buffer that owns a shared memory block.
+
+    It is returned by :meth:`Boto3Client.fast_get` with ``zero_copy=True`` so
+    the downloaded object is never copied out of the block the download
+    workers wrote into. The block name is unlinked as soon as the download
+    finishes; the memory itself is returned to the OS once the buffer is
+    released and no view of it is alive anymore.
+
+    The buffer can be used as a context manager, converted with
+    ``np.asarray(buffer)`` or read through :attr:`view`.
+
+    Args:
+        shm (SharedMemory): The block holding the data. Its ownership is
+            transferred to the buffer.
+        size (int): Number of valid bytes at the beginning of the block.
+
+    Examples:
+        >>> with backend.fast_get('s3://bucket/file', zero_copy=True) as buffer:
+        ...     array = np.frombuffer(buffer.view, dtype=np.float32)
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, size: int):
+        _sweep_deferred()
+        self._shm: Optional[shared_memory.SharedMemory] = shm
+        self._size = size
+        self._view = shm.buf[:size].toreadonly()
+
+    @property
+    def view(self) -> memoryview:
+        """memoryview: A read-only view of the data."""
+        if self._shm is None:
+            raise ValueError("operation on a released buffer")
+        return self._view
+
+    @property
+    def released(self) -> bool:
+        return self._shm is None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # Buffer protocol for Python >= 3.12, e.g. ``memoryview(buffer)``.
+        return memoryview(self.view)
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        if copy:
+            return np.array(self.view, dtype=dtype)
+        array = np.frombuffer(self.view, dtype=np.uint8)
+        return array if dtype is None else array.view(dtype)
+
+    def tobytes(self) -> bytes:
+        return self.view.tobytes()
+
+    def release(self) -> None:
+        """Release the shared memory block.
+
+        If views of the data are still alive (for example a numpy array
+        created from :attr:`view`), the block stays mapped until they are
+        gone and is released by a later call.
+        """
+        if self._shm is None:
+            return
+        view, shm, self._shm = self._view, self._shm, None
+        if not _close_shared_memory(view, shm):
+            with _deferred_lock:
+                _deferred.append((view, shm))
+        _sweep_deferred()
+
+    def __enter__(self) -> "SharedMemoryBuffer":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+    def __del__(self) -> None:
+        if getattr(self, "_shm", None) is not None:
+            self.release()
+
+
+class BufferReader(io.BufferedIOBase):
+    """A seekable, read-only file object over a bytes-like object.
+
+    Unlike ``io.BytesIO(buffer)``, the data is not copied on construction,
+    and :meth:`readinto` copies straight from the buffer into the caller's
+    memory.
+
+    Args:
+        buffer (bytes-like or SharedMemoryBuffer): The data to read.
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview, SharedMemoryBuffer]):
+        super().__init__()
+        view = buffer.view if isinstance(buffer, SharedMemoryBuffer) else memoryview(buffer)
+        self._view = view.cast("B") if view.format != "B" or view.ndim != 1 else view[:]
+        self._pos = 0
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def getbuffer(self) -> memoryview:
+        """Return a read-only view of the whole buffer without copying it."""
+        self._check_open()
+        return self._view
+
+    def tell(self) -> int:
+        self._check_open()
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._check_open()
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError(f"invalid whence ({whence}, should be 0, 1 or 2)")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        self._check_open()
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        data = self._view[self._pos : end].tobytes() if end > self._pos else b""
+        self._pos = max(self._pos, end)
+        return data
+
+    read1 = read
+
+    def readinto(self, b) -> int:
+        self._check_open()
+        out = memoryview(b).cast("B")
+        n = max(0, min(len(out), len(self._view) - self._pos))
+        out[:n] = self._view[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    readinto1 = readinto
+
+    def peek(self, size: int = 0) -> bytes:
+        self._check_open()
+        return self._view[self._pos : self._pos + max(size, 1)].tobytes()
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        self._check_open()
+        limit = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        end = self._pos
+        chunk_size = 4096
+        while end < limit:
+            chunk = self._view[end : min(end + chunk_size, limit)].tobytes()
+            newline = chunk.find(b"\n")
+            if newline >= 0:
+                end += newline + 1
+                break
+            end += len(chunk)
+            chunk_size = min(chunk_size * 2, 1 << 20)
+        data = self._view[self._pos : end].tobytes()
+        self._pos = end
+        return data
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
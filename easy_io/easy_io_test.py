@@ -1,4 +1,8 @@
+import json
+import socket
+
 import numpy as np
+import pytest
 
 import easy_io
 from easy_io.test_utils import RunIf
@@ -18,6 +22,53 @@ def setup_s3():
     )
 
 
+@pytest.fixture(scope="module")
+def moto_s3(tmp_path_factory):
+    """A ``Boto3Backend`` on a local moto server with the bucket ``s3://bkt``.
+
+    The multipart threshold is lowered to 1 MB so that objects of a few MB
+    take the multipart paths.
+    """
+    moto_server = pytest.importorskip("moto.server")
+    from easy_io.backends import Boto3Backend
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = moto_server.ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    credential_path = tmp_path_factory.mktemp("s3") / "credential.json"
+    credential_path.write_text(
+        json.dumps(
+            {
+                "aws_access_key_id": "test",
+                "aws_secret_access_key": "test",
+                "endpoint_url": f"http://127.0.0.1:{port}",
+                "region_name": "us-east-1",
+            }
+        )
+    )
+    backend = Boto3Backend(s3_credential_path=str(credential_path), transfer_processes=2)
+    backend._client.transfer_planner.multipart_threshold = 1024 * 1024
+    backend._client._client.create_bucket(Bucket="bkt")
+    yield backend
+    backend._client.shutdown()
+    server.stop()
+
+
+@pytest.fixture(scope="module")
+def s3_objects(moto_s3):
+    """Small, empty and multipart-sized objects put to ``moto_s3``."""
+    objects = {
+        "s3://bkt/objects/small.bin": b"hello world",
+        "s3://bkt/objects/empty.bin": b"",
+        "s3://bkt/objects/large.bin": np.random.bytes(12 * 1024 * 1024 + 3),
+    }
+    for path, data in objects.items():
+        moto_s3.put(data, path)
+    return objects
+
+
 @RunIf(requires_file=S3_CREDENTIAL_PATH)
 def test_s3_backend():
     setup_s3()
@@ -71,3 +122,847 @@ def test_local_backend():
 
     if easy_io.exists("dummy_dict.pkl"):
         easy_io.remove("dummy_dict.pkl")
+
+
+def test_shared_memory_buffer():
+    from multiprocessing import shared_memory
+
+    from easy_io.buffers import BufferReader, SharedMemoryBuffer
+
+    shm = shared_memory.SharedMemory(create=True, size=16)
+    shm.buf[:11] = b"hello\nworld"
+    shm.unlink()
+    with SharedMemoryBuffer(shm, 11) as buffer, BufferReader(buffer) as f:
+        assert len(buffer) == 11
+        assert np.asarray(buffer)[0] == ord("h")
+        assert f.readline() == b"hello\n"
+        assert f.read() == b"world"
+        f.seek(-5, 2)
+        assert f.read(2) == b"wo"
+    assert buffer.released
+
+
+def test_upload_manifest(tmp_path):
+    from easy_io.backends.boto3_client import UploadManifest
+
+    manifest = UploadManifest("bucket", "path/of/file", manifest_dir=str(tmp_path))
+    assert manifest.load() is None
+    manifest.save({"upload_id": "id", "size": 10, "part_size": 4, "parts": {1: '"etag"'}})
+    assert manifest.load()["parts"] == {1: '"etag"'}
+    assert UploadManifest("bucket", "other/file", manifest_dir=str(tmp_path)).load() is None
+    manifest.remove()
+    assert manifest.load() is None
+
+
+def test_transfer_planner():
+    from easy_io.backends.transfer_planner import MAX_PARTS, MB, MIN_PART_SIZE, TransferPlanner
+
+    planner = TransferPlanner(max_processes=4)
+    assert not planner.plan(MB).multipart
+    plan = planner.plan(128 * MB, num_processes=4)
+    assert plan.multipart and plan.num_processes == 4 and plan.part_size >= MIN_PART_SIZE
+    assert planner.plan(1024 * 1024 * MB).num_parts <= MAX_PARTS
+    assert planner.plan(128 * MB, part_size=7 * MB).part_size == 7 * MB
+    planner.record(128 * MB, seconds=1.0, connections=4)
+    assert planner.throughput == 32 * MB
+
+
+def test_remove_many(tmp_path):
+    paths = [str(tmp_path / f"file{i}.txt") for i in range(3)]
+    for path in paths:
+        easy_io.put_text("hello", path)
+    os_dir = str(tmp_path / "dir")
+    easy_io.put_text("hello", os_dir + "/file.txt")
+
+    errors = easy_io.remove_many([*paths, str(tmp_path / "missing.txt"), os_dir])
+    assert list(errors) == [os_dir]
+    assert not any(easy_io.exists(path) for path in paths)
+
+
+def test_tree_transfer():
+    import threading
+    import time
+
+    import pytest
+
+    from easy_io.backends.tree_transfer import TreeTransfer
+
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def transfer():
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01)
+        with lock:
+            state["running"] -= 1
+
+    assert TreeTransfer(max_workers=4).run((transfer, 1) for _ in range(20)) == 20
+    assert state["peak"] <= 4
+    state["peak"] = 0
+    TreeTransfer(max_workers=4, max_bytes_in_flight=10).run((transfer, 6) for _ in range(5))
+    assert state["peak"] == 1
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        TreeTransfer(max_workers=2).run([(transfer, 1), (fail, 1), (transfer, 1)])
+
+
+def test_metadata_cache():
+    import time
+
+    from easy_io.backends.metadata_cache import MetadataCache
+
+    cache = MetadataCache(ttl=60, max_entries=3)
+    assert cache.lookup("exists", "s3://b/d/f", lambda: False) is False
+    assert cache.lookup("exists", "s3://b/d/f", lambda: True) is False
+    cache.put("isdir", "s3://b/d/", True)
+    cache.invalidate("s3://b/d/f")
+    assert cache.get("exists", "s3://b/d/f") is None
+    assert cache.get("isdir", "s3://b/d") is None
+
+    for i in range(4):
+        cache.put("isfile", f"s3://b/{i}", True)
+    assert cache.get("isfile", "s3://b/0") is None
+    cache.invalidate_tree("s3://b")
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["evictions"] == 1
+
+    cache = MetadataCache(ttl=60, negative_ttl=0.01)
+    cache.put("exists", "s3://b/f", False)
+    time.sleep(0.02)
+    assert cache.get("exists", "s3://b/f") is None
+
+
+def test_parallel_lister():
+    from easy_io.backends.parallel_lister import ParallelLister
+
+    class FakeClient:
+        page_size = 3
+
+        def __init__(self, keys):
+            self.keys = sorted(keys)
+
+        def list_objects_v2(self, Bucket, Prefix, Delimiter=None, StartAfter="", ContinuationToken=None):
+            keys = [key for key in self.keys if key.startswith(Prefix) and key > (ContinuationToken or StartAfter)]
+            contents, prefixes, last = [], [], None
+            for key in keys:
+                if len(contents) + len(prefixes) == self.page_size:
+                    return {
+                        "Contents": contents,
+                        "CommonPrefixes": prefixes,
+                        "IsTruncated": True,
+                        "NextContinuationToken": last,
+                    }
+                if Delimiter and Delimiter in key[len(Prefix) :]:
+                    common = key[: key.index(Delimiter, len(Prefix)) + 1]
+                    if not prefixes or prefixes[-1]["Prefix"] != common:
+                        prefixes.append({"Prefix": common})
+                    last = common + "\U0010ffff"
+                else:
+                    contents.append({"Key": key, "Size": len(key)})
+                    last = key
+            return {"Contents": contents, "CommonPrefixes": prefixes, "IsTruncated": False}
+
+    keys = (
+        [f"p/flat/{i:03d}" for i in range(20)]
+        + [f"p/d{i}/s{j}/f" for i in range(4) for j in range(3)]
+        + ["p/a", "p/d1.txt"]
+    )
+    expected = [(key, len(key)) for key in sorted(keys)]
+    for min_shards in (1, 4, 100):
+        lister = ParallelLister(FakeClient(keys), max_workers=3, min_shards=min_shards)
+        assert list(lister.list_objects("bucket", "p/")) == expected
+        assert sorted(lister.list_objects("bucket", "p/", ordered=False)) == expected
+
+
+def test_listing_snapshot(tmp_path):
+    import pytest
+
+    from easy_io.backends.listing_snapshot import ListingSnapshot
+
+    entries = [("a/1.jpg", 1, '"e1"', 10.0), ("a/2.txt", 2, "e2", 20.0), ("b/3.jpg", 3), ("é.jpg", 4, "e4", None)]
+    path = str(tmp_path / "listing")
+    snapshot = ListingSnapshot.write(path, entries, prefix="s3://bucket/data/", version="v1")
+    assert len(snapshot) == 4 and snapshot.total_size == 10
+    assert list(snapshot.keys()) == [entry[0] for entry in entries]
+    assert list(snapshot.keys(prefix="a/")) == ["a/1.jpg", "a/2.txt"]
+    assert list(snapshot.keys(suffix=".jpg")) == ["a/1.jpg", "b/3.jpg", "é.jpg"]
+    assert list(snapshot.keys(prefix="a", suffix=(".txt", ".png"))) == ["a/2.txt"]
+    assert list(snapshot.entries(prefix="a/1")) == [("a/1.jpg", 1, "e1", 10.0)]
+
+    snapshot = ListingSnapshot(path)
+    assert snapshot.prefix == "s3://bucket/data/" and snapshot.etag(2) == ""
+    assert snapshot.is_fresh(ttl=60, version="v1")
+    assert not snapshot.is_fresh(version="v2")
+    assert not snapshot.is_fresh(ttl=-1)
+    assert len(ListingSnapshot.write(path, [])) == 0
+    with pytest.raises(ValueError):
+        ListingSnapshot.write(path, [("b", 1), ("a", 1)])
+
+
+def test_disk_cache(tmp_path):
+    import os
+
+    import pytest
+
+    from easy_io.backends.disk_cache import DiskCache
+
+    cache = DiskCache(str(tmp_path), max_bytes=25, low_watermark=0.5)
+    assert cache.get("s3://b/a", "e1", 10) is None
+    path = cache.put("s3://b/a", "e1", 10, b"0123456789")
+    assert cache.get("s3://b/a", "e1", 10) == b"0123456789"
+    assert cache.get("s3://b/a", "e2", 10) is None
+    cache.put("s3://b/a", "e2", 10, b"abcdefghij")
+    assert not os.path.exists(path)
+
+    def fail(tmp_path):
+        with open(tmp_path, "wb") as f:
+            f.write(b"partial")
+        raise ConnectionError
+
+    with pytest.raises(ConnectionError):
+        cache.fetch_file("s3://b/c", "e", 10, fail)
+    with pytest.raises(OSError):
+        cache.put("s3://b/c", "e", 10, b"short")
+    assert cache.lookup("s3://b/c", "e", 10) is None
+    assert sum(not name.startswith(".") for _, _, files in os.walk(tmp_path) for name in files) == 1
+
+    cache.put("s3://b/b", "e", 10, b"0123456789")
+    os.utime(cache.lookup("s3://b/b", "e", 10), (0, 0))  # least recently used
+    cache.put("s3://b/c", "e", 10, b"0123456789")
+    assert cache.lookup("s3://b/b", "e", 10) is None
+    assert cache.lookup("s3://b/a", "e2", 10) is None
+    assert cache.get("s3://b/c", "e", 10) == b"0123456789"
+    assert cache.stats()["size"] == 10 and cache.stats()["evictions"] == 2
+
+    # A pinned entry survives evictions by any cache instance until its context exits.
+    with cache.pin_file("s3://b/c", "e", 10, fail) as path:
+        DiskCache(str(tmp_path)).clear()
+        with open(path, "rb") as f:
+            assert f.read() == b"0123456789"
+    cache.clear()
+    assert not os.path.exists(path)
+
+
+def test_disk_cache_single_flight(tmp_path):
+    import multiprocessing
+    import os
+    import time
+
+    from easy_io.backends.disk_cache import DiskCache
+
+    counter = str(tmp_path / "downloads")
+
+    def download() -> bytes:
+        with open(counter, "a") as f:
+            f.write("x")
+        time.sleep(0.2)
+        return b"0123456789"
+
+    def read() -> None:
+        data = DiskCache(str(tmp_path / "cache")).fetch("s3://b/shard", "e", 10, download)
+        os._exit(0 if data == b"0123456789" else 1)
+
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=read) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0] * 4
+    with open(counter) as f:
+        assert f.read() == "x"
+
+    # An eviction leaves a fetch lock that is held in place and reaps it once it is free.
+    cache = DiskCache(str(tmp_path / "cache"))
+    _, path = cache._paths("s3://b/shard", "e", 10)
+    lock_path = os.path.join(os.path.dirname(path), ".lock-" + os.path.basename(path))
+    with cache._single_flight("s3://b/shard", "e", 10) as fetched:
+        assert fetched == path
+        cache.clear()
+        assert os.path.exists(lock_path) and not os.path.exists(path)
+    cache.put("s3://b/shard", "e", 10, b"0123456789")
+    cache.clear()
+    assert not os.path.exists(lock_path)
+
+
+def test_single_flight():
+    import concurrent.futures
+    import threading
+    import time
+
+    from easy_io.single_flight import SingleFlight
+
+    flight = SingleFlight()
+    started = threading.Event()
+    runs = []
+
+    def fetch():
+        runs.append(1)
+        started.set()
+        time.sleep(0.1)
+        return b"data"
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    for fn in (fetch, fail):
+        started.clear()
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            first = executor.submit(flight.do, "key", fn)
+            started.wait()
+            rest = [executor.submit(flight.do, "key", fn) for _ in range(3)]
+            futures = [first, *rest]
+            concurrent.futures.wait(futures)
+        if fn is fetch:
+            assert [future.result() for future in futures] == [b"data"] * 4
+        else:
+            assert all(isinstance(future.exception(), ValueError) for future in futures)
+    assert len(runs) == 1
+    assert flight.stats() == {"calls": 8, "coalesced": 6, "in_flight": 0}
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_load_cache(tmp_path):
+    import json
+
+    import numpy as np
+    import pytest
+
+    from easy_io import configure_load_cache, invalidate_load_cache, load, load_cache_stats
+
+    path = str(tmp_path / "config.json")
+    with open(path, "w") as f:
+        json.dump({"a": [1]}, f)
+    invalidate_load_cache()
+    before = load_cache_stats()
+
+    first = load(path, cache=True)
+    first["a"].append(2)  # copies by default, the cached object is unchanged
+    assert load(path, cache=True) == {"a": [1]}
+    assert load_cache_stats()["hits"] == before["hits"] + 1
+
+    with open(path, "w") as f:
+        json.dump({"a": [1, 2, 3]}, f)
+    assert load(path, cache=True) == {"a": [1, 2, 3]}
+    invalidate_load_cache(path)
+    assert load_cache_stats()["entries"] == 0
+
+    array_path = str(tmp_path / "array.npy")
+    np.save(array_path, np.arange(4))
+    configure_load_cache(copy=False)
+    try:
+        array = load(array_path, cache=True)
+        assert load(array_path, cache=True) is array
+        with pytest.raises(ValueError):
+            array[0] = 1
+        configure_load_cache(max_bytes=1)
+        load(path, cache=True)
+        assert load_cache_stats()["entries"] == 0
+    finally:
+        configure_load_cache(max_bytes=256 * 1024 * 1024, copy=True)
+        invalidate_load_cache()
+
+
+def test_object_nbytes():
+    import torch
+
+    from easy_io.object_cache import object_nbytes
+
+    # Arrays and tensors count with their decoded size, shared tensor storages once.
+    weight = torch.zeros(1024)
+    state = {"model": {"weight": weight, "view": weight[512:]}, "steps": [np.zeros(256)], "epoch": 3}
+    assert object_nbytes(state, default=100) == 4096 + 2048
+    # Other objects count with the default, e.g. the size of their file.
+    assert object_nbytes({"a": [1, 2, 3]}, default=100) == 100
+
+
+def test_aio(tmp_path):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    from easy_io import aio
+
+    async def main():
+        await aio.adump({"a": 1}, str(tmp_path / "a.json"))
+        await aio.aput(b"hello", str(tmp_path / "sub" / "b.bin"))
+        with ThreadPoolExecutor(2) as executor:
+            loaded = await asyncio.gather(
+                aio.aload(str(tmp_path / "a.json")),
+                aio.aload(str(tmp_path / "a.json"), offload=True),
+                aio.aload(str(tmp_path / "a.json"), offload=executor),
+            )
+        assert loaded == [{"a": 1}] * 3
+        assert await aio.aget(str(tmp_path / "sub" / "b.bin")) == b"hello"
+        assert await aio.aexists(str(tmp_path / "sub"))
+        assert not await aio.aexists(str(tmp_path / "missing"))
+        paths = [p async for p in aio.alist_dir_or_file(str(tmp_path), list_dir=False, recursive=True)]
+        assert sorted(paths) == ["a.json", "sub/b.bin"]
+        await aio.aclose()
+
+    asyncio.run(main())
+
+
+def test_batch(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from easy_io import dump_many, get_many, load_many, put_many
+    from easy_io.batch import run_batch
+
+    paths = [str(tmp_path / f"{i}.json") for i in range(20)]
+    assert all(error is None for _, error in dump_many((path, {"i": i}) for i, path in enumerate(paths)))
+    with ThreadPoolExecutor(2) as executor:
+        loaded = list(load_many([*paths, str(tmp_path / "missing.json")], decode_executor=executor))
+    assert [obj for _, obj in loaded[:-1]] == [{"i": i} for i in range(20)]
+    assert loaded[-1][0].endswith("missing.json") and isinstance(loaded[-1][1], FileNotFoundError)
+
+    errors = [error for _, error in put_many({str(tmp_path / f"{i}.bin"): bytes([i]) for i in range(5)})]
+    assert errors == [None] * 5
+    results = dict(get_many((str(tmp_path / f"{i}.bin") for i in range(5)), ordered=False))
+    assert results == {str(tmp_path / f"{i}.bin"): bytes([i]) for i in range(5)}
+
+    # Results wait to be consumed within the budget.
+    started = []
+
+    def fetch(i):
+        started.append(i)
+        return i, 10
+
+    batch = run_batch(fetch, range(100), max_workers=4, max_bytes_in_flight=25)
+    assert next(batch) == (0, 0)
+    assert len(started) <= 8
+    assert [i for i, _ in batch] == list(range(1, 100))
+
+
+def test_prefetcher(tmp_path):
+    import pytest
+
+    from easy_io import Prefetcher, dump
+
+    paths = [str(tmp_path / f"{i}.json") for i in range(10)]
+    for i, path in enumerate(paths):
+        dump({"i": i}, path)
+
+    with Prefetcher(iter(paths), depth=3, decode=True) as prefetcher:
+        assert [obj for _, obj in prefetcher] == [{"i": i} for i in range(10)]
+        stats = prefetcher.stats()
+    assert stats["fetched"] == stats["consumed"] == 10
+    assert stats["ahead"] == 0
+
+    prefetcher = Prefetcher([paths[0], str(tmp_path / "missing.json"), paths[1]], depth=2)
+    assert next(prefetcher)[0] == paths[0]
+    with pytest.raises(FileNotFoundError):
+        next(prefetcher)
+    assert next(prefetcher)[0] == paths[1]
+    prefetcher.close()
+    assert list(prefetcher) == []
+
+
+def test_get_range(tmp_path):
+    from easy_io import get_range, get_ranges
+    from easy_io.backends.base_backend import merge_ranges
+
+    assert merge_ranges([(10, 5), (0, 4), (4, 2), (100, 1)], max_gap=4) == [(0, 15, [1, 2, 0]), (100, 1, [3])]
+
+    path = str(tmp_path / "data.bin")
+    with open(path, "wb") as f:
+        f.write(bytes(range(256)))
+    assert get_range(path, 10, 3) == bytes([10, 11, 12])
+    assert get_range(path, 250, 100) == bytes(range(250, 256))
+    assert get_range(path, 300, 10) == b""
+    assert get_ranges(path, [(5, 2), (0, 1), (255, 1)]) == [bytes([5, 6]), b"\x00", b"\xff"]
+
+
+def test_remote_reader(tmp_path):
+    import io
+    import os
+    import tarfile
+
+    import easy_io
+    from easy_io.backends import LocalBackend
+    from easy_io.remote_io import RemoteReader
+
+    path = str(tmp_path / "shard.tar")
+    members = {f"{i}.bin": os.urandom(1_000_000) for i in range(8)}
+    with tarfile.open(path, "w") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    with RemoteReader(LocalBackend(), path, block_size=64 * 1024) as f:
+        with tarfile.open(fileobj=f) as tar:
+            # Only the first member is read, not the rest of the archive.
+            assert tar.extractfile(tar.next()).read() == members["0.bin"]
+        assert f.stats()["bytes_fetched"] < os.path.getsize(path) // 4
+        f.seek(-10, io.SEEK_END)
+        with open(path, "rb") as local:
+            assert f.read() == local.read()[-10:]
+            local.seek(12345)
+            f.seek(12345)
+            assert f.read(500_000) == local.read(500_000)
+
+    with easy_io.open(path) as f:
+        assert isinstance(f, io.BufferedReader)
+    with easy_io.open(path, buffering=0) as f:
+        assert isinstance(f, io.FileIO)
+    easy_io.dump({"a": 1}, str(tmp_path / "a.json"))
+    assert easy_io.load(str(tmp_path / "a.json"), lazy_io=True) == {"a": 1}
+
+    # A star import keeps the builtin open.
+    namespace = {}
+    exec("from easy_io import *", namespace)  # noqa: S102
+    assert "open" not in namespace
+
+
+def test_remote_reader_s3(moto_s3):
+    import pytest
+
+    from easy_io.remote_io import RemoteReader
+
+    data = np.random.bytes(300_000)
+    moto_s3.put(data, "s3://bkt/reader/a.bin")
+    with RemoteReader(moto_s3, "s3://bkt/reader/a.bin", block_size=100_000, max_readahead=0) as f:
+        assert f.read(100_000) == data[:100_000]
+        # The remaining blocks must not come from another version of the object.
+        moto_s3.put(np.random.bytes(300_000), "s3://bkt/reader/a.bin")
+        with pytest.raises(ConnectionError):
+            f.read()
+
+
+def test_open_write(tmp_path):
+    import os
+
+    import pytest
+
+    import easy_io
+    from easy_io.backends import LocalBackend
+    from easy_io.remote_io import BufferedWriter, TempFileWriter
+
+    path = str(tmp_path / "sub" / "a.bin")
+    with easy_io.open(path, "wb") as f:
+        f.write(b"hello")
+    assert easy_io.get(path) == b"hello"
+
+    with BufferedWriter(LocalBackend(), str(tmp_path / "b.bin")) as f:
+        f.write(b"world")
+    assert easy_io.get(str(tmp_path / "b.bin")) == b"world"
+    with pytest.raises(RuntimeError), BufferedWriter(LocalBackend(), str(tmp_path / "c.bin")) as f:
+        f.write(b"partial")
+        raise RuntimeError
+    assert not easy_io.exists(str(tmp_path / "c.bin"))
+    # A writer that is never closed writes nothing.
+    f = BufferedWriter(LocalBackend(), str(tmp_path / "d.bin"))
+    f.write(b"partial")
+    del f
+    assert not easy_io.exists(str(tmp_path / "d.bin"))
+
+    # Writers spooling to a temporary file upload it on a clean close only, and remove it in any case.
+    uploaded = []
+
+    def upload(local_path):
+        with open(local_path, "rb") as src:
+            uploaded.append(src.read())
+
+    with TempFileWriter(upload, "remote/e.bin") as f:
+        f.write(b"hello")
+        assert f.mode == "wb" and f.name == "remote/e.bin"
+    with pytest.raises(RuntimeError), TempFileWriter(upload, "remote/f.bin") as g:
+        g.write(b"partial")
+        raise RuntimeError
+    h = TempFileWriter(upload, "remote/g.bin")
+    h.write(b"partial")
+    local_paths = [f.local_path, g.local_path, h.local_path]
+    del h
+    assert uploaded == [b"hello"]
+    assert not any(os.path.exists(local_path) for local_path in local_paths)
+
+
+def test_msc_open_write(tmp_path):
+    import pytest
+
+    pytest.importorskip("multistorageclient")
+    from easy_io.backends import MSCBackend
+
+    config_path = tmp_path / "msc.json"
+    config_path.write_text(
+        json.dumps(
+            {"profiles": {"local": {"storage_provider": {"type": "file", "options": {"base_path": str(tmp_path)}}}}}
+        )
+    )
+    backend = MSCBackend(config_path=str(config_path), profile="local", metadata_cache_ttl=60)
+    with backend.open_write("data/a.bin") as f:
+        f.write(b"hello")
+        # Metadata cached while the upload is open is dropped once it is done.
+        assert not backend.exists("data/a.bin")
+    assert backend.exists("data/a.bin")
+    assert backend.get("data/a.bin") == b"hello"
+
+    # A failing block, e.g. an interrupted ``torch.save``, keeps the object as it was.
+    with pytest.raises(RuntimeError), backend.open_write("data/a.bin") as f:
+        f.write(b"partial")
+        raise RuntimeError
+    assert backend.get("data/a.bin") == b"hello"
+
+
+def test_s3_writer(moto_s3):
+    import concurrent.futures
+    import gc
+
+    import pytest
+
+    client = moto_s3._client
+    data = np.random.bytes(12 * 1024 * 1024 + 7)
+    with moto_s3.open_write("s3://bkt/writer/large.bin", part_size=5 * 1024 * 1024, max_pending_parts=2) as f:
+        for start in range(0, len(data), 1_000_000):
+            f.write(data[start : start + 1_000_000])
+        assert f._upload_id is not None
+    assert moto_s3.get("s3://bkt/writer/large.bin") == data
+
+    with moto_s3.open_write("s3://bkt/writer/empty.bin"):
+        pass
+    assert moto_s3.get("s3://bkt/writer/empty.bin") == b""
+
+    # Neither a failing block nor an abandoned writer creates an object or leaves an upload behind.
+    with pytest.raises(RuntimeError), moto_s3.open_write("s3://bkt/writer/failed.bin", part_size=5 * 1024**2) as f:
+        f.write(data)
+        raise RuntimeError
+    f = moto_s3.open_write("s3://bkt/writer/abandoned.bin", part_size=5 * 1024 * 1024)
+    f.write(data)
+    # Parts in flight hold the writer, it is collected once they are done.
+    concurrent.futures.wait(f._parts)
+    del f
+    gc.collect()
+    assert not moto_s3.exists("s3://bkt/writer/failed.bin")
+    assert not moto_s3.exists("s3://bkt/writer/abandoned.bin")
+    assert not client._client.list_multipart_uploads(Bucket="bkt").get("Uploads")
+
+
+def test_load_mmap(tmp_path):
+    import torch
+
+    import easy_io
+    from easy_io.backends import LocalBackend
+
+    array = np.arange(1000, dtype=np.float32)
+    easy_io.dump(array, str(tmp_path / "a.npy"))
+    loaded = easy_io.load(str(tmp_path / "a.npy"), mmap=True)
+    assert isinstance(loaded, np.memmap) and not loaded.flags.writeable
+    np.testing.assert_array_equal(loaded, array)
+    # Object arrays and .npz archives cannot be mapped and are read normally.
+    objects = np.array([{"a": 1}, None], dtype=object)
+    np.save(str(tmp_path / "objects.npy"), objects)
+    assert easy_io.load(str(tmp_path / "objects.npy"), mmap=True, allow_pickle=True).tolist() == objects.tolist()
+    np.savez(str(tmp_path / "a.npz"), x=array)
+    with easy_io.load(str(tmp_path / "a.npz"), file_format="npy", mmap=True) as npz:
+        np.testing.assert_array_equal(npz["x"], array)
+
+    easy_io.dump({"w": torch.arange(10)}, str(tmp_path / "a.pt"))
+    assert torch.equal(easy_io.load(str(tmp_path / "a.pt"), mmap=True)["w"], torch.arange(10))
+    easy_io.dump({"a": 1}, str(tmp_path / "a.pkl"))
+    assert easy_io.load(str(tmp_path / "a.pkl"), mmap=True) == {"a": 1}
+
+    view = LocalBackend().get(str(tmp_path / "a.npy"), mmap=True)
+    assert view.readonly and view.tobytes() == LocalBackend().get(str(tmp_path / "a.npy"))
+    (tmp_path / "empty").touch()
+    assert LocalBackend().get(str(tmp_path / "empty"), mmap=True) == b""
+
+
+def test_local_copy(tmp_path, monkeypatch):
+    import errno
+
+    import pytest
+
+    from easy_io.backends import LocalBackend, local_backend
+
+    src = tmp_path / "src"
+    (src / "a" / "b").mkdir(parents=True)
+    for ith, path in enumerate(["x.bin", "a/y.bin", "a/b/z.bin", "a/b/empty"]):
+        (src / path).write_bytes(bytes([ith]) * (ith * 100_000))
+    (src / "a" / "y.bin").chmod(0o600)
+
+    backend = LocalBackend()
+    assert backend.copytree(str(src), str(tmp_path / "dst"), max_workers=2) == str(tmp_path / "dst")
+    for path in src.rglob("*"):
+        copied = tmp_path / "dst" / path.relative_to(src)
+        assert copied.is_dir() if path.is_dir() else copied.read_bytes() == path.read_bytes()
+    assert (tmp_path / "dst" / "a" / "y.bin").stat().st_mode & 0o777 == 0o600
+    with pytest.raises(FileExistsError):
+        backend.copytree(str(src), str(tmp_path / "dst"))
+
+    # Every engine falls back to the next one when the files do not support it, but real errors are raised.
+    def unsupported(*args):
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    def denied(*args):
+        raise OSError(errno.EPERM, "Operation not permitted")
+
+    unsupported_errors = local_backend._UNSUPPORTED_COPY_ERRORS
+    monkeypatch.setattr(local_backend, "_COPY_ENGINES", [("unsupported", unsupported, unsupported_errors)])
+    assert local_backend._copy_file(src / "a" / "b" / "z.bin", tmp_path / "z.bin") == "buffered"
+    monkeypatch.setattr(local_backend, "_COPY_ENGINES", [("denied", denied, unsupported_errors)])
+    with pytest.raises(PermissionError):
+        local_backend._copy_file(src / "a" / "y.bin", tmp_path / "y.bin")
+    assert backend.copyfile(str(src / "x.bin"), str(tmp_path)) == str(tmp_path / "x.bin")
+    assert (tmp_path / "z.bin").read_bytes() == (src / "a" / "b" / "z.bin").read_bytes()
+
+
+def test_s3_transfer_pool(moto_s3, s3_objects):
+    for path, data in s3_objects.items():
+        assert moto_s3.get(path) == data
+        assert moto_s3.fast_get(path) == data
+        with moto_s3.fast_get(path, zero_copy=True) as buffer:
+            assert buffer.tobytes() == data
+
+    # The pool of worker processes is started again after a shutdown.
+    moto_s3._client.shutdown()
+    assert moto_s3.fast_get("s3://bkt/objects/large.bin") == s3_objects["s3://bkt/objects/large.bin"]
+
+
+def test_s3_fast_get_to_file(moto_s3, s3_objects, tmp_path):
+    for path, data in s3_objects.items():
+        local_path = tmp_path / path.split("/")[-1]
+        local_path.write_bytes(b"stale content that is longer than the small object")
+        moto_s3.fast_get_to_file(path, local_path)
+        assert local_path.read_bytes() == data
+
+
+def test_s3_fast_put(moto_s3, tmp_path):
+    import io
+
+    data = np.random.bytes(11 * 1024 * 1024 + 5)
+    (tmp_path / "source.bin").write_bytes(data)
+    # Workers read their parts from the file, or from shared memory for in-memory data.
+    for ith, obj in enumerate([str(tmp_path / "source.bin"), tmp_path / "source.bin", data, io.BytesIO(data), b""]):
+        moto_s3.fast_put(obj, f"s3://bkt/fast_put/{ith}.bin")
+        assert moto_s3.get(f"s3://bkt/fast_put/{ith}.bin") == (data if obj != b"" else b"")
+    assert not moto_s3._client._client.list_multipart_uploads(Bucket="bkt").get("Uploads")
+
+
+def test_s3_fast_put_resume(moto_s3, tmp_path, monkeypatch):
+    import asyncio
+    from math import ceil
+
+    from botocore.exceptions import ClientError
+
+    from easy_io.backends import boto3_client
+
+    client = moto_s3._client
+    monkeypatch.setattr(boto3_client, "UPLOAD_MANIFEST_DIR", str(tmp_path / "manifests"))
+    # Run the part uploads in this process, so that the patched part upload below is used.
+    monkeypatch.setattr(client.transfer_pool, "map", lambda fn, iterable: [fn(args) for args in iterable])
+    monkeypatch.setattr(boto3_client, "_WORKER_STATE", {})
+    upload_single_part_async = boto3_client.upload_single_part_async
+    sent = []
+
+    async def flaky_upload(s3, bucket, key, part_number, data, upload_id):
+        sent.append(part_number)
+        if fail_parts is not None and part_number in fail_parts:
+            raise ClientError({"Error": {"Code": "SlowDown"}}, "UploadPart")
+        return await upload_single_part_async(s3, bucket, key, part_number, data, upload_id)
+
+    monkeypatch.setattr(boto3_client, "upload_single_part_async", flaky_upload)
+    data = np.random.bytes(16 * 1024 * 1024 + 7)
+    path = "s3://bkt/fast_put/resumed.bin"
+    fail_parts = {2, 4}
+    with pytest.raises(ConnectionError):
+        client.fast_put(data, path, resumable=True)
+    manifest = boto3_client.UploadManifest("bkt", "fast_put/resumed.bin")
+    state = manifest.load()
+    num_parts = ceil(len(data) / state["part_size"])
+    assert (
+        set(client.list_parts("bkt", "fast_put/resumed.bin", state["upload_id"]))
+        == set(range(1, num_parts + 1)) - fail_parts
+    )
+
+    # Parts listed by S3 whose ETag matches the MD5 of the local data are not sent again.
+    sent.clear()
+    fail_parts = None
+    client.fast_put(data, path, resumable=True)
+    assert sorted(sent) == [2, 4]
+    assert moto_s3.get(path) == data
+    assert manifest.load() is None
+    assert not client._client.list_multipart_uploads(Bucket="bkt").get("Uploads")
+
+    # A failed completion aborts the upload unless it can still be resumed.
+    complete_multipart_upload = client._client.complete_multipart_upload
+    for resumable, code, kept in [
+        (False, "InternalError", False),
+        (True, "InvalidPart", False),
+        (True, "InternalError", True),
+    ]:
+
+        def failed_completion(code=code, **kwargs):
+            raise ClientError({"Error": {"Code": code}}, "CompleteMultipartUpload")
+
+        monkeypatch.setattr(client._client, "complete_multipart_upload", failed_completion)
+        with pytest.raises(ClientError):
+            client.fast_put(data, path, resumable=resumable)
+        assert bool(client._client.list_multipart_uploads(Bucket="bkt").get("Uploads")) == kept
+        assert (manifest.load() is not None) == kept
+    monkeypatch.setattr(client._client, "complete_multipart_upload", complete_multipart_upload)
+    client.fast_put(data, path, resumable=True)
+    assert moto_s3.get(path) == data
+    assert not client._client.list_multipart_uploads(Bucket="bkt").get("Uploads")
+
+    loop = boto3_client._worker_loop()
+    for s3 in boto3_client._WORKER_STATE["clients"].values():
+        loop.run_until_complete(s3.__aexit__(None, None, None))
+    loop.close()
+    asyncio.set_event_loop(None)
+
+
+def test_s3_get_auto(moto_s3, s3_objects, monkeypatch):
+    from botocore.exceptions import ClientError
+
+    client = moto_s3._client
+    for path, data in s3_objects.items():
+        assert client.get_auto(path) == data
+        assert client.get_threaded(path, num_threads=4) == data
+
+    # Errors other than the range of an empty object are retried once per attempt, without a second full get.
+    calls = []
+
+    def denied(**kwargs):
+        calls.append(kwargs)
+        raise ClientError({"Error": {"Code": "AccessDenied"}}, "GetObject")
+
+    monkeypatch.setattr(client._client, "get_object", denied)
+    monkeypatch.setattr(client._client, "download_fileobj", denied)
+    with pytest.raises(ConnectionError):
+        client.get_auto("s3://bkt/objects/small.bin")
+    assert len(calls) == client.max_attempt and all("Range" in call for call in calls)
+
+
+def test_s3_copytree(moto_s3, monkeypatch):
+    from easy_io.backends import boto3_backend
+
+    for ith in range(20):
+        moto_s3.put(str(ith).encode(), f"s3://bkt/tree/{ith // 5}/{ith}.txt")
+
+    # Copies start while the listing is streamed, with a bounded number of them queued.
+    monkeypatch.setattr(boto3_backend, "COPY_THREADS", 2)
+    listed, listed_at_copy = [], []
+    list_dir_or_file, copy = moto_s3.list_dir_or_file, moto_s3._client.copy
+
+    def listing(*args, **kwargs):
+        for path in list_dir_or_file(*args, **kwargs):
+            listed.append(path)
+            yield path
+
+    def copy_and_record(src, dst):
+        listed_at_copy.append(len(listed))
+        copy(src, dst)
+
+    monkeypatch.setattr(moto_s3, "list_dir_or_file", listing)
+    monkeypatch.setattr(moto_s3._client, "copy", copy_and_record)
+    moto_s3.copytree("s3://bkt/tree", "s3://bkt/tree_copy")
+    assert min(listed_at_copy) < len(listed) == 20
+    for ith in range(20):
+        assert moto_s3.get(f"s3://bkt/tree_copy/{ith // 5}/{ith}.txt") == str(ith).encode()
@@ -1,5 +1,7 @@
 from abc import ABCMeta, abstractmethod
 
+from easy_io.buffers import BufferReader, map_file
+
 
 class BaseFileHandler(metaclass=ABCMeta):
     # `str_like` is a flag to indicate whether the type of file object is
@@ -7,6 +9,10 @@ class BaseFileHandler(metaclass=ABCMeta):
     # objects but json only processes str-like object. If it is str-like
     # object, `StringIO` will be used to process the buffer.
     str_like = True
+    # `sequential_dump` is a flag to indicate whether `dump_to_fileobj` only
+    # writes sequentially, without seeking. Such handlers can dump straight
+    # into a streaming upload, see `easy_io.open`.
+    sequential_dump = False
 
     @abstractmethod
     def load_from_fileobj(self, file, **kwargs):
@@ -24,6 +30,11 @@ class BaseFileHandler(metaclass=ABCMeta):
         with open(filepath, mode) as f:
             return self.load_from_fileobj(f, **kwargs)
 
+    def load_from_mmap(self, filepath, **kwargs):
+        """Load a local file that is memory-mapped instead of read into memory."""
+        with BufferReader(map_file(filepath)) as f:
+            return self.load_from_fileobj(f, **kwargs)
+
     def dump_to_path(self, obj, filepath, mode="w", **kwargs):
         with open(filepath, mode) as f:
             self.dump_to_fileobj(obj, f, **kwargs)
@@ -5,6 +5,7 @@ from easy_io.handlers.base import BaseFileHandler
 
 class ByteHandler(BaseFileHandler):
     str_like = False
+    sequential_dump = True
 
     def load_from_fileobj(self, file: IO[bytes], **kwargs):
         file.seek(0)
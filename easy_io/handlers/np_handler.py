@@ -8,6 +8,7 @@ from easy_io.handlers.base import BaseFileHandler
 
 class NumpyHandler(BaseFileHandler):
     str_like = False
+    sequential_dump = True
 
     def load_from_fileobj(self, file: IO[bytes], **kwargs) -> Any:
         """
@@ -35,6 +36,35 @@ class NumpyHandler(BaseFileHandler):
         """
         return super().load_from_path(filepath, mode="rb", **kwargs)
 
+    def load_from_mmap(self, filepath: str, **kwargs) -> Any:
+        """
+        Load a NumPy array from a file path as a read-only memory map.
+
+        Parameters:
+            filepath (str): The path to the file to load.
+            **kwargs: Additional keyword arguments passed to `np.load`;
+                `mmap_mode` defaults to "r".
+
+        Arrays of Python objects cannot be mapped and are loaded like
+        :meth:`load_from_fileobj` does. ".npz" archives cannot be mapped
+        either; their members are read lazily from the file.
+
+        Returns:
+            numpy.memmap: The array backed by the file, or the loaded object
+            for the cases above.
+        """
+        with open(filepath, "rb") as f:
+            is_npy = f.read(len(np.lib.format.MAGIC_PREFIX)) == np.lib.format.MAGIC_PREFIX
+        if not is_npy:
+            return np.load(filepath, **kwargs)
+        kwargs.setdefault("mmap_mode", "r")
+        try:
+            return np.load(filepath, **kwargs)
+        except ValueError:
+            # Python objects in the dtype, their pickles cannot be mapped.
+            kwargs.pop("mmap_mode")
+            return super().load_from_mmap(filepath, **kwargs)
+
     def dump_to_str(self, obj: np.ndarray, **kwargs) -> str:
         """
         Serialize a NumPy array to a string in binary format.
@@ -7,6 +7,7 @@ from easy_io.handlers.base import BaseFileHandler
 
 class PickleHandler(BaseFileHandler):
     str_like = False
+    sequential_dump = True
 
     def load_from_fileobj(self, file: BytesIO, **kwargs):
         return pickle.load(file, **kwargs)  # noqa: S301
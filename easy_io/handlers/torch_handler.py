@@ -8,10 +8,15 @@ from easy_io.handlers.base import BaseFileHandler
 
 class TorchHandler(BaseFileHandler):
     str_like = False
+    sequential_dump = True
 
     def load_from_fileobj(self, file, **kwargs):
         return torch.load(file, **kwargs)
 
+    def load_from_mmap(self, filepath, **kwargs):
+        # Tensor storages stay in the mapped file.
+        return torch.load(filepath, mmap=True, **kwargs)
+
     def dump_to_fileobj(self, obj, file, **kwargs):
         torch.save(obj, file, **kwargs)
 
@@ -1,16 +1,25 @@
+import builtins
 import json
+import os
 import warnings
-from collections.abc import Generator, Iterator
+from collections.abc import Generator, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor
 from contextlib import contextmanager
-from io import BytesIO, StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
 from typing import IO, Any, Optional, Union
 
-from easy_io.backends import backends, prefix_to_backends
+from easy_io.backends import LocalBackend, backends, prefix_to_backends
+from easy_io.batch import run_batch
+from easy_io.buffers import BufferReader
 from easy_io.file_client import FileClient
 from easy_io.handlers import file_handlers
+from easy_io.object_cache import ObjectCache, object_nbytes
+from easy_io.remote_io import BufferedWriter, RemoteReader
+from easy_io.single_flight import SingleFlight
 
 __all__ = [
+    "configure_load_cache",
     "copy_if_symlink_fails",
     "copyfile",
     "copyfile_from_local",
@@ -19,12 +28,17 @@ __all__ = [
     "copytree_from_local",
     "copytree_to_local",
     "dump",
+    "dump_many",
     "exists",
     "generate_presigned_url",
     "get",
     "get_file_backend",
     "get_local_path",
+    "get_many",
+    "get_range",
+    "get_ranges",
     "get_text",
+    "invalidate_load_cache",
     "is_filepath",
     "isdir",
     "isfile",
@@ -32,14 +46,25 @@ __all__ = [
     "list_dir",
     "list_dir_or_file",
     "load",
+    "load_cache_stats",
+    "load_many",
     "put",
+    "put_many",
     "put_text",
     "remove",
+    "remove_many",
     "rmtree",
     "set_s3_backend",
+    "single_flight_stats",
 ]
 
 backend_instances: dict = {}
+# Concurrent reads of the same file share one fetch, see ``single_flight_stats``.
+_get_flight = SingleFlight()
+_load_flight = SingleFlight()
+# Decoded objects of ``load(..., cache=True)``.
+_load_cache = ObjectCache()
+_MISSING = object()
 
 
 def is_filepath(filepath):
@@ -182,6 +207,9 @@ def get(
 ) -> bytes:
     """Read bytes from a given ``filepath`` with 'rb' mode.
 
+    Threads that read the same file of the same backend at the same time
+    share one request and all receive its result.
+
     Args:
         filepath (str or Path): Path to read data.
         backend_args (dict, optional): Arguments to instantiate the
@@ -202,7 +230,67 @@ def get(
         enable_singleton=True,
         backend_key=backend_key,
     )
-    return backend.get(filepath)
+    return _get_flight.do((backend, str(filepath)), lambda: backend.get(filepath))
+
+
+def configure_load_cache(max_bytes: Optional[int] = None, copy: Optional[bool] = None) -> None:
+    """Configure the cache of decoded objects used by ``load(..., cache=True)``.
+
+    Args:
+        max_bytes (int, optional): Total size of the cached objects. The
+            buffers of numpy arrays and torch tensors are counted with their
+            decoded size, other objects with the size of their file, which
+            can be several times smaller than the decoded object. The least
+            recently used objects are evicted beyond it. Defaults to 256 MB
+            initially.
+        copy (bool, optional): Whether every caller receives a deep copy of
+            the cached object (True, the default) or all callers share one
+            read-only object (False).
+
+    Examples:
+        >>> configure_load_cache(max_bytes=1024**3, copy=False)
+        >>> vocab = load('s3://bucket/vocab.json', cache=True)
+    """
+    if max_bytes is not None:
+        _load_cache.max_bytes = max_bytes
+    if copy is not None:
+        _load_cache.copy = copy
+    _load_cache.evict()
+
+
+def invalidate_load_cache(filepath: Optional[Union[str, Path]] = None) -> None:
+    """Drop the cached objects of ``filepath``, or all cached objects.
+
+    Args:
+        filepath (str or Path, optional): The file whose objects to drop.
+            Defaults to None, which drops everything.
+    """
+    _load_cache.invalidate(None if filepath is None else str(filepath))
+
+
+def load_cache_stats() -> dict[str, int]:
+    """Return the hits, misses and evictions of the cache of decoded objects and its size.
+
+    Examples:
+        >>> load_cache_stats()
+        {'hits': 1000, 'misses': 3, 'evictions': 0, 'entries': 3, 'size': 52428}
+    """
+    return _load_cache.stats()
+
+
+def single_flight_stats() -> dict[str, dict[str, int]]:
+    """Return how many concurrent :func:`get` and :func:`load` calls shared a running read.
+
+    Returns:
+        dict: For ``'get'`` and ``'load'``, the number of ``calls``, how many
+        of them were ``coalesced`` into a running call and the calls
+        currently ``in_flight``.
+
+    Examples:
+        >>> single_flight_stats()
+        {'get': {'calls': 64, 'coalesced': 56, 'in_flight': 0}, 'load': {'calls': 0, 'coalesced': 0, 'in_flight': 0}}
+    """
+    return {"get": _get_flight.stats(), "load": _load_flight.stats()}
 
 
 def get_text(
@@ -238,6 +326,144 @@ def get_text(
     return backend.get_text(filepath, encoding)
 
 
+def get_range(
+    filepath: Union[str, Path],
+    offset: int,
+    length: int,
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+) -> bytes:
+    """Read ``length`` bytes at ``offset`` of ``filepath``.
+
+    Only the range is transferred: with ``pread`` locally and ``Range``
+    requests on S3 and HTTP. Fewer bytes are returned at the end of the file.
+
+    Args:
+        filepath (str or Path): Path to read data.
+        offset (int): Position of the first byte.
+        length (int): Number of bytes.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+
+    Returns:
+        bytes: The data of the range.
+
+    Examples:
+        >>> header_size = int.from_bytes(get_range('s3://bucket/model.safetensors', 0, 8), 'little')
+    """
+    backend = get_file_backend(
+        filepath,
+        backend_args=backend_args,
+        enable_singleton=True,
+        backend_key=backend_key,
+    )
+    return backend.get_range(filepath, offset, length)
+
+
+def get_ranges(
+    filepath: Union[str, Path],
+    ranges: Sequence[tuple[int, int]],
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+) -> list[bytes]:
+    """Read several ``(offset, length)`` ranges of ``filepath``.
+
+    Adjacent and overlapping ranges are read with one request; on S3 also
+    ranges that are close to each other, and the requests run concurrently.
+
+    Args:
+        filepath (str or Path): Path to read data.
+        ranges (Sequence[tuple[int, int]]): The ranges to read.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+
+    Returns:
+        list[bytes]: The data of every range.
+
+    Examples:
+        >>> get_ranges('s3://bucket/index.bin', [(0, 16), (4096, 16)])
+        [b'...', b'...']
+    """
+    backend = get_file_backend(
+        filepath,
+        backend_args=backend_args,
+        enable_singleton=True,
+        backend_key=backend_key,
+    )
+    return backend.get_ranges(filepath, ranges)
+
+
+# Not in ``__all__``: a star import must not shadow the builtin ``open``.
+def open(  # noqa: A001
+    filepath: Union[str, Path],
+    mode: str = "rb",
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+    **kwargs,
+) -> IO[bytes]:
+    """Open a file as a binary file object for reading or writing.
+
+    Local files are opened with the builtin :func:`open`, which gets
+    ``kwargs``.
+
+    For reading ('rb'), remote files are read lazily with ranged reads
+    through a seekable :class:`RemoteReader`, which caches blocks and reads
+    ahead of sequential access, so handlers that touch only part of a file
+    download only that part. Backends without ``stat`` read the whole file
+    into memory.
+
+    For writing ('wb'), S3 streams the data with a multipart upload whose
+    parts are uploaded while the caller writes (:class:`S3Writer`), and MSC
+    uses the file object of its storage client. Other backends buffer the
+    data and ``put`` it on close. The file is only written when the file
+    object is closed, and not if the ``with`` block raises.
+
+    Args:
+        filepath (str or Path): Path to open.
+        mode (str): 'rb' or 'wb'. Defaults to 'rb'.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+        **kwargs: Arguments of :class:`RemoteReader`, e.g. ``block_size``,
+            of the backend's ``open_write``, e.g. ``part_size`` on S3, or of
+            the builtin :func:`open` for local files, e.g. ``buffering``.
+
+    Returns:
+        IO[bytes]: The file object, to be closed by the caller.
+
+    Examples:
+        >>> with open('s3://bucket/shard.tar') as f, tarfile.open(fileobj=f) as tar:
+        ...     data = tar.extractfile('sample_0042.jpg').read()
+        >>> with open('s3://bucket/model.pt', 'wb') as f:
+        ...     torch.save(state_dict, f)
+    """
+    if mode not in ("rb", "wb"):
+        raise ValueError(f"Unsupported mode: {mode!r}")
+    backend = get_file_backend(
+        filepath,
+        backend_args=backend_args,
+        enable_singleton=True,
+        backend_key=backend_key,
+    )
+    if isinstance(backend, LocalBackend):
+        if mode == "wb":
+            os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+        return builtins.open(filepath, mode, **kwargs)
+    if mode == "wb":
+        if hasattr(backend, "open_write"):
+            return backend.open_write(filepath, **kwargs)
+        if kwargs:
+            raise TypeError(f"{type(backend).__name__} takes no arguments for writing: {sorted(kwargs)}")
+        return BufferedWriter(backend, filepath)
+    if hasattr(backend, "stat"):
+        return RemoteReader(backend, filepath, **kwargs)
+    if kwargs:
+        raise TypeError(f"{type(backend).__name__} takes no arguments for reading: {sorted(kwargs)}")
+    return BufferReader(backend.get(filepath))
+
+
 def put(
     obj: bytes,
     filepath: Union[str, Path],
@@ -698,7 +924,7 @@ def copytree_to_local(
         '/path/of/dir'
     """
     Path(dst).parent.mkdir(parents=True, exist_ok=True)
-    backend = get_file_backend(dst, backend_args=backend_args, enable_singleton=True, backend_key=backend_key)
+    backend = get_file_backend(src, backend_args=backend_args, enable_singleton=True, backend_key=backend_key)
     return backend.copytree_to_local(src, dst)
 
 
@@ -734,6 +960,55 @@ def remove(
     backend.remove(filepath)
 
 
+def remove_many(
+    filepaths: Iterable[Union[str, Path]],
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+) -> dict[str, Exception]:
+    """Remove many files.
+
+    Backends that support it remove the files with batched requests, e.g.
+    ``DeleteObjects`` on S3. Missing files are ignored and an error for one
+    file does not stop the others.
+
+    Args:
+        filepaths (Iterable[str or Path]): Paths to be removed.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+
+    Returns:
+        dict[str, Exception]: The error of every path that could not be
+        removed.
+
+    Examples:
+        >>> errors = remove_many(['s3://path/of/file1', 's3://path/of/file2'])
+        >>> assert not errors
+    """
+    groups: dict[int, tuple[Any, list]] = {}
+    for filepath in filepaths:
+        backend = get_file_backend(
+            filepath,
+            backend_args=backend_args,
+            enable_singleton=True,
+            backend_key=backend_key,
+        )
+        groups.setdefault(id(backend), (backend, []))[1].append(filepath)
+
+    errors: dict[str, Exception] = {}
+    for backend, paths in groups.values():
+        if hasattr(backend, "remove_many"):
+            errors.update(backend.remove_many(paths))
+            continue
+        for path in paths:
+            try:
+                backend.remove(path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                errors[str(path)] = e
+    return errors
+
+
 def rmtree(
     dir_path: Union[str, Path],
     backend_args: Optional[dict] = None,
@@ -907,6 +1182,220 @@ def generate_presigned_url(
     return backend.generate_presigned_url(url, client_method, expires_in)
 
 
+def _file_format(file: Union[str, Path], file_format: Optional[str]) -> str:
+    file_format = (file_format or str(file).split(".")[-1]).lower()
+    if file_format not in file_handlers:
+        raise TypeError(f"Unsupported format: {file_format}")
+    return file_format
+
+
+def _decode(file_format: str, data: Union[str, bytes], kwargs: dict) -> Any:
+    """Decode the content of a file; a module-level function so process pools can run it."""
+    handler = file_handlers[file_format]
+    if handler.str_like:
+        with StringIO(data.decode() if isinstance(data, bytes) else data) as f:
+            return handler.load_from_fileobj(f, **kwargs)
+    with BytesIO(data) as f:
+        return handler.load_from_fileobj(f, **kwargs)
+
+
+def _encode(file_format: str, obj: Any, kwargs: dict) -> Union[str, bytes]:
+    handler = file_handlers[file_format]
+    with StringIO() if handler.str_like else BytesIO() as f:
+        handler.dump_to_fileobj(obj, f, **kwargs)
+        return f.getvalue()
+
+
+def get_many(
+    filepaths: Iterable[Union[str, Path]],
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+    max_workers: int = 32,
+    max_bytes_in_flight: Optional[int] = 1024**3,
+    ordered: bool = True,
+) -> Iterator[tuple[str, Union[bytes, Exception]]]:
+    """Read many files concurrently.
+
+    The paths may belong to different backends and are read lazily, so
+    ``filepaths`` may be a stream. An error for one file is yielded as its
+    result and does not stop the others.
+
+    Args:
+        filepaths (Iterable[str or Path]): Paths to read.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+        max_workers (int): Number of concurrent reads. Defaults to 32.
+        max_bytes_in_flight (int, optional): No more reads are started while
+            this many bytes are read but not yet consumed. Defaults to 1 GB.
+        ordered (bool): Whether to yield in the order of ``filepaths`` instead
+            of as the reads complete. Defaults to True.
+
+    Yields:
+        tuple[str, bytes or Exception]: The path and its bytes or error.
+
+    Examples:
+        >>> for path, data in get_many(f's3://bucket/{i}.bin' for i in range(256)):
+        ...     if isinstance(data, Exception):
+        ...         raise data
+    """
+
+    def read(filepath: Union[str, Path]) -> tuple[bytes, int]:
+        data = get(filepath, backend_args=backend_args, backend_key=backend_key)
+        return data, len(data)
+
+    for filepath, data in run_batch(read, filepaths, max_workers, max_bytes_in_flight, ordered):
+        yield str(filepath), data
+
+
+def load_many(
+    filepaths: Iterable[Union[str, Path]],
+    file_format: Optional[str] = None,
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+    max_workers: int = 32,
+    max_bytes_in_flight: Optional[int] = 1024**3,
+    ordered: bool = True,
+    decode_executor: Optional[Executor] = None,
+    **kwargs,
+) -> Iterator[tuple[str, Any]]:
+    """Load many files concurrently.
+
+    Like :func:`get_many`, but every file is decoded by the handler of
+    ``file_format`` or of its extension.
+
+    Args:
+        filepaths (Iterable[str or Path]): Paths to load.
+        file_format (str, optional): Format of all files. Inferred from the
+            extension of each file if not given.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+        max_workers (int): Number of concurrent loads. Defaults to 32.
+        max_bytes_in_flight (int, optional): Same as :func:`get_many`,
+            counted in file bytes. Defaults to 1 GB.
+        ordered (bool): Same as :func:`get_many`. Defaults to True.
+        decode_executor (Executor, optional): Executor to decode in, e.g. a
+            ``ProcessPoolExecutor`` for CPU-heavy formats. Defaults to
+            decoding in the reading threads.
+        **kwargs: Arguments of the format handler.
+
+    Yields:
+        tuple[str, Any]: The path and its object or error.
+
+    Examples:
+        >>> with ProcessPoolExecutor(8) as pool:
+        ...     samples = [obj for _, obj in load_many(paths, decode_executor=pool)]
+    """
+
+    def read(filepath: Union[str, Path]) -> tuple[Any, int]:
+        fmt = _file_format(filepath, file_format)
+        data = get(filepath, backend_args=backend_args, backend_key=backend_key)
+        if decode_executor is None:
+            return _decode(fmt, data, kwargs), len(data)
+        return decode_executor.submit(_decode, fmt, data, kwargs).result(), len(data)
+
+    for filepath, obj in run_batch(read, filepaths, max_workers, max_bytes_in_flight, ordered):
+        yield str(filepath), obj
+
+
+def put_many(
+    items: Union[Mapping[Union[str, Path], bytes], Iterable[tuple[Union[str, Path], bytes]]],
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+    max_workers: int = 32,
+    max_bytes_in_flight: Optional[int] = 1024**3,
+    ordered: bool = True,
+) -> Iterator[tuple[str, Optional[Exception]]]:
+    """Write many files concurrently.
+
+    Args:
+        items (Mapping or Iterable[tuple]): ``(filepath, data)`` pairs, read
+            lazily.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+        max_workers (int): Number of concurrent writes. Defaults to 32.
+        max_bytes_in_flight (int, optional): No more items are taken from
+            ``items`` while this many bytes are being written. Defaults to
+            1 GB.
+        ordered (bool): Same as :func:`get_many`. Defaults to True.
+
+    Yields:
+        tuple[str, Exception or None]: The path and its error, or None when
+        it was written.
+
+    Examples:
+        >>> errors = {path: e for path, e in put_many({'s3://bucket/a': b'a', 's3://bucket/b': b'b'}) if e}
+    """
+    if isinstance(items, Mapping):
+        items = items.items()
+
+    def write(item: tuple[Union[str, Path], bytes]) -> tuple[None, int]:
+        put(item[1], item[0], backend_args=backend_args, backend_key=backend_key)
+        return None, 0
+
+    for (filepath, _), error in run_batch(
+        write, items, max_workers, max_bytes_in_flight, ordered, cost=lambda item: len(item[1])
+    ):
+        yield str(filepath), error
+
+
+def dump_many(
+    items: Union[Mapping[Union[str, Path], Any], Iterable[tuple[Union[str, Path], Any]]],
+    file_format: Optional[str] = None,
+    backend_args: Optional[dict] = None,
+    backend_key: Optional[str] = None,
+    max_workers: int = 32,
+    ordered: bool = True,
+    encode_executor: Optional[Executor] = None,
+    **kwargs,
+) -> Iterator[tuple[str, Optional[Exception]]]:
+    """Dump many objects to files concurrently.
+
+    Args:
+        items (Mapping or Iterable[tuple]): ``(filepath, obj)`` pairs, read
+            lazily.
+        file_format (str, optional): Format of all files. Inferred from the
+            extension of each file if not given.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+        max_workers (int): Number of concurrent writes. Defaults to 32.
+        ordered (bool): Same as :func:`get_many`. Defaults to True.
+        encode_executor (Executor, optional): Executor to encode in, e.g. a
+            ``ProcessPoolExecutor``. Defaults to encoding in the writing
+            threads.
+        **kwargs: Arguments of the format handler.
+
+    Yields:
+        tuple[str, Exception or None]: The path and its error, or None when
+        it was written.
+
+    Examples:
+        >>> for path, error in dump_many((f's3://bucket/{i}.json', {'i': i}) for i in range(256)):
+        ...     assert error is None
+    """
+    if isinstance(items, Mapping):
+        items = items.items()
+
+    def write(item: tuple[Union[str, Path], Any]) -> tuple[None, int]:
+        filepath, obj = item
+        fmt = _file_format(filepath, file_format)
+        if encode_executor is None:
+            data = _encode(fmt, obj, kwargs)
+        else:
+            data = encode_executor.submit(_encode, fmt, obj, kwargs).result()
+        if isinstance(data, str):
+            put_text(data, filepath, backend_args=backend_args, backend_key=backend_key)
+        else:
+            put(data, filepath, backend_args=backend_args, backend_key=backend_key)
+        return None, 0
+
+    for (filepath, _), error in run_batch(write, items, max_workers, None, ordered):
+        yield str(filepath), error
+
+
 def load(  # noqa: C901
     file: Union[str, Path, IO[Any]],
     file_format: Optional[str] = None,
@@ -914,6 +1403,10 @@ def load(  # noqa: C901
     fast_backend: bool = False,
     backend_args: Optional[dict] = None,
     backend_key: Optional[str] = None,
+    share_object: bool = False,
+    cache: bool = False,
+    lazy_io: bool = False,
+    mmap: bool = False,
     **kwargs,
 ):
     """Load data from json/yaml/pickle files.
@@ -934,10 +1427,30 @@ def load(  # noqa: C901
             FileClient. See :class:`mmengine.fileio.FileClient` for details.
             Defaults to None. It will be deprecated in future. Please use
             ``backend_args`` instead.
-        fast_backend: bool: Whether to use multiprocess. Defaults to False.
+        fast_backend: bool: Whether to use multiprocess. The downloaded data
+            is read by the handler in place, without extra copies. Defaults to
+            False.
         backend_args (dict, optional): Arguments to instantiate the
             prefix of uri corresponding backend. Defaults to None.
             New in v0.2.0.
+        share_object (bool): Whether threads loading the same file at the
+            same time share one decoded object instead of only the
+            downloaded bytes. The object must then not be modified in
+            place. Defaults to False.
+        cache (bool): Whether to serve the object from the in-memory LRU
+            cache of decoded objects while the file is unchanged, checked by
+            the ETag, size and modification time from the backend's
+            ``stat``. See :func:`configure_load_cache`. Defaults to False.
+        lazy_io (bool): Whether to hand the handler a file object that reads
+            the file lazily with ranged requests (see :func:`open`) instead
+            of the downloaded file, so that handlers that only read part of
+            a file, e.g. of a tar archive, download only that part.
+            Defaults to False.
+        mmap (bool): Whether to memory-map a local file instead of reading
+            it, so that nothing is copied and only the touched pages are
+            read: ".npy" files load as a read-only ``np.memmap`` and ".pt"
+            files with ``torch.load(mmap=True)``. Other backends fall back
+            to a normal read with a warning. Defaults to False.
 
     Examples:
         >>> load('/path/of/your/file')  # file is storaged in disk
@@ -977,6 +1490,53 @@ def load(  # noqa: C901
                 backend_key=backend_key,
                 enable_singleton=True,
             )
+            if cache and hasattr(file_backend, "stat"):
+                stat = file_backend.stat(file)
+                key = (file, file_format, repr(sorted(kwargs.items())), file_backend)
+                validator = (stat["etag"], stat["size"], stat["mtime"])
+                obj = _load_cache.get(key, validator, default=_MISSING)
+                if obj is _MISSING:
+                    obj = load(
+                        file,
+                        file_format,
+                        fast_backend=fast_backend,
+                        backend_args=backend_args,
+                        backend_key=backend_key,
+                        share_object=share_object,
+                        lazy_io=lazy_io,
+                        mmap=mmap,
+                        **kwargs,
+                    )
+                    obj = _load_cache.put(key, validator, obj, nbytes=object_nbytes(obj, stat["size"]))
+                return obj
+            if share_object:
+                key = (file_backend, file, file_format, fast_backend, lazy_io, mmap, repr(sorted(kwargs.items())))
+                return _load_flight.do(
+                    key,
+                    lambda: load(
+                        file,
+                        file_format,
+                        fast_backend=fast_backend,
+                        backend_args=backend_args,
+                        backend_key=backend_key,
+                        lazy_io=lazy_io,
+                        mmap=mmap,
+                        **kwargs,
+                    ),
+                )
+            if mmap and not handler.str_like:
+                if isinstance(file_backend, LocalBackend):
+                    return handler.load_from_mmap(file, **kwargs)
+                warnings.warn(
+                    f"mmap is only supported by local files, type {type(file_backend)} fallback to normal get",
+                    stacklevel=2,
+                )
+            if lazy_io:
+                with open(file, backend_args=backend_args, backend_key=backend_key) as f:
+                    if handler.str_like:
+                        with TextIOWrapper(f, encoding="utf-8") as text:
+                            return handler.load_from_fileobj(text, **kwargs)
+                    return handler.load_from_fileobj(f, **kwargs)
 
         if handler.str_like:
             with StringIO(file_backend.get_text(file)) as f:
@@ -984,7 +1544,8 @@ def load(  # noqa: C901
         else:
             if fast_backend:
                 if hasattr(file_backend, "fast_get"):
-                    with BytesIO(file_backend.fast_get(file)) as f:
+                    # Hand the shared memory the parts were downloaded into straight to the handler.
+                    with file_backend.fast_get(file, zero_copy=True) as buffer, BufferReader(buffer) as f:
                         obj = handler.load_from_fileobj(f, **kwargs)
                 else:
                     warnings.warn(
@@ -994,7 +1555,8 @@ def load(  # noqa: C901
                     with BytesIO(file_backend.get(file)) as f:
                         obj = handler.load_from_fileobj(f, **kwargs)
             else:
-                with BytesIO(file_backend.get(file)) as f:
+                data = _get_flight.do((file_backend, file), lambda: file_backend.get(file))
+                with BytesIO(data) as f:
                     obj = handler.load_from_fileobj(f, **kwargs)
     elif hasattr(file, "read"):
         obj = handler.load_from_fileobj(file, **kwargs)
@@ -1084,6 +1646,10 @@ def dump(  # noqa: C901
             with StringIO() as f:
                 handler.dump_to_fileobj(obj, f, **kwargs)
                 file_backend.put_text(f.getvalue(), file)
+        elif handler.sequential_dump and not fast_backend and hasattr(file_backend, "open_write"):
+            # The upload runs while the handler serializes, holding only a few parts in memory.
+            with file_backend.open_write(file) as f:
+                handler.dump_to_fileobj(obj, f, **kwargs)
         else:
             with BytesIO() as f:
                 handler.dump_to_fileobj(obj, f, **kwargs)
@@ -0,0 +1,144 @@
+import copy
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Optional
+
+import numpy as np
+
+
+def object_nbytes(obj: Any, default: int) -> int:
+    """Estimate the memory held by a decoded object.
+
+    Counts the buffers of numpy arrays and torch tensors, also inside dicts,
+    lists and tuples such as state dicts; tensors that share a storage are
+    counted once. Other objects are not measured, ``default`` (e.g. the size
+    of the file the object was decoded from) is returned if it is larger.
+
+    Args:
+        obj (Any): The decoded object.
+        default (int): The lower bound of the estimate.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    storages = set()
+    nbytes = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, np.ndarray):
+            nbytes += item.nbytes
+        elif hasattr(item, "untyped_storage"):  # torch.Tensor, without importing torch
+            storage = item.untyped_storage()
+            if storage.data_ptr() not in storages:
+                storages.add(storage.data_ptr())
+                nbytes += storage.nbytes()
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return max(nbytes, default)
+
+
+class ObjectCache:
+    """An LRU cache of decoded objects, bounded by their estimated memory.
+
+    Every entry is stored with a validator of the file it was decoded from,
+    e.g. its ETag, size and modification time, and is only returned while
+    the validator still matches. Entries are charged with the ``nbytes``
+    they are put with, see :func:`object_nbytes`, and the least recently
+    used ones are evicted beyond ``max_bytes``.
+
+    With ``copy=True``, every caller receives a deep copy, so the cached
+    object can never be modified by a caller. With ``copy=False``, all
+    callers share one object; numpy arrays are made read-only, other objects
+    must be treated as read-only by convention.
+
+    Args:
+        max_bytes (int): Total size of the cached objects.
+            Defaults to 256 MB.
+        copy (bool): Whether to return deep copies of the cached objects.
+            Defaults to True.
+
+    Examples:
+        >>> cache = ObjectCache(max_bytes=64 * 1024 * 1024)
+        >>> cache.put(('s3://bucket/vocab.json', 'json'), ('etag', 1024), vocab, nbytes=1024)
+        >>> cache.get(('s3://bucket/vocab.json', 'json'), ('etag', 1024))
+        {'hello': 0, 'world': 1}
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, copy: bool = True):
+        self.max_bytes = max_bytes
+        self.copy = copy
+        self._entries: OrderedDict[Hashable, tuple[Hashable, Any, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _share(self, obj: Any) -> Any:
+        return copy.deepcopy(obj) if self.copy else obj
+
+    def get(self, key: Hashable, validator: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """Return the object of ``key`` if it was cached with ``validator``, else ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != validator:
+                if entry is not None:
+                    # The file changed.
+                    del self._entries[key]
+                    self._size -= entry[2]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._share(entry[1])
+
+    def put(self, key: Hashable, validator: Hashable, obj: Any, nbytes: int) -> Any:
+        """Cache ``obj`` and return it as a caller should receive it.
+
+        Objects larger than ``max_bytes`` are not cached.
+        """
+        if not self.copy and isinstance(obj, np.ndarray):
+            obj.flags.writeable = False
+        if nbytes > self.max_bytes:
+            return obj
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[2]
+            self._entries[key] = (validator, obj, nbytes)
+            self._size += nbytes
+        self.evict()
+        return self._share(obj)
+
+    def evict(self) -> None:
+        """Evict the least recently used entries until the cache fits ``max_bytes``."""
+        with self._lock:
+            while self._size > self.max_bytes:
+                _, (_, _, size) = self._entries.popitem(last=False)
+                self._size -= size
+                self.evictions += 1
+
+    def invalidate(self, uri: Optional[str] = None) -> None:
+        """Drop the entries whose key starts with ``uri``, or all entries."""
+        with self._lock:
+            if uri is None:
+                self._entries.clear()
+                self._size = 0
+                return
+            for key in [key for key in self._entries if key == uri or (isinstance(key, tuple) and key[0] == uri)]:
+                self._size -= self._entries.pop(key)[2]
+
+    def stats(self) -> dict[str, int]:
+        """Return the hit, miss and eviction counters, the number of entries and their total size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size": self._size,
+            }
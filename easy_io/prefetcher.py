@@ -0,0 +1,223 @@
+import queue
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from easy_io import log
+from easy_io.interface import _decode, _file_format, get
+
+_DONE = object()
+
+
+class Prefetcher:
+    """Fetches upcoming files in the background and hands them out in order.
+
+    A feeder thread takes paths from ``filepaths``, which may be a lazy
+    stream, and fetches them on a thread pool through the usual backends
+    while the caller works on earlier files. At most ``depth`` files are
+    fetched ahead of the caller, and no new fetch is started while the
+    fetched but not yet consumed files hold more than ``max_bytes``.
+
+    Iterating yields ``(path, data)`` in the order of ``filepaths``, where
+    ``data`` is the raw bytes or, with ``decode=True``, the decoded object.
+    The error of a failed fetch is raised when its file is reached; the
+    caller may catch it and continue with ``next``. :meth:`stats` reports how
+    often and how long the caller stalled waiting for a file and the fetch
+    latency, which tells whether ``depth`` is large enough.
+
+    Args:
+        filepaths (Iterable[str or Path]): Paths to fetch, in consumption
+            order.
+        depth (int): Number of files fetched ahead. Can be changed while
+            running by assigning :attr:`depth`. Defaults to 8.
+        max_bytes (int, optional): Budget of fetched but not yet consumed
+            file bytes. Defaults to 1 GB.
+        decode (bool): Whether to decode the files with the handler of
+            ``file_format`` or of their extension. Defaults to False.
+        file_format (str, optional): Format of all files when decoding.
+        backend_args (dict, optional): Arguments to instantiate the
+            corresponding backend. Defaults to None.
+        backend_key (str, optional): The key to get the backend from register.
+        max_workers (int, optional): Number of concurrent fetches. Defaults
+            to ``min(depth, 16)``.
+        decode_executor (Executor, optional): Executor to decode in, e.g. a
+            ``ProcessPoolExecutor``. Defaults to the fetching threads.
+        **kwargs: Arguments of the format handler.
+
+    Examples:
+        >>> shards = (f's3://bucket/shards/{i:05d}.tar' for i in range(1000))
+        >>> with Prefetcher(shards, depth=4, max_bytes=8 * 1024**3) as prefetcher:
+        ...     for path, data in prefetcher:
+        ...         train_on(data)
+        >>> prefetcher.stats()
+        {'fetched': 1000, 'consumed': 1000, 'stalls': 3, 'stall_time': 1.2, ...}
+    """
+
+    def __init__(
+        self,
+        filepaths: Iterable[Union[str, Path]],
+        depth: int = 8,
+        max_bytes: Optional[int] = 1024**3,
+        decode: bool = False,
+        file_format: Optional[str] = None,
+        backend_args: Optional[dict] = None,
+        backend_key: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        decode_executor: Optional[Executor] = None,
+        **kwargs,
+    ):
+        assert depth > 0
+        self.max_bytes = max_bytes
+        self.decode = decode
+        self.file_format = file_format
+        self.backend_args = backend_args
+        self.backend_key = backend_key
+        self.decode_executor = decode_executor
+        self.kwargs = kwargs
+
+        self._depth = depth
+        self._cond = threading.Condition()
+        self._ready: queue.Queue = queue.Queue()
+        self._outstanding = 0  # fetches submitted and not yet consumed
+        self._buffered_bytes = 0  # bytes of finished fetches not yet consumed
+        self._closed = False
+        self.fetched = 0
+        self.consumed = 0
+        self.stalls = 0
+        self.stall_time = 0.0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+        self._executor = ThreadPoolExecutor(max_workers or min(depth, 16), thread_name_prefix="easy_io_prefetch")
+        self._feeder = threading.Thread(
+            target=self._feed, args=(iter(filepaths),), name="easy_io_prefetch_feeder", daemon=True
+        )
+        self._feeder.start()
+
+    @property
+    def depth(self) -> int:
+        """int: Number of files fetched ahead."""
+        return self._depth
+
+    @depth.setter
+    def depth(self, depth: int) -> None:
+        assert depth > 0
+        with self._cond:
+            self._depth = depth
+            self._cond.notify_all()
+
+    def _can_submit(self) -> bool:
+        if self._closed:
+            return True
+        if self._outstanding >= self._depth:
+            return False
+        # Always allow one file, however large.
+        return self.max_bytes is None or self._buffered_bytes < self.max_bytes or self._outstanding == 0
+
+    def _feed(self, filepaths: Iterable[Union[str, Path]]) -> None:
+        try:
+            for filepath in filepaths:
+                with self._cond:
+                    self._cond.wait_for(self._can_submit)
+                    if self._closed:
+                        return
+                    self._outstanding += 1
+                    self._ready.put((str(filepath), self._executor.submit(self._fetch, filepath)))
+        except Exception as e:
+            log.error(f"Prefetcher stopped reading paths: {e}", rank0_only=False)
+            self._ready.put((None, e))
+        self._ready.put(_DONE)
+
+    def _fetch(self, filepath: Union[str, Path]) -> tuple[Any, int]:
+        start = time.monotonic()
+        data = get(filepath, backend_args=self.backend_args, backend_key=self.backend_key)
+        result = data
+        if self.decode:
+            file_format = _file_format(filepath, self.file_format)
+            if self.decode_executor is None:
+                result = _decode(file_format, data, self.kwargs)
+            else:
+                result = self.decode_executor.submit(_decode, file_format, data, self.kwargs).result()
+        latency = time.monotonic() - start
+        with self._cond:
+            self._buffered_bytes += len(data)
+            self.fetched += 1
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+        return result, len(data)
+
+    def __iter__(self) -> "Prefetcher":
+        return self
+
+    def __next__(self) -> tuple[str, Any]:
+        if self._closed:
+            raise StopIteration
+        start = time.monotonic()
+        try:
+            entry = self._ready.get_nowait()
+            stalled = False
+        except queue.Empty:
+            entry = self._ready.get()
+            stalled = True
+        if entry is _DONE:
+            self._ready.put(_DONE)
+            raise StopIteration
+        filepath, future = entry
+        if filepath is None:
+            # The path iterable failed.
+            raise future
+        stalled = stalled or not future.done()
+
+        nbytes = 0
+        try:
+            result, nbytes = future.result()
+        finally:
+            with self._cond:
+                self._outstanding -= 1
+                self._buffered_bytes -= nbytes
+                self.consumed += 1
+                if stalled:
+                    self.stalls += 1
+                    self.stall_time += time.monotonic() - start
+                self._cond.notify_all()
+        return filepath, result
+
+    def close(self) -> None:
+        """Stop fetching and cancel the fetches that have not started."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        while True:
+            try:
+                entry = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not _DONE and entry[0] is not None:
+                entry[1].cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "Prefetcher":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return the fetch, consumption, stall and latency counters and the buffered files and bytes."""
+        with self._cond:
+            return {
+                "fetched": self.fetched,
+                "consumed": self.consumed,
+                "stalls": self.stalls,
+                "stall_time": self.stall_time,
+                "latency_mean": self._latency_total / self.fetched if self.fetched else 0.0,
+                "latency_max": self._latency_max,
+                "ahead": self._outstanding,
+                "buffered_bytes": self._buffered_bytes,
+                "depth": self._depth,
+            }
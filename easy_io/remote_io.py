@@ -0,0 +1,326 @@
+import inspect
+import io
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from easy_io import log
+
+BLOCK_SIZE = 4 * 1024 * 1024  # bytes per ranged read of ``RemoteReader``
+MAX_BLOCKS = 32  # blocks kept by the LRU cache of one reader
+MAX_READAHEAD = 8  # blocks prefetched ahead of sequential reads
+READAHEAD_THREADS = 32  # threads shared by the prefetches of all readers
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def _readahead_pool() -> ThreadPoolExecutor:
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            # Threads do not survive a fork, a child process needs its own pool.
+            _pool = ThreadPoolExecutor(READAHEAD_THREADS, thread_name_prefix="easy_io_readahead")
+            _pool_pid = os.getpid()
+        return _pool
+
+
+class RemoteReader(io.BufferedIOBase):
+    """A seekable, read-only file object over the ranged reads of a backend.
+
+    The file is read in blocks of ``block_size`` bytes with
+    ``backend.get_range``, and only the blocks that are touched are fetched,
+    so a handler that reads a header, an index or a few members of a large
+    file downloads only those. Blocks are kept in an LRU cache of
+    ``max_blocks`` entries.
+
+    Read-ahead adapts to the access pattern: every read that continues in the
+    next block doubles the number of following blocks fetched in the
+    background, up to ``max_readahead``, and a seek elsewhere resets it. A
+    read that spans several missing blocks fetches them concurrently.
+
+    All blocks are read from one version of the file: backends whose
+    ``get_range`` takes an ``etag`` (S3 and HTTP) check it on every read,
+    so a ``ConnectionError`` is raised instead of mixing the blocks of an
+    old and a new version when the file is overwritten while it is read.
+
+    Args:
+        backend (BaseStorageBackend): Backend with ``get_range`` and ``stat``.
+        filepath (str or Path): Path of the file.
+        size (int, optional): Size of the file. Read with ``backend.stat``
+            if not given.
+        etag (str, optional): ETag of the version to read. Read with
+            ``backend.stat`` along with ``size`` if not given.
+        block_size (int): Bytes per ranged read. Defaults to 4 MB.
+        max_blocks (int): Blocks kept in the cache. Defaults to 32.
+        max_readahead (int): Most blocks prefetched ahead. Defaults to 8.
+
+    Examples:
+        >>> with RemoteReader(backend, 's3://bucket/shard.tar') as f:
+        ...     with tarfile.open(fileobj=f) as tar:
+        ...         data = tar.extractfile('sample_0042.jpg').read()
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        filepath: Union[str, Path],
+        size: Optional[int] = None,
+        etag: Optional[str] = None,
+        block_size: int = BLOCK_SIZE,
+        max_blocks: int = MAX_BLOCKS,
+        max_readahead: int = MAX_READAHEAD,
+    ):
+        super().__init__()
+        self.backend = backend
+        self.name = str(filepath)
+        if size is None:
+            stat = backend.stat(filepath)
+            size, etag = stat["size"], etag or stat["etag"]
+        self.size = size
+        self.etag = etag if "etag" in inspect.signature(backend.get_range).parameters else None
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        # Prefetched blocks must not evict the ones being read.
+        self.max_readahead = max(0, min(max_readahead, max_blocks // 2))
+        self._pos = 0
+        self._lock = threading.Lock()
+        self._blocks: OrderedDict[int, bytes] = OrderedDict()
+        self._pending: dict[int, Future] = {}
+        self._last_block = -1
+        self._readahead = 0
+        self.requests = 0
+        self.bytes_fetched = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def mode(self) -> str:
+        return "rb"
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        self._check_open()
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._check_open()
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence}, should be 0, 1 or 2)")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def _fetch(self, index: int) -> bytes:
+        try:
+            if self.etag:
+                data = self.backend.get_range(self.name, index * self.block_size, self.block_size, etag=self.etag)
+            else:
+                data = self.backend.get_range(self.name, index * self.block_size, self.block_size)
+        finally:
+            with self._lock:
+                self._pending.pop(index, None)
+        with self._lock:
+            self.requests += 1
+            self.bytes_fetched += len(data)
+            if not self.closed:
+                self._blocks[index] = data
+                while len(self._blocks) > self.max_blocks:
+                    self._blocks.popitem(last=False)
+        return data
+
+    def _get_blocks(self, first: int, last: int) -> list[bytes]:
+        """Return the blocks ``first`` to ``last``, fetching the missing ones concurrently."""
+        blocks: dict[int, bytes] = {}
+        futures: dict[int, Future] = {}
+        missing = []
+        with self._lock:
+            for index in range(first, last + 1):
+                if index in self._blocks:
+                    self._blocks.move_to_end(index)
+                    blocks[index] = self._blocks[index]
+                    self.hits += 1
+                elif index in self._pending:
+                    futures[index] = self._pending[index]
+                    self.hits += 1
+                else:
+                    missing.append(index)
+                    self.misses += 1
+            # The first missing block is fetched by the calling thread.
+            for index in missing[1:]:
+                futures[index] = self._pending[index] = _readahead_pool().submit(self._fetch, index)
+        if missing:
+            blocks[missing[0]] = self._fetch(missing[0])
+        for index, future in futures.items():
+            blocks[index] = future.result()
+        return [blocks[index] for index in range(first, last + 1)]
+
+    def _read_ahead(self, first: int, last: int) -> None:
+        if first == self._last_block + 1:
+            self._readahead = min(max(1, 2 * self._readahead), self.max_readahead)
+        elif first != self._last_block:
+            self._readahead = 0
+        self._last_block = last
+        num_blocks = -(-self.size // self.block_size)
+        with self._lock:
+            for index in range(last + 1, min(last + 1 + self._readahead, num_blocks)):
+                if index not in self._blocks and index not in self._pending:
+                    self._pending[index] = _readahead_pool().submit(self._fetch, index)
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        self._check_open()
+        end = self.size if size is None or size < 0 else min(self._pos + size, self.size)
+        if end <= self._pos:
+            return b""
+        first, last = self._pos // self.block_size, (end - 1) // self.block_size
+        blocks = self._get_blocks(first, last)
+        self._read_ahead(first, last)
+        start, length = self._pos - first * self.block_size, end - self._pos
+        data = blocks[0] if len(blocks) == 1 else b"".join(blocks)
+        self._pos = end
+        return data[start : start + length]
+
+    read1 = read
+
+    def readinto(self, b) -> int:
+        out = memoryview(b).cast("B")
+        data = self.read(len(out))
+        out[: len(data)] = data
+        return len(data)
+
+    readinto1 = readinto
+
+    def peek(self, size: int = 0) -> bytes:
+        """Return the rest of the current block without moving the position."""
+        self._check_open()
+        if self._pos >= self.size:
+            return b""
+        index = self._pos // self.block_size
+        return self._get_blocks(index, index)[0][self._pos - index * self.block_size :]
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._blocks.clear()
+        super().close()
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of ranged reads, the fetched bytes and the block cache hits and misses."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "bytes_fetched": self.bytes_fetched,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class BufferedWriter(io.BytesIO):
+    """A write-only file object that writes its data with ``backend.put`` when closed.
+
+    For backends without streaming writes. Nothing is written if the
+    ``with`` block raises, or if the writer is garbage collected without
+    being closed.
+
+    Args:
+        backend (BaseStorageBackend): Backend with ``put``.
+        filepath (str or Path): Path to write data.
+    """
+
+    def __init__(self, backend: Any, filepath: Union[str, Path]):
+        super().__init__()
+        self.backend = backend
+        self.name = str(filepath)
+
+    @property
+    def mode(self) -> str:
+        return "wb"
+
+    def close(self) -> None:
+        if not self.closed:
+            self.backend.put(self.getvalue(), self.name)
+        super().close()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            super().close()
+        else:
+            self.close()
+
+    def __del__(self) -> None:
+        # ``IOBase.__del__`` would close, i.e. write, an abandoned writer; its data may be partial.
+        if not self.closed:
+            log.warning(f"{self.name} was not closed, discarding its data", rank0_only=False)
+            super().close()
+
+
+class TempFileWriter(io.FileIO):
+    """A write-only file object that spools to a local temporary file and uploads it when closed.
+
+    For backends whose own file objects commit their data however they are
+    closed. As with :class:`BufferedWriter`, nothing is uploaded if the
+    ``with`` block raises, or if the writer is garbage collected without
+    being closed.
+
+    Args:
+        upload (Callable[[str], None]): Uploads the local file at the given path.
+        filepath (str or Path): Path to write data.
+    """
+
+    def __init__(self, upload: Callable[[str], None], filepath: Union[str, Path]):
+        fd, self.local_path = tempfile.mkstemp(prefix="easy_io_write_")
+        super().__init__(fd, "wb")
+        self.upload = upload
+        self.name = str(filepath)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            super().close()
+            self.upload(self.local_path)
+        finally:
+            os.remove(self.local_path)
+
+    def discard(self) -> None:
+        """Close the writer without uploading its data."""
+        if not self.closed:
+            super().close()
+            os.remove(self.local_path)
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+    def __del__(self) -> None:
+        # ``IOBase.__del__`` would close, i.e. upload, an abandoned writer; its data may be partial.
+        if not self.closed:
+            log.warning(f"{self.name} was not closed, discarding its data", rank0_only=False)
+            self.discard()
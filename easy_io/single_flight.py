@@ -0,0 +1,76 @@
+import threading
+from collections.abc import Hashable
+from typing import Any, Callable, Optional
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Runs concurrent calls with the same key only once.
+
+    The first caller of a key runs the function; callers that arrive while
+    it is still running wait for it and receive the same result, or the same
+    exception. Nothing is cached: a call after the first one has finished
+    runs again.
+
+    Examples:
+        >>> flight = SingleFlight()
+        >>> # in many threads at once
+        >>> data = flight.do(('s3', 's3://bucket/file'), lambda: backend.get('s3://bucket/file'))
+        >>> flight.stats()
+        {'calls': 8, 'coalesced': 7, 'in_flight': 0}
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return ``fn()``, or the result of the call of ``key`` that is already running.
+
+        Args:
+            key (Hashable): Identifies calls that can share their result.
+            fn (Callable): Computes the result.
+
+        Returns:
+            The result of ``fn``.
+
+        Raises:
+            Exception: The exception of ``fn``, in every caller that shared it.
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of calls, how many of them shared a running call, and the running calls."""
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._calls)}